@@ -1,9 +1,18 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from neo4j import GraphDatabase
 import os
 import logging
+from datetime import date
+from functools import wraps
 from flask_cors import CORS
 from urllib.parse import unquote
+from doctracer.graph import MemoryGraphStore, Neo4jGraphStore
+from doctracer.query_stats import QUERY_STATS, timed_run
+from doctracer.response_cache import ResponseCache
+from doctracer.search import LiveSearchIndex
+from doctracer.structure import (
+    changes_from_rows, diff_structures, simulate_final_structure, snapshot_for, structure_from_ministers,
+)
 
 # ---------------------------------------
 # Logging
@@ -15,7 +24,7 @@ logger = logging.getLogger(__name__)
 # Flask & CORS
 # ---------------------------------------
 app = Flask(__name__)
-CORS(app, origins=[
+CORS_ORIGINS = [
     "http://localhost:3000",
     "http://127.0.0.1:3000",
     "http://localhost:5173",
@@ -24,7 +33,8 @@ CORS(app, origins=[
     "http://localhost",
     "http://127.0.0.1:80",
     "http://127.0.0.1",
-])
+]
+CORS(app, origins=CORS_ORIGINS)
 
 # ---------------------------------------
 # Neo4j connection
@@ -34,6 +44,59 @@ USER = os.getenv("NEO4J_USER", "neo4j")
 PASSWORD = os.getenv("NEO4J_PASSWORD", "neo4j123")
 driver = GraphDatabase.driver(URI, auth=(USER, PASSWORD))
 
+# ---------------------------------------
+# Graph store
+# ---------------------------------------
+# DOCTRACER_GRAPH_STORE=memory serves the extracted JSON from an in-process
+# graph (no database needed), e.g. for tests and benchmarks.
+if os.getenv("DOCTRACER_GRAPH_STORE", "neo4j") == "memory":
+    store = MemoryGraphStore.from_json(
+        os.getenv("DOCTRACER_BASE_DIR", "output/base"),
+        os.getenv("DOCTRACER_AMENDMENT_DIR", "output/amendment"),
+    )
+else:
+    store = Neo4jGraphStore(driver)
+
+# ---------------------------------------
+# Response cache
+# ---------------------------------------
+# Whole-graph listings are cached per route and query string until the
+# loaders bump the graph's data version (DOCTRACER_CACHE_SIZE entries,
+# version re-read at most every DOCTRACER_CACHE_VERSION_TTL seconds).
+response_cache = ResponseCache(lambda: store.data_version())
+
+
+def cache_key(path: str, args) -> tuple:
+    """`response_cache` key of a GET: its path and (key, value) query pairs (shared with backend.asgi)."""
+    return (path, tuple(sorted(args)))
+
+
+def cached_response(view):
+    """Serve a GET view's 200 responses from `response_cache`."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = cache_key(request.path, request.args.items(multi=True))
+        uncached = []
+
+        def compute():
+            response = app.make_response(view(*args, **kwargs))
+            uncached.append(response)
+            return (response.get_data(), response.mimetype) if response.status_code == 200 else None
+
+        cached = response_cache.get(key, compute)
+        if uncached:
+            return uncached[0]
+        body, mimetype = cached
+        return Response(body, mimetype=mimetype)
+
+    return wrapper
+
+# ---------------------------------------
+# Search index
+# ---------------------------------------
+# Rebuilt in-process from the store after each load (data version change).
+search_index = LiveSearchIndex(lambda: store)
+
 # ---------------------------------------
 # Cypher helpers
 # ---------------------------------------
@@ -57,27 +120,76 @@ WHERE (g:BaseGazette OR g:AmendmentGazette) AND g.gazette_id = $gazette_id
 PARENT_PROP = "coalesce(properties(g)['parent_gazette_id'], null) AS parent_gazette_id"
 REL_PARENT_PROP = "coalesce(properties(related)['parent_gazette_id'], null) AS parent_gazette_id"
 
+COMPLETE_GRAPH_QUERY = f"""
+{GAZETTE_MATCH}
+{RELATED_GAZETTE_MATCH}
+RETURN g, r, related
+"""
+
+
+def complete_graph(records) -> dict:
+    """Nodes and links of /graph/complete from COMPLETE_GRAPH_QUERY records (sync or async driver)."""
+    nodes = []
+    links = []
+    node_ids = set()
+
+    for record in records:
+        # Main node
+        main_node = record['g']
+        if main_node and main_node['gazette_id'] not in node_ids:
+            node_type = 'base' if 'BaseGazette' in main_node.labels else 'amendment'
+            nodes.append({
+                'id': main_node['gazette_id'],
+                'label': f"{node_type.title()} {main_node['gazette_id']}",
+                'kind': node_type,
+                'published_date': main_node.get('published_date'),
+                'parent_gazette_id': main_node.get('parent_gazette_id'),
+            })
+            node_ids.add(main_node['gazette_id'])
+
+        # Related node
+        related_node = record['related']
+        if related_node and related_node['gazette_id'] not in node_ids:
+            node_type = 'base' if 'BaseGazette' in related_node.labels else 'amendment'
+            nodes.append({
+                'id': related_node['gazette_id'],
+                'label': f"{node_type.title()} {related_node['gazette_id']}",
+                'kind': node_type,
+                'published_date': related_node.get('published_date'),
+                'parent_gazette_id': related_node.get('parent_gazette_id'),
+            })
+            node_ids.add(related_node['gazette_id'])
+
+        # Relationship
+        relationship = record['r']
+        if relationship and related_node:
+            links.append({
+                'source': main_node['gazette_id'],
+                'target': related_node['gazette_id'],
+                'kind': relationship.type,
+            })
+
+    return {'nodes': nodes, 'links': links}
+
+
+def amendment_listing(amendments) -> list:
+    """Store amendment rows as /amendments returns them (with `has_detailed_changes`)."""
+    for amendment in amendments:
+        amendment['has_detailed_changes'] = amendment['change_count'] > 0
+    return amendments
+
 # ---------------------------------------
 # Routes
 # ---------------------------------------
 
 @app.route("/gazettes", methods=["GET"])
+@cached_response
 def get_gazettes():
     """Return ALL gazettes (base + amendment)."""
     logger.debug("Received request to get all gazettes")
-    with driver.session() as session:
-        result = session.run(f"""
-            {GAZETTE_MATCH}
-            RETURN g.gazette_id AS gazette_id,
-                   g.published_date AS published_date,
-                   {PARENT_PROP},
-                   coalesce(g.president, 'Unknown') AS president,
-                   labels(g) AS labels
-            ORDER BY published_date
-        """)
-        gazettes = [record.data() for record in result]
-        logger.debug(f"Fetched {len(gazettes)} gazettes from the database")
-        return jsonify(gazettes)
+    gazettes = store.gazettes()
+    logger.debug(f"Fetched {len(gazettes)} gazettes from the database")
+    return jsonify(gazettes)
 
 
 @app.route("/gazettes/<path:gazette_id>", methods=["GET"])
@@ -86,58 +198,31 @@ def get_gazette_details(gazette_id):
     decoded_gazette_id = unquote(gazette_id)
     logger.debug(f"Decoded gazette_id: {decoded_gazette_id}")
 
-    with driver.session() as session:
-        result = session.run(f"""
-            {ANY_GAZETTE_EQUAL_ID}
-            RETURN g.gazette_id AS gazette_id,
-                   g.published_date AS published_date,
-                   {PARENT_PROP},
-                   labels(g) AS labels
-            LIMIT 1
-        """, gazette_id=decoded_gazette_id)
-
-        gazette_details = [record.data() for record in result]
-        if not gazette_details:
-            logger.warning(f"No data found for gazette_id: {decoded_gazette_id}")
-        else:
-            logger.debug(f"Fetched gazette details: {gazette_details}")
-        return jsonify(gazette_details)
+    gazette = store.gazette(decoded_gazette_id)
+    gazette_details = [gazette] if gazette else []
+    if not gazette_details:
+        logger.warning(f"No data found for gazette_id: {decoded_gazette_id}")
+    else:
+        logger.debug(f"Fetched gazette details: {gazette_details}")
+    return jsonify(gazette_details)
 
 
 @app.route("/amendments", methods=["GET"])
+@cached_response
 def get_amendments():
     """Get all amendment gazettes with change tracking status"""
     logger.debug("Received request to get all amendments")
-    with driver.session() as session:
-        result = session.run("""
-            MATCH (a:AmendmentGazette)
-            OPTIONAL MATCH (a)<-[:AMENDED_BY]-(b:BaseGazette)
-            OPTIONAL MATCH (n)
-            WHERE (n:Function OR n:Department OR n:Law) 
-              AND (n.added_by = a.gazette_id OR n.removed_by = a.gazette_id)
-            WITH a, b, count(n) AS change_count
-            RETURN a.gazette_id AS gazette_id,
-                   a.published_date AS published_date,
-                   b.gazette_id AS parent_gazette_id,
-                   coalesce(a.president, b.president, 'Unknown') AS president,
-                   change_count
-            ORDER BY a.published_date
-        """)
-        amendments = []
-        for record in result:
-            amendment = record.data()
-            amendment['has_detailed_changes'] = amendment['change_count'] > 0
-            amendments.append(amendment)
-        logger.debug(f"Fetched {len(amendments)} amendments from the database")
-        logger.debug(f"Amendments: {amendments}")
-        return jsonify(amendments)
+    amendments = amendment_listing(store.amendments())
+    logger.debug(f"Fetched {len(amendments)} amendments from the database")
+    logger.debug(f"Amendments: {amendments}")
+    return jsonify(amendments)
 
 
 @app.route("/debug/amendments-raw", methods=["GET"])
 def debug_amendments():
     """Debug endpoint to see raw amendment nodes"""
     with driver.session() as session:
-        result = session.run("""
+        result = timed_run(session, "debug.amendments_raw", """
             MATCH (a:AmendmentGazette)
             RETURN a.gazette_id AS gazette_id, a.published_date AS published_date, properties(a) AS props
         """)
@@ -146,11 +231,12 @@ def debug_amendments():
 
 
 @app.route("/ministries", methods=["GET"])
+@cached_response
 def get_ministries():
     """Get all unique ministries from the database"""
     logger.debug("Received request to get all ministries")
     with driver.session() as session:
-        result = session.run("""
+        result = timed_run(session, "ministries", """
             MATCH (m:Minister)
             RETURN DISTINCT m.name AS name
             ORDER BY m.name
@@ -167,7 +253,7 @@ def get_gazettes_by_minister(minister_name):
     logger.debug(f"Received request to get gazettes for minister: {decoded_minister}")
     
     with driver.session() as session:
-        result = session.run("""
+        result = timed_run(session, "ministry_gazettes", """
             MATCH (m:Minister {name: $minister_name})
             MATCH (m)-[:MANAGES]->(d:Department)
             MATCH (d)<-[:HAS_DEPARTMENT]-(g:Gazette)
@@ -194,7 +280,7 @@ def get_amendment_graph(amendment_id):
     logger.debug(f"Getting graph for amendment: {decoded_amendment_id}")
 
     with driver.session() as session:
-        result = session.run("""
+        result = timed_run(session, "amendment_graph", """
             MATCH (a:AmendmentGazette {gazette_id: $amendment_id})
             OPTIONAL MATCH (a)-[r]-(related)
             RETURN a, r, related
@@ -242,58 +328,14 @@ def get_amendment_graph(amendment_id):
 
 
 @app.route("/graph/complete", methods=["GET"])
+@cached_response
 def get_complete_graph():
     """Get complete graph showing all gazettes and their relationships"""
     logger.debug("Getting complete graph")
 
     with driver.session() as session:
-        result = session.run(f"""
-            {GAZETTE_MATCH}
-            {RELATED_GAZETTE_MATCH}
-            RETURN g, r, related
-        """)
-
-        nodes = []
-        links = []
-        node_ids = set()
-
-        for record in result:
-            # Main node
-            main_node = record['g']
-            if main_node and main_node['gazette_id'] not in node_ids:
-                node_type = 'base' if 'BaseGazette' in main_node.labels else 'amendment'
-                nodes.append({
-                    'id': main_node['gazette_id'],
-                    'label': f"{node_type.title()} {main_node['gazette_id']}",
-                    'kind': node_type,
-                    'published_date': main_node.get('published_date'),
-                    'parent_gazette_id': main_node.get('parent_gazette_id'),
-                })
-                node_ids.add(main_node['gazette_id'])
-
-            # Related node
-            related_node = record['related']
-            if related_node and related_node['gazette_id'] not in node_ids:
-                node_type = 'base' if 'BaseGazette' in related_node.labels else 'amendment'
-                nodes.append({
-                    'id': related_node['gazette_id'],
-                    'label': f"{node_type.title()} {related_node['gazette_id']}",
-                    'kind': node_type,
-                    'published_date': related_node.get('published_date'),
-                    'parent_gazette_id': related_node.get('parent_gazette_id'),
-                })
-                node_ids.add(related_node['gazette_id'])
-
-            # Relationship
-            relationship = record['r']
-            if relationship and related_node:
-                links.append({
-                    'source': main_node['gazette_id'],
-                    'target': related_node['gazette_id'],
-                    'kind': relationship.type,
-                })
-
-        return jsonify({'nodes': nodes, 'links': links})
+        result = timed_run(session, "graph_complete", COMPLETE_GRAPH_QUERY)
+        return jsonify(complete_graph(result))
 
 
 @app.route("/gazettes/<path:gazette_id>/details", methods=["GET"])
@@ -337,51 +379,18 @@ def get_gazette_full_details(gazette_id):
 
 @app.route("/search", methods=["GET"])
 def search_gazettes():
-    """Search gazettes by various criteria (case-insensitive, both labels)."""
+    """
+    Search gazettes by id, published date, or the names of their ministers,
+    departments, functions and laws (trigram index: prefix and typo tolerant).
+
+    Returns gazettes ranked by their best match, each with `score` and the
+    `matches` that found it; without `q`, the 50 most recent gazettes.
+    """
     query = request.args.get('q', '')
     gazette_type = request.args.get('type', 'all')  # all, base, amendment
 
     logger.debug(f"Searching for: {query}, type: {gazette_type}")
-
-    with driver.session() as session:
-        if gazette_type == 'base':
-            label_pred = "g:BaseGazette"
-        elif gazette_type == 'amendment':
-            label_pred = "g:AmendmentGazette"
-        else:
-            label_pred = "g:BaseGazette OR g:AmendmentGazette"
-
-        if query:
-            cypher = f"""
-                MATCH (g)
-                WHERE ({label_pred})
-                  AND (
-                        toLower(g.gazette_id) CONTAINS toLower($query)
-                     OR toString(g.published_date) CONTAINS $query
-                  )
-                RETURN g.gazette_id AS gazette_id,
-                       g.published_date AS published_date,
-                       {PARENT_PROP},
-                       labels(g) AS labels
-                ORDER BY g.published_date DESC
-                LIMIT 50
-            """
-            result = session.run(cypher, query=query)
-        else:
-            cypher = f"""
-                MATCH (g)
-                WHERE ({label_pred})
-                RETURN g.gazette_id AS gazette_id,
-                       g.published_date AS published_date,
-                       {PARENT_PROP},
-                       labels(g) AS labels
-                ORDER BY g.published_date DESC
-                LIMIT 50
-            """
-            result = session.run(cypher)
-
-        gazettes = [record.data() for record in result]
-        return jsonify(gazettes)
+    return jsonify(search_index.search(query, gazette_type, limit=50))
 
 
 @app.route("/debug/nodes", methods=["GET"])
@@ -389,7 +398,7 @@ def debug_nodes():
     """Debug endpoint to see all nodes in the database"""
     logger.debug("Debug: Getting all nodes")
     with driver.session() as session:
-        result = session.run("""
+        result = timed_run(session, "debug.nodes", """
             MATCH (n)
             RETURN labels(n) AS labels, 
                    keys(n) AS properties,
@@ -409,7 +418,7 @@ def get_dashboard_summary():
     logger.debug("Getting dashboard summary")
     with driver.session() as session:
         # Counts by label
-        result = session.run("""
+        result = timed_run(session, "dashboard.counts", """
             MATCH (g)
             WHERE g:BaseGazette OR g:AmendmentGazette
             WITH labels(g) as nodeLabels, count(g) as count
@@ -421,7 +430,7 @@ def get_dashboard_summary():
         counts = {record['label']: record['total'] for record in result}
 
         # Recent (distinct) with president info
-        recent_result = session.run(f"""
+        recent_result = timed_run(session, "dashboard.recent", f"""
             MATCH (g)
             WHERE g:BaseGazette OR g:AmendmentGazette
             OPTIONAL MATCH (g)<-[:AMENDED_BY]-(b:BaseGazette)
@@ -445,131 +454,50 @@ def get_dashboard_summary():
 @app.route("/gazettes/<path:gazette_id>/structure", methods=["GET"])
 def get_gazette_structure(gazette_id):
     """
-    Get government structure for a specific *base* gazette.
-    Now robust to label variants: BaseMinister/Minister, BaseDepartment/Department, BaseLaw/Law.
+    Get the effective government structure of a gazette: a base gazette's own
+    structure, or an amendment applied to its base. Served from the stored
+    snapshot (computed on first read if missing).
+    Robust to label variants: BaseMinister/Minister, BaseDepartment/Department, BaseLaw/Law.
     """
     try:
         decoded_gazette_id = unquote(gazette_id)
         logger.debug(f"Getting structure for gazette: {decoded_gazette_id}")
 
-        with driver.session() as session:
-            # Check base gazette existence
-            check_result = session.run("""
-                MATCH (g:BaseGazette {gazette_id: $gazette_id})
-                RETURN g
-            """, gazette_id=decoded_gazette_id)
-
-            gazette_exists = check_result.single()
-            if not gazette_exists:
-                logger.warning(f"Gazette {decoded_gazette_id} not found")
-                return jsonify({
-                    'gazette_id': decoded_gazette_id,
-                    'ministers': [],
-                    'departments': [],
-                    'laws': [],
-                    'functions': [],
-                    'raw_entities': [],
-                    'error': 'Gazette not found or is not a BaseGazette'
-                })
-
-            # Ministers (BaseMinister OR Minister)
-            result = session.run("""
-                MATCH (g:BaseGazette {gazette_id: $gazette_id})
-                MATCH (g)-[:HAS_MINISTER]->(m)
-                WHERE m:BaseMinister OR m:Minister
-                RETURN DISTINCT m
-            """, gazette_id=decoded_gazette_id)
-
-            # Departments per minister (BaseDepartment OR Department)
-            dept_result = session.run("""
-                MATCH (g:BaseGazette {gazette_id: $gazette_id})
-                MATCH (g)-[:HAS_MINISTER]->(m)
-                WHERE m:BaseMinister OR m:Minister
-                OPTIONAL MATCH (m)-[:OVERSEES_DEPARTMENT]->(d)
-                WHERE d:BaseDepartment OR d:Department
-                RETURN m.name as minister_name, collect(DISTINCT d.name) as departments
-            """, gazette_id=decoded_gazette_id)
-
-            # Laws per minister (BaseLaw OR Law)
-            law_result = session.run("""
-                MATCH (g:BaseGazette {gazette_id: $gazette_id})
-                MATCH (g)-[:HAS_MINISTER]->(m)
-                WHERE m:BaseMinister OR m:Minister
-                OPTIONAL MATCH (m)-[:RESPONSIBLE_FOR_LAW]->(l)
-                WHERE l:BaseLaw OR l:Law
-                RETURN m.name as minister_name, collect(DISTINCT l.name) as laws
-            """, gazette_id=decoded_gazette_id)
-
-            # Functions per minister (BaseFunction OR Function)
-            func_result = session.run("""
-                MATCH (g:BaseGazette {gazette_id: $gazette_id})
-                MATCH (g)-[:HAS_MINISTER]->(m)
-                WHERE m:BaseMinister OR m:Minister
-                OPTIONAL MATCH (m)-[:HAS_FUNCTION]->(f)
-                WHERE f:BaseFunction OR f:Function
-                RETURN m.name as minister_name, collect(DISTINCT f.name) as functions
-            """, gazette_id=decoded_gazette_id)
-
-            structure = {
+        snapshot = snapshot_for(store, decoded_gazette_id)
+        if snapshot is None:
+            logger.warning(f"Gazette {decoded_gazette_id} not found")
+            return jsonify({
                 'gazette_id': decoded_gazette_id,
                 'ministers': [],
                 'departments': [],
                 'laws': [],
                 'functions': [],
-                'raw_entities': []
-            }
+                'raw_entities': [],
+                'error': 'Gazette not found'
+            })
+
+        snapshot_structure = snapshot['structure']
+        ministers_map = {}
+        for minister in snapshot_structure['ministers']:
+            minister_name = minister['name'] or 'Unknown'
+            ministers_map[minister_name] = {**minister, 'name': minister_name, 'number': minister['number'] or 'Unknown'}
+
+        structure = {
+            'gazette_id': decoded_gazette_id,
+            'ministers': list(ministers_map.values()),
+            'departments': snapshot_structure['departments'],
+            'laws': snapshot_structure['laws'],
+            'functions': snapshot_structure['functions'],
+            'raw_entities': []
+        }
 
-            ministers_map = {}
-            departments_set = set()
-            laws_set = set()
-            functions_set = set()
-
-            for record in result:
-                minister = record['m']
-                if minister:
-                    minister_name = minister.get('name', 'Unknown')
-                    minister_number = minister.get('number', 'Unknown')
-                    ministers_map[minister_name] = {
-                        'name': minister_name,
-                        'number': minister_number,
-                        'departments': [],
-                        'laws': [],
-                        'functions': []
-                    }
-
-            for record in dept_result:
-                minister_name = record['minister_name']
-                departments = record['departments'] or []
-                if minister_name in ministers_map:
-                    ministers_map[minister_name]['departments'] = [d for d in departments if d is not None]
-                    departments_set.update(ministers_map[minister_name]['departments'])
-
-            for record in law_result:
-                minister_name = record['minister_name']
-                laws = record['laws'] or []
-                if minister_name in ministers_map:
-                    ministers_map[minister_name]['laws'] = [l for l in laws if l is not None]
-                    laws_set.update(ministers_map[minister_name]['laws'])
-
-            for record in func_result:
-                minister_name = record['minister_name']
-                functions = record['functions'] or []
-                if minister_name in ministers_map:
-                    ministers_map[minister_name]['functions'] = [f for f in functions if f is not None]
-                    functions_set.update(ministers_map[minister_name]['functions'])
-
-            structure['ministers'] = list(ministers_map.values())
-            structure['departments'] = list(departments_set)
-            structure['laws'] = list(laws_set)
-            structure['functions'] = list(functions_set)
-
-            logger.debug(
-                f"Structure for {decoded_gazette_id}: "
-                f"{len(structure['ministers'])} ministers, "
-                f"{len(structure['departments'])} departments, "
-                f"{len(structure['laws'])} laws"
-            )
-            return jsonify(structure)
+        logger.debug(
+            f"Structure for {decoded_gazette_id}: "
+            f"{len(structure['ministers'])} ministers, "
+            f"{len(structure['departments'])} departments, "
+            f"{len(structure['laws'])} laws"
+        )
+        return jsonify(structure)
 
     except Exception as e:
         logger.error(f"Error getting structure for gazette {gazette_id}: {str(e)}")
@@ -585,91 +513,64 @@ def get_gazette_structure(gazette_id):
 
 
 @app.route("/network/government-evolution", methods=["GET"])
+@cached_response
 def get_government_structure_evolution():
-    """Get government structure evolution showing changes over time"""
-    logger.debug("Getting government structure evolution")
-
-    with driver.session() as session:
-        result = session.run(f"""
-            {GAZETTE_MATCH}
-            OPTIONAL MATCH (g)-[r1]-(m)
-            WHERE m IS NOT NULL AND (m:BaseMinister OR m:AmendmentMinister OR m:Minister)
-            OPTIONAL MATCH (m)-[r2:OVERSEES_DEPARTMENT]->(d)
-            WHERE d IS NOT NULL AND (d:BaseDepartment OR d:AmendmentDepartment OR d:Department)
-            OPTIONAL MATCH (m)-[r3:RESPONSIBLE_FOR_LAW]->(l)
-            WHERE l IS NOT NULL AND (l:BaseLaw OR l:AmendmentLaw OR l:Law)
-            RETURN g, m, d, l, r1, r2, r3
-            ORDER BY g.published_date
-        """)
-
-        gazette_structures = {}
-
-        for record in result:
-            gazette = record['g']
-            if not gazette:
-                continue
-
-            gazette_id = gazette['gazette_id']
-            if gazette_id not in gazette_structures:
-                gazette_structures[gazette_id] = {
-                    'gazette': {
-                        'id': gazette_id,
-                        'published_date': gazette.get('published_date'),
-                        'type': 'base' if 'BaseGazette' in gazette.labels else 'amendment',
-                        'parent_gazette_id': gazette.get('parent_gazette_id')
-                    },
-                    'ministers': {},
-                    'departments': set(),
-                    'laws': set()
-                }
-
-            minister = record['m']
-            if minister:
-                minister_name = minister.get('name')
-                if minister_name not in gazette_structures[gazette_id]['ministers']:
-                    gazette_structures[gazette_id]['ministers'][minister_name] = {
-                        'name': minister_name,
-                        'departments': set(),
-                        'laws': set()
-                    }
-
-                department = record['d']
-                if department:
-                    dept_name = department.get('name')
-                    if dept_name:
-                        gazette_structures[gazette_id]['ministers'][minister_name]['departments'].add(dept_name)
-                        gazette_structures[gazette_id]['departments'].add(dept_name)
-
-                law = record['l']
-                if law:
-                    law_name = law.get('name')
-                    if law_name:
-                        gazette_structures[gazette_id]['ministers'][minister_name]['laws'].add(law_name)
-                        gazette_structures[gazette_id]['laws'].add(law_name)
-
-        evolution_data = []
-        for gazette_id, structure in gazette_structures.items():
-            structure['departments'] = list(structure['departments'])
-            structure['laws'] = list(structure['laws'])
-            for minister in structure['ministers'].values():
-                minister['departments'] = list(minister['departments'])
-                minister['laws'] = list(minister['laws'])
+    """
+    Get government structure evolution showing changes over time.
 
-            evolution_data.append({
-                'gazette': structure['gazette'],
-                'structure': {
-                    'ministers': list(structure['ministers'].values()),
-                    'departments': structure['departments'],
-                    'laws': structure['laws']
-                }
-            })
+    Optional query parameters: `from` and `to` (ISO dates, inclusive) and
+    `offset`/`limit` to page through the gazettes in published order.
+    """
+    logger.debug("Getting government structure evolution")
 
-        evolution_data.sort(key=lambda x: x['gazette']['published_date'] or '')
-        return jsonify({
-            'evolution': evolution_data,
-            'total_gazettes': len(evolution_data)
+    date_from, date_to = request.args.get('from'), request.args.get('to')
+    offset = request.args.get('offset', 0, type=int)
+    limit = request.args.get('limit', type=int)
+    for value in (date_from, date_to):
+        if value is not None:
+            try:
+                date.fromisoformat(value)
+            except ValueError:
+                return jsonify({'error': f"Invalid date {value!r}, expected YYYY-MM-DD"}), 400
+    if offset < 0 or (limit is not None and limit < 0):
+        return jsonify({'error': 'offset and limit must not be negative'}), 400
+
+    rows = store.evolution(date_from, date_to, offset, limit)
+
+    evolution_data = []
+    for row in rows:
+        # ministers sharing a name are merged, as before
+        ministers = {}
+        for m in row['ministers']:
+            minister = ministers.setdefault(m['name'], {'name': m['name'], 'departments': set(), 'laws': set()})
+            minister['departments'].update(m['departments'])
+            minister['laws'].update(m['laws'])
+
+        evolution_data.append({
+            'gazette': {
+                'id': row['gazette_id'],
+                'published_date': row['published_date'],
+                'type': 'base' if 'BaseGazette' in row['labels'] else 'amendment',
+                'parent_gazette_id': row['parent_gazette_id']
+            },
+            'structure': {
+                'ministers': [
+                    {'name': m['name'], 'departments': sorted(m['departments']), 'laws': sorted(m['laws'])}
+                    for m in ministers.values()
+                ],
+                'departments': sorted({d for m in ministers.values() for d in m['departments']}),
+                'laws': sorted({l for m in ministers.values() for l in m['laws']})
+            }
         })
 
+    paged = offset > 0 or limit is not None
+    return jsonify({
+        'evolution': evolution_data,
+        'total_gazettes': store.gazette_count(date_from, date_to) if paged else len(evolution_data),
+        'offset': offset,
+        'limit': limit
+    })
+
 
 @app.route("/network/government-evolution/<path:base_gazette_id>", methods=["GET"])
 def get_government_evolution_from_base(base_gazette_id):
@@ -678,7 +579,7 @@ def get_government_evolution_from_base(base_gazette_id):
     logger.debug(f"Getting government evolution from base gazette: {decoded_base_id}")
 
     with driver.session() as session:
-        result = session.run("""
+        result = timed_run(session, "evolution_from_base", """
             MATCH (base)
             WHERE (base:BaseGazette OR base:AmendmentGazette) AND base.gazette_id = $base_id
             OPTIONAL MATCH (base)<-[:AMENDS]-(amendment)
@@ -740,233 +641,40 @@ def get_base_gazette_from_neo4j(base_id):
     """Get base gazette data from Neo4j database (robust to label variants)."""
     logger.debug(f"Loading base gazette {base_id} from Neo4j")
 
-    with driver.session() as session:
-        # Ministers with their numbers
-        ministers_result = session.run("""
-            MATCH (g:BaseGazette {gazette_id: $gazette_id})
-            MATCH (g)-[:HAS_MINISTER]->(m)
-            WHERE m:BaseMinister OR m:Minister
-            RETURN DISTINCT m.name as minister_name, m.number as minister_number
-        """, gazette_id=base_id)
-
-        ministers_list = [{'name': record['minister_name'], 'number': record['minister_number']} for record in ministers_result]
-        logger.debug(f"Found {len(ministers_list)} ministers in base gazette")
-
-        # Departments
-        dept_result = session.run("""
-            MATCH (g:BaseGazette {gazette_id: $gazette_id})
-            MATCH (g)-[:HAS_MINISTER]->(m)
-            WHERE m:BaseMinister OR m:Minister
-            OPTIONAL MATCH (m)-[:OVERSEES_DEPARTMENT]->(d)
-            WHERE d:BaseDepartment OR d:Department
-            RETURN m.name as minister_name, m.number as minister_number, collect(DISTINCT d.name) as departments
-        """, gazette_id=base_id)
-
-        # Laws
-        law_result = session.run("""
-            MATCH (g:BaseGazette {gazette_id: $gazette_id})
-            MATCH (g)-[:HAS_MINISTER]->(m)
-            WHERE m:BaseMinister OR m:Minister
-            OPTIONAL MATCH (m)-[:RESPONSIBLE_FOR_LAW]->(l)
-            WHERE l:BaseLaw OR l:Law
-            RETURN m.name as minister_name, m.number as minister_number, collect(DISTINCT l.name) as laws
-        """, gazette_id=base_id)
-
-        # Functions
-        func_result = session.run("""
-            MATCH (g:BaseGazette {gazette_id: $gazette_id})
-            MATCH (g)-[:HAS_MINISTER]->(m)
-            WHERE m:BaseMinister OR m:Minister
-            OPTIONAL MATCH (m)-[:HAS_FUNCTION]->(f)
-            WHERE f:BaseFunction OR f:Function
-            RETURN m.name as minister_name, m.number as minister_number, collect(DISTINCT f.name) as functions
-        """, gazette_id=base_id)
-
-        ministers_map = {}
-        all_departments = set()
-        all_laws = set()
-        all_functions = set()
-
-        for minister_info in ministers_list:
-            minister_name = minister_info['name']
-            minister_number = minister_info['number']
-            ministers_map[minister_name] = {
-                'name': minister_name,
-                'number': minister_number,
-                'departments': [],
-                'laws': [],
-                'functions': []
-            }
-
-        for record in dept_result:
-            minister_name = record['minister_name']
-            departments = [d for d in (record['departments'] or []) if d is not None]
-            if minister_name in ministers_map:
-                ministers_map[minister_name]['departments'] = departments
-                all_departments.update(departments)
-
-        for record in law_result:
-            minister_name = record['minister_name']
-            laws = [l for l in (record['laws'] or []) if l is not None]
-            if minister_name in ministers_map:
-                ministers_map[minister_name]['laws'] = laws
-                all_laws.update(laws)
-
-        for record in func_result:
-            minister_name = record['minister_name']
-            functions = [f for f in (record['functions'] or []) if f is not None]
-            if minister_name in ministers_map:
-                ministers_map[minister_name]['functions'] = functions
-                all_functions.update(functions)
-
-        structure = {
-            'ministers': list(ministers_map.values()),
-            'departments': list(all_departments),
-            'laws': list(all_laws),
-            'functions': list(all_functions),
-            'raw_entities': []
-        }
+    ministers = store.base_structure(base_id) or []
+    logger.debug(f"Found {len(ministers)} ministers in base gazette")
+    structure = structure_from_ministers(ministers)
 
-        logger.debug(f"Loaded base gazette with {len(structure['ministers'])} ministers, "
-                     f"{len(structure['departments'])} departments, {len(structure['laws'])} laws")
-        return structure
+    logger.debug(f"Loaded base gazette with {len(structure['ministers'])} ministers, "
+                 f"{len(structure['departments'])} departments, {len(structure['laws'])} laws")
+    return structure
 
 
 def get_amendment_changes_from_neo4j(amendment_id):
     """Get amendment changes from Neo4j database (robust to minister label variants)."""
     logger.debug(f"Loading amendment changes for {amendment_id} from Neo4j")
 
-    with driver.session() as session:
-        check_result = session.run("""
-            MATCH (a:AmendmentGazette {gazette_id: $gazette_id})
-            RETURN a
-        """, gazette_id=amendment_id)
-
-        if not check_result.single():
-            logger.debug(f"Amendment gazette {amendment_id} not found in Neo4j")
-            return None
-
-        changes = []
-
-        # Updated query to work with the actual data structure created by the amendment processing script
-        all_changes_result = session.run("""
-            MATCH (n) 
-            WHERE (n:Function OR n:Department OR n:Law) 
-              AND (n.added_by = $gazette_id OR n.removed_by = $gazette_id)
-            OPTIONAL MATCH (m)-[r]-(n)
-            WHERE m:Minister
-            RETURN labels(n) as node_labels, 
-                   n.name as node_name, 
-                   n.description as description,
-                   n.item_number as item_number,
-                   n.added_by as added_by,
-                   n.removed_by as removed_by,
-                   m.name as minister_name,
-                   m.number as minister_number,
-                   type(r) as rel_type
-        """, gazette_id=amendment_id)
-
-        minister_changes = {}
-
-        for record in all_changes_result:
-            node_labels = record['node_labels']
-            minister_name = record['minister_name'] or "Unknown Minister"
-            minister_number = record['minister_number'] or "Unknown"
-
-            if 'Function' in node_labels:
-                column_no = "1"  # Functions
-                content = record['description'] or record['node_name']
-            elif 'Department' in node_labels:
-                column_no = "2"  # Departments
-                content = record['node_name']
-            elif 'Law' in node_labels:
-                column_no = "3"  # Laws
-                content = record['node_name']
-            else:
-                continue
-
-            minister_key = f"{minister_name}_{column_no}"
-            if minister_key not in minister_changes:
-                minister_changes[minister_key] = {
-                    'minister_name': minister_name,
-                    'minister_number': minister_number,
-                    'column_no': column_no,
-                    'added_content': [],
-                    'deleted_sections': []
-                }
-
-            if record['added_by'] == amendment_id and record['removed_by'] == amendment_id:
-                # UPDATE: both added and removed in same amendment
-                minister_changes[minister_key]['added_content'].append(content)
-                minister_changes[minister_key]['deleted_sections'].append(content)
-            elif record['added_by'] == amendment_id:
-                minister_changes[minister_key]['added_content'].append(content)
-            elif record['removed_by'] == amendment_id:
-                minister_changes[minister_key]['deleted_sections'].append(content)
-
-        # Convert grouped changes to expected format
-        for _, change_data in minister_changes.items():
-            minister_name = change_data['minister_name']
-            minister_number = change_data['minister_number']
-            column_no = change_data['column_no']
-            added_content = change_data['added_content']
-            deleted_sections = change_data['deleted_sections']
-
-            if added_content and deleted_sections:
-                changes.append({
-                    'operation_type': 'UPDATE',
-                    'details': {
-                        'name': minister_name,
-                        'number': minister_number,
-                        'column_no': column_no,
-                        'added_content': added_content,
-                        'deleted_sections': deleted_sections
-                    }
-                })
-            elif added_content:
-                changes.append({
-                    'operation_type': 'INSERTION',
-                    'details': {
-                        'name': minister_name,
-                        'number': minister_number,
-                        'column_no': column_no,
-                        'added_content': added_content
-                    }
-                })
-            elif deleted_sections:
-                changes.append({
-                    'operation_type': 'DELETION',
-                    'details': {
-                        'name': minister_name,
-                        'number': minister_number,
-                        'column_no': column_no,
-                        'deleted_sections': deleted_sections
-                    }
-                })
+    change_rows = store.amendment_change_rows(amendment_id)
+    if change_rows is None:
+        logger.debug(f"Amendment gazette {amendment_id} not found in Neo4j")
+        return None
 
-        logger.debug(f"Found {len(changes)} changes in Neo4j for amendment {amendment_id}")
-        return changes if changes else None
+    changes = changes_from_rows(amendment_id, change_rows)
+    logger.debug(f"Found {len(changes)} changes in Neo4j for amendment {amendment_id}")
+    return changes if changes else None
 
 
 def get_amendment_changes_fallback(amendment_id):
     """Fallback method to indicate when detailed tracking is not available."""
     logger.debug(f"Attempting fallback change generation for amendment {amendment_id}")
     
-    with driver.session() as session:
-        # Get the amendment gazette and its parent
-        result = session.run("""
-            MATCH (a:AmendmentGazette {gazette_id: $amendment_id})
-            OPTIONAL MATCH (a)<-[:AMENDED_BY]-(b:BaseGazette)
-            RETURN a, b.gazette_id as parent_id
-        """, amendment_id=amendment_id)
-        
-        record = result.single()
-        if not record or not record['parent_id']:
-            return None
-        
-        # Return empty list to indicate no detailed changes available
-        # The comparison endpoint will handle this case by adding a note
-        return []
+    # Get the amendment gazette's parent
+    if not store.amendment_parent(amendment_id):
+        return None
+
+    # Return empty list to indicate no detailed changes available
+    # The comparison endpoint will handle this case by adding a note
+    return []
 
 
 def get_amendment_changes_from_file(amendment_id):
@@ -1046,174 +754,37 @@ def get_amendment_changes(amendment_id):
     return []
 
 
-def simulate_final_structure(base_structure, amendment_changes):
-    """Simulate the final structure after applying amendment changes (exact-match semantics)."""
-    import copy
-
-    final_structure = copy.deepcopy(base_structure)
-    ministers_map = {m['name']: m for m in final_structure['ministers']}
-    logger.debug(f"Processing {len(amendment_changes)} changes for {len(ministers_map)} ministers")
-
-    def _ensure_minister(name):
-        # FIX: Do not create new ministers from amendments - only update existing ones
-        # All ministers should come from the base gazette structure
-        if name not in ministers_map:
-            logger.warning(f"Minister '{name}' not found in base structure, skipping change")
-            return None
-        return ministers_map[name]
-
-    for i, change in enumerate(amendment_changes):
-        op = change.get('operation_type')
-        details = change.get('details', {})
-        name = details.get('name')
-        col = details.get('column_no')
-        logger.debug(f"Change {i+1}: {op} for {name} (column {col})")
-
-        if not name or col not in ('1', '2', '3'):
-            logger.debug(f"Change {i+1}: missing name/column, skipping")
-            continue
-
-        minister = _ensure_minister(name)
-        
-        # Skip if minister not found in base structure
-        if minister is None:
-            continue
-
-        # Column mapping
-        if col == '1':
-            field = 'functions'
-        elif col == '2':
-            field = 'departments'
-        else:
-            field = 'laws'
-
-        current = minister[field]
-
-        if op == 'INSERTION':
-            to_add = [x for x in details.get('added_content', []) if x is not None]
-            for x in to_add:
-                if x not in current:
-                    current.append(x)
-
-        elif op == 'DELETION':
-            to_del = set([x for x in details.get('deleted_sections', []) if x is not None])
-            minister[field] = [x for x in current if x not in to_del]
-
-        elif op == 'UPDATE':
-            adds = [x for x in details.get('added_content', []) if x is not None]
-            dels = set([x for x in details.get('deleted_sections', []) if x is not None])
-
-            # If the amendment both deletes and adds and the counts match,
-            # treat it as a direct substitution (replace existing entries).
-            if adds and dels and len(adds) == len(dels):
-                minister[field] = adds
-            else:
-                tmp = [x for x in current if x not in dels]
-                for x in adds:
-                    if x not in tmp:
-                        tmp.append(x)
-                minister[field] = tmp
-
-    # Recompute top-level unions
-    all_depts, all_laws, all_funcs = set(), set(), set()
-    for m in final_structure['ministers']:
-        all_depts.update(m.get('departments', []))
-        all_laws.update(m.get('laws', []))
-        all_funcs.update(m.get('functions', []))
-    final_structure['departments'] = list(all_depts)
-    final_structure['laws'] = list(all_laws)
-    final_structure['functions'] = list(all_funcs)
-
-    return final_structure
+def _minister_key(minister):
+    """'<number>-<name>' as the frontend matches ministers (number left out when unknown)."""
+    number = minister.get('number')
+    return f"{number if number and number != 'Unknown' else ''}-{minister.get('name')}"
 
 
 @app.route("/gazettes/<path:base_gazette_id>/compare/<path:amendment_gazette_id>", methods=["GET"])
+@cached_response
 def compare_gazette_structures(base_gazette_id, amendment_gazette_id):
     """Compare government structure between base and amendment gazettes"""
     decoded_base_id = unquote(base_gazette_id)
     decoded_amendment_id = unquote(amendment_gazette_id)
     logger.debug(f"Comparing structures: {decoded_base_id} vs {decoded_amendment_id}")
 
-    with driver.session() as session:
-        # Base gazette data
-        base_result = session.run(f"""
-            {ANY_GAZETTE_EQUAL_ID}
-            OPTIONAL MATCH (g)-[r]-(entity)
-            RETURN g, r, entity, labels(entity) as entity_labels
-        """, gazette_id=decoded_base_id)
-
-        # Amendment gazette data
-        amendment_result = session.run(f"""
-            {ANY_GAZETTE_EQUAL_ID}
-            OPTIONAL MATCH (g)-[r]-(entity)
-            RETURN g, r, entity, labels(entity) as entity_labels
-        """, gazette_id=decoded_amendment_id)
-
-        def process_gazette_data(result_cursor):
-            ministers_map = {}
-            departments_set = set()
-            laws_set = set()
-            raw_entities = []
-
-            for record in result_cursor:
-                entity = record['entity']
-                if entity:
-                    entity_labels = record['entity_labels']
-                    entity_data = {
-                        'name': entity.get('name', entity.get('gazette_id', 'Unknown')),
-                        'labels': entity_labels,
-                        'properties': dict(entity)
-                    }
-                    raw_entities.append(entity_data)
-
-                    labels_set = set(entity_labels or [])
-                    if any(lbl.endswith('Minister') for lbl in labels_set):
-                        minister_name = entity.get('name', 'Unknown')
-                        if minister_name not in ministers_map:
-                            ministers_map[minister_name] = {
-                                'name': minister_name,
-                                'departments': [],
-                                'laws': [],
-                                'functions': []
-                            }
-                    elif any(lbl.endswith('Department') for lbl in labels_set):
-                        dept_name = entity.get('name', 'Unknown')
-                        departments_set.add(dept_name)
-                    elif any(lbl.endswith('Law') for lbl in labels_set):
-                        law_name = entity.get('name', 'Unknown')
-                        laws_set.add(law_name)
-
-            return {
-                'ministers': list(ministers_map.values()),
-                'departments': list(departments_set),
-                'laws': list(laws_set),
-                'raw_entities': raw_entities
-            }
-
-        # Extract raw entities lists from the Neo4j cursors for later use in frontend
-        base_raw = process_gazette_data(base_result)
-        amendment_raw = process_gazette_data(amendment_result)
-
-        base_structure = {'ministers': [], 'departments': [], 'laws': [], 'raw_entities': base_raw.get('raw_entities', [])}
-        amendment_structure = {'ministers': [], 'departments': [], 'laws': [], 'raw_entities': amendment_raw.get('raw_entities', [])}
-        added_ministers = []
-        removed_ministers = []
-        modified_ministers = []
-
-        base_title_result = session.run(f"""
-            {ANY_GAZETTE_EQUAL_ID}
-            RETURN g.president AS president, g.published_date AS published_date
-        """, gazette_id=decoded_base_id)
-
-        amendment_title_result = session.run(f"""
-            {ANY_GAZETTE_EQUAL_ID}
-            RETURN g.president AS president, g.published_date AS published_date
-        """, gazette_id=decoded_amendment_id)
-
-        base_title = base_title_result.single()
-        amendment_title = amendment_title_result.single()
-
-        # Get amendment changes & simulate final structure over base
+    base_gazette = store.gazette(decoded_base_id)
+    amendment_gazette = store.gazette(decoded_amendment_id)
+    added_ministers = []
+    removed_ministers = []
+    modified_ministers = []
+
+    # Stored snapshots when the amendment belongs to this base; otherwise
+    # get amendment changes & simulate final structure over base
+    base_snapshot = snapshot_for(store, decoded_base_id)
+    amendment_snapshot = snapshot_for(store, decoded_amendment_id)
+    if (base_snapshot and amendment_snapshot and base_snapshot['changes'] is None
+            and amendment_snapshot['base_gazette_id'] == decoded_base_id):
+        logger.debug("Using stored structure snapshots")
+        base_structure = base_snapshot['structure']
+        amendment_changes = amendment_snapshot['changes']
+        final_structure = amendment_snapshot['structure']
+    else:
         amendment_changes = get_amendment_changes(decoded_amendment_id)
         logger.debug(f"Amendment changes found: {amendment_changes is not None}")
 
@@ -1224,126 +795,61 @@ def compare_gazette_structures(base_gazette_id, amendment_gazette_id):
         else:
             logger.debug("Could not load base gazette data from Neo4j")
             base_structure = {'ministers': [], 'departments': [], 'laws': []}
+        final_structure = None
 
-        if amendment_changes and len(amendment_changes) > 0:
-            logger.debug(f"Number of changes: {len(amendment_changes)}")
+    if amendment_changes and len(amendment_changes) > 0:
+        logger.debug(f"Number of changes: {len(amendment_changes)}")
 
+        if final_structure is None:
             final_structure = simulate_final_structure(base_structure, amendment_changes)
 
-            base_ministers = {m['name']: m for m in base_structure['ministers']}
-            final_ministers = {m['name']: m for m in final_structure['ministers']}
-
-            added_ministers = [m for name, m in final_ministers.items() if name not in base_ministers]
-            removed_ministers = [m for name, m in base_ministers.items() if name not in final_ministers]
-            modified_ministers = []
-
-            for name in base_ministers:
-                if name in final_ministers:
-                    base_m = base_ministers[name]
-                    final_m = final_ministers[name]
-
-                    changes = {
-                        'name': name,
-                        'number': base_m.get('number') or final_m.get('number'),
-                        'base': base_m,
-                        'amendment': final_m,
-                        'changes': [],
-                        # Backwards-compatible flattened fields for frontend
-                        'departments_added': [],
-                        'departments_removed': [],
-                        'laws_added': [],
-                        'laws_removed': [],
-                        'functions_added': [],
-                        'functions_removed': []
-                    }
-
-                    base_depts = set(base_m['departments'])
-                    final_depts = set(final_m['departments'])
-                    if base_depts != final_depts:
-                        added_depts = list(final_depts - base_depts)
-                        removed_depts = list(base_depts - final_depts)
-                        changes['changes'].append({
-                            'type': 'departments',
-                            'added': added_depts,
-                            'removed': removed_depts
-                        })
-                        changes['departments_added'] = added_depts
-                        changes['departments_removed'] = removed_depts
-
-                    base_laws = set(base_m['laws'])
-                    final_laws = set(final_m['laws'])
-                    if base_laws != final_laws:
-                        added_laws = list(final_laws - base_laws)
-                        removed_laws = list(base_laws - final_laws)
-                        changes['changes'].append({
-                            'type': 'laws',
-                            'added': added_laws,
-                            'removed': removed_laws
-                        })
-                        changes['laws_added'] = added_laws
-                        changes['laws_removed'] = removed_laws
-
-                    # Populate function diffs if present
-                    base_funcs = set(base_m.get('functions', []))
-                    final_funcs = set(final_m.get('functions', []))
-                    if base_funcs != final_funcs:
-                        added_funcs = list(final_funcs - base_funcs)
-                        removed_funcs = list(base_funcs - final_funcs)
-                        changes['changes'].append({
-                            'type': 'functions',
-                            'added': added_funcs,
-                            'removed': removed_funcs
-                        })
-                        changes['functions_added'] = added_funcs
-                        changes['functions_removed'] = removed_funcs
-
-                    if changes['changes']:
-                        modified_ministers.append(changes)
-
-            amendment_structure = final_structure
-        else:
-            # No detailed changes available - show base structure with a note
-            amendment_structure = base_structure.copy()
-            amendment_structure['note'] = f'Detailed change tracking not available for amendment {decoded_amendment_id}'
-            added_ministers = []
-            removed_ministers = []
-            modified_ministers = []
-
-        response = {
-            'base_gazette': {
-                'id': decoded_base_id,
-                'structure': base_structure,
-                'president': base_title['president'] if base_title else 'Unknown',
-                'published_date': base_title['published_date'] if base_title else 'Unknown'
-            },
-            'amendment_gazette': {
-                'id': decoded_amendment_id,
-                'structure': amendment_structure,
-                'president': amendment_title['president'] if amendment_title else 'Unknown',
-                'published_date': amendment_title['published_date'] if amendment_title else 'Unknown'
-            },
-            'changes': {
-                'added_ministers': added_ministers,
-                'removed_ministers': removed_ministers,
-                'modified_ministers': modified_ministers,
-                'added_departments': list(set(amendment_structure.get('departments', [])) - set(base_structure.get('departments', []))),
-                'removed_departments': list(set(base_structure.get('departments', [])) - set(amendment_structure.get('departments', []))),
-                'added_laws': list(set(amendment_structure.get('laws', [])) - set(base_structure.get('laws', []))),
-                'removed_laws': list(set(base_structure.get('laws', [])) - set(amendment_structure.get('laws', []))),
-                'added_functions': list(set(amendment_structure.get('functions', [])) - set(base_structure.get('functions', []))),
-                'removed_functions': list(set(base_structure.get('functions', [])) - set(amendment_structure.get('functions', [])))
-            }
+        diff = diff_structures(base_structure, final_structure)
+        added_ministers = diff['added_ministers']
+        removed_ministers = diff['removed_ministers']
+        modified_ministers = diff['modified_ministers']
+
+        amendment_structure = final_structure
+    else:
+        # No detailed changes available - show base structure with a note
+        amendment_structure = base_structure.copy()
+        amendment_structure['note'] = f'Detailed change tracking not available for amendment {decoded_amendment_id}'
+
+    column_changes = {}
+    for field in ('departments', 'laws', 'functions'):
+        before, after = set(base_structure.get(field, [])), set(amendment_structure.get(field, []))
+        column_changes[f'added_{field}'] = list(after - before)
+        column_changes[f'removed_{field}'] = list(before - after)
+
+    response = {
+        'base_gazette': {
+            'id': decoded_base_id,
+            'structure': base_structure,
+            'president': base_gazette['president'] if base_gazette else 'Unknown',
+            'published_date': base_gazette['published_date'] if base_gazette else 'Unknown'
+        },
+        'amendment_gazette': {
+            'id': decoded_amendment_id,
+            'structure': amendment_structure,
+            'president': amendment_gazette['president'] if amendment_gazette else 'Unknown',
+            'published_date': amendment_gazette['published_date'] if amendment_gazette else 'Unknown'
+        },
+        'changes': {
+            'added_ministers': added_ministers,
+            'removed_ministers': removed_ministers,
+            'modified_ministers': modified_ministers,
+            **column_changes
+        }
+    }
+
+    # Optional debug keys to help frontend matching issues
+    if os.getenv('COMPARE_DEBUG') == '1':
+        response['debug_keys'] = {
+            'base_minister_keys': [_minister_key(m) for m in base_structure.get('ministers', [])],
+            'amendment_minister_keys': [_minister_key(m) for m in amendment_structure.get('ministers', [])],
+            'modified_minister_keys': [_minister_key(m) for m in modified_ministers]
         }
 
-        # Optional debug keys to help frontend matching issues
-        if os.getenv('COMPARE_DEBUG') == '1':
-            response['debug_keys'] = {
-                'base_minister_keys': [f"{(m.get('number') or '') if (m.get('number') and m.get('number')!='Unknown') else ''}-{m.get('name')}" for m in base_structure.get('ministers', [])],
-                'amendment_minister_keys': [f"{(m.get('number') or '') if (m.get('number') and m.get('number')!='Unknown') else ''}-{m.get('name')}" for m in amendment_structure.get('ministers', [])],
-                'modified_minister_keys': [f"{(m.get('number') or '') if (m.get('number') and m.get('number')!='Unknown') else ''}-{m.get('name')}" for m in modified_ministers]
-            }
-
-        return jsonify(response)
+    return jsonify(response)
 
 
 @app.route("/debug/gazettes", methods=["GET"])
@@ -1351,7 +857,7 @@ def debug_gazettes():
     """Debug endpoint to see all gazette nodes"""
     logger.debug("Debug: Getting all gazette nodes")
     with driver.session() as session:
-        result = session.run(f"""
+        result = timed_run(session, "debug.gazettes", f"""
             MATCH (g)
             WHERE g:BaseGazette OR g:AmendmentGazette
             RETURN g.gazette_id AS gazette_id,
@@ -1371,7 +877,7 @@ def debug_gazette_entities(gazette_id):
     logger.debug(f"Debug: Getting entities for gazette {decoded_gazette_id}")
 
     with driver.session() as session:
-        result = session.run(f"""
+        result = timed_run(session, "debug.gazette_entities", f"""
             {ANY_GAZETTE_EQUAL_ID}
             OPTIONAL MATCH (g)-[r]-(entity)
             RETURN g, r, entity, labels(entity) as entity_labels
@@ -1405,21 +911,21 @@ def debug_database_structure():
     logger.debug("Debug: Getting database structure")
 
     with driver.session() as session:
-        node_types_result = session.run("""
+        node_types_result = timed_run(session, "debug.node_types", """
             MATCH (n)
             RETURN labels(n) as labels, count(n) as count
             ORDER BY count DESC
         """)
         node_types = [{'labels': record['labels'], 'count': record['count']} for record in node_types_result]
 
-        rel_types_result = session.run("""
+        rel_types_result = timed_run(session, "debug.rel_types", """
             MATCH ()-[r]->()
             RETURN type(r) as rel_type, count(r) as count
             ORDER BY count DESC
         """)
         rel_types = [{'type': record['rel_type'], 'count': record['count']} for record in rel_types_result]
 
-        sample_gazette_result = session.run(f"""
+        sample_gazette_result = timed_run(session, "debug.sample_gazette", f"""
             {GAZETTE_MATCH}
             OPTIONAL MATCH (g)-[r]-(entity)
             RETURN g, r, entity, labels(entity) as entity_labels
@@ -1446,6 +952,34 @@ def debug_database_structure():
         })
 
 
+@app.route("/debug/query-stats", methods=["GET", "DELETE"])
+def debug_query_stats():
+    """Per-statement Cypher timings since start-up (or the last DELETE, which resets them)."""
+    if request.method == "DELETE":
+        QUERY_STATS.reset()
+        return jsonify({'reset': True})
+    return jsonify({
+        'slow_query_ms': QUERY_STATS.slow_query_ms,
+        'statements': QUERY_STATS.report()
+    })
+
+
+@app.route("/debug/cache", methods=["GET", "DELETE"])
+def debug_cache():
+    """Response cache hits, misses and evictions (DELETE empties it)."""
+    if request.method == "DELETE":
+        response_cache.clear()
+        return jsonify({'cleared': True})
+    return jsonify(response_cache.stats())
+
+
+@app.route("/debug/search-index", methods=["GET"])
+def debug_search_index():
+    """Size, data version and build time of the search index."""
+    search_index.index()
+    return jsonify(search_index.stats())
+
+
 # ---------------------------------------
 # Entrypoint
 # ---------------------------------------
@@ -0,0 +1,112 @@
+"""
+ASGI entry point for the API.
+
+    uvicorn backend.asgi:app --host 0.0.0.0 --port 5000 --workers 4
+    gunicorn -k uvicorn.workers.UvicornWorker -w 4 -b 0.0.0.0:5000 backend.asgi:app
+
+Worker model: each worker process runs one event loop. The read-heavy
+listings (/gazettes, /amendments, /graph/complete) are served natively on
+the async Neo4j driver, so a slow graph query waits on a socket and not a
+thread; they run concurrently up to the driver's pool (NEO4J_MAX_POOL_SIZE).
+Every other route is the Flask handler in backend.api itself, called through
+WSGIMiddleware on the worker's thread pool (DOCTRACER_ASGI_THREADS threads),
+so a slow Flask route only holds up requests once that pool is exhausted.
+Both kinds share backend.api's response cache, query stats and search index.
+With DOCTRACER_GRAPH_STORE=memory everything is served by Flask.
+"""
+import os
+import logging
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.wsgi import WSGIMiddleware
+from starlette.concurrency import run_in_threadpool
+
+from backend import api
+from doctracer.graph import AsyncNeo4jReads, Neo4jGraphStore
+from doctracer.neo4j_interface import AsyncNeo4jInterface
+
+logger = logging.getLogger(__name__)
+
+# threads running Flask routes (and cache version reads) per worker
+ASGI_THREADS = int(os.getenv("DOCTRACER_ASGI_THREADS", "40"))
+
+# async reads, opened when the app starts (on the worker's event loop)
+reads = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global reads
+    to_thread.current_default_thread_limiter().total_tokens = ASGI_THREADS
+    if NATIVE:
+        reads = AsyncNeo4jReads(AsyncNeo4jInterface(api.URI, api.USER, api.PASSWORD))
+        logger.info(f"Serving {', '.join(NATIVE_ROUTES)} on the async driver, "
+                    f"other routes on {ASGI_THREADS} threads")
+    yield
+    if reads is not None:
+        await reads.close()
+        reads = None
+
+
+app = FastAPI(title="DocTracer API", lifespan=lifespan, docs_url=None, redoc_url=None, openapi_url=None)
+app.add_middleware(CORSMiddleware, allow_origins=api.CORS_ORIGINS)
+
+
+async def _cached_json(request: Request, compute) -> Response:
+    """`api.cached_response` for a coroutine: the JSON of `await compute()`, under the Flask route's cache key."""
+    key = api.cache_key(request.url.path, request.query_params.multi_items())
+    # the version read may query the (sync) store, so it runs off the event loop
+    hit, value, version = await run_in_threadpool(api.response_cache.lookup, key)
+    if not hit:
+        value = (api.app.json.dumps(await compute()).encode(), "application/json")
+        api.response_cache.put(key, value, version)
+    body, mimetype = value
+    return Response(body, media_type=mimetype)
+
+
+async def get_gazettes(request: Request):
+    return await _cached_json(request, reads.gazettes)
+
+
+async def get_amendments(request: Request):
+    async def compute():
+        return api.amendment_listing(await reads.amendments())
+    return await _cached_json(request, compute)
+
+
+async def get_complete_graph(request: Request):
+    async def compute():
+        records = await reads.neo4j.execute_query(api.COMPLETE_GRAPH_QUERY, name="graph_complete")
+        return api.complete_graph(records)
+    return await _cached_json(request, compute)
+
+
+async def debug_asgi():
+    """Natively served routes and how busy this worker's thread pool is."""
+    limiter = to_thread.current_default_thread_limiter()
+    return {
+        'native_routes': list(NATIVE_ROUTES) if NATIVE else [],
+        'threads': limiter.total_tokens,
+        'threads_busy': limiter.borrowed_tokens,
+        'neo4j_pool_size': reads.neo4j.max_connection_pool_size if reads is not None else None,
+    }
+
+
+NATIVE_ROUTES = {
+    "/gazettes": get_gazettes,
+    "/amendments": get_amendments,
+    "/graph/complete": get_complete_graph,
+}
+
+# the native routes read Neo4j directly; the memory store has no async driver
+NATIVE = isinstance(api.store, Neo4jGraphStore)
+if NATIVE:
+    for path, endpoint in NATIVE_ROUTES.items():
+        app.add_api_route(path, endpoint, methods=["GET"])
+app.add_api_route("/debug/asgi", debug_asgi, methods=["GET"])
+
+# everything else: the Flask app (registered last, so the routes above win)
+app.mount("/", WSGIMiddleware(api.app))
@@ -1 +1 @@
-from .neo4j_interface import Neo4jInterface
\ No newline at end of file
+from .neo4j_interface import Neo4jInterface, AsyncNeo4jInterface
\ No newline at end of file
@@ -1,5 +1,9 @@
 import click
-from doctracer.cli.extract import extract
+from doctracer.cli.db import db
+from doctracer.cli.load_graph import load
+from doctracer.cli.extract import extract, progress
+from doctracer.cli.ingest import ingest
+from doctracer.cli.worker import queue, worker
 
 @click.group()
 def cli():
@@ -8,6 +12,12 @@ def cli():
 
 # Register subcommands
 cli.add_command(extract, name='extract')
+cli.add_command(progress, name='progress')
+cli.add_command(ingest, name='ingest')
+cli.add_command(queue, name='queue')
+cli.add_command(worker, name='worker')
+cli.add_command(db, name='db')
+cli.add_command(load, name='load')
 
 if __name__ == "__main__":
     cli()
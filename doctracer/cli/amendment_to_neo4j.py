@@ -2,8 +2,12 @@ import json
 import re
 import os
 import argparse
+from functools import lru_cache
 from neo4j import GraphDatabase
 from dotenv import load_dotenv
+from doctracer.cli.base_index import index_for
+from doctracer.graph import GraphStore, Neo4jGraphStore
+from doctracer.query_stats import timed_run
 
 load_dotenv()
 
@@ -11,7 +15,8 @@ URI = os.getenv("NEO4J_URI")
 USER = os.getenv("NEO4J_USER")
 PASSWORD = os.getenv("NEO4J_PASSWORD")
 
-driver = GraphDatabase.driver(URI, auth=(USER, PASSWORD))
+# None when Neo4j is not configured (e.g. offline import-file export)
+driver = GraphDatabase.driver(URI, auth=(USER, PASSWORD)) if URI else None
 
 
 def extract_item_number(item_str):
@@ -36,82 +41,69 @@ def normalize_column(col):
     return None
 
 
-def get_item_name_from_base_file(base_gazette_path, minister_number, column_no, item_number):
-    """Fallback: attempt to read name from base JSON file (if available)."""
-    if not base_gazette_path or not os.path.exists(base_gazette_path):
-        return None
+BASE_CACHE_SIZE = 32
+
+_COLUMN_ITEMS = {"1": "functions", "2": "departments", "3": "laws"}
+
+
+@lru_cache(maxsize=BASE_CACHE_SIZE)
+def _base_item_names(base_gazette_path, mtime):
+    """
+    Parse a base gazette once into {(minister_number, column_no, item_number): name}.
+    `mtime` is part of the cache key so an edited file is re-parsed.
+    """
     with open(base_gazette_path, "r", encoding="utf-8") as f:
         base = json.load(f)
+    names = {}
     for minister in base.get("ministers", []):
-        if str(minister.get("number")) == str(minister_number):
-            if column_no == "1":
-                items = minister.get("functions", [])
-            elif column_no == "2":
-                items = minister.get("departments", [])
-            else:
-                items = minister.get("laws", [])
-            for it in items:
+        number = str(minister.get("number"))
+        for column_no, field in _COLUMN_ITEMS.items():
+            for it in minister.get(field, []):
                 m = re.match(r"^\s*(\d+)\.\s*(.+)$", str(it).strip())
-                if m and m.group(1) == str(item_number):
-                    return m.group(2).strip()
-    return None
+                if m:
+                    # first minister/item with the number wins, as in a linear scan
+                    names.setdefault((number, column_no, m.group(1)), m.group(2).strip())
+    return names
 
 
-def find_node_and_rel(session, parent_id, minister_number, label, rel, item_number=None, item_name=None):
-    """Find node and relationship, return dict with existence info and current name.
-    
-    FIX: Now includes gazette_id and minister_number constraint to avoid cross-gazette/minister conflicts.
-    """
-    # Normalize minister number by stripping parentheses but keep leading zeros to match stored data (e.g., "04")
+def base_cache_info():
+    """lru_cache statistics of the parsed base gazette cache."""
+    return _base_item_names.cache_info()
+
+
+def get_item_name_from_base_file(base_gazette_path, minister_number, column_no, item_number):
+    """Fallback: attempt to read name from base JSON file (if available)."""
+    if not base_gazette_path or not os.path.exists(base_gazette_path):
+        return None
+    names = _base_item_names(os.path.abspath(base_gazette_path), os.path.getmtime(base_gazette_path))
+    column = column_no if column_no in ("1", "2") else "3"
+    return names.get((str(minister_number), column, str(item_number)))
+
+
+LABEL_MAP = {"1": "Function", "2": "Department", "3": "Law"}
+REL_MAP = {"1": "HAS_FUNCTION", "2": "OVERSEES_DEPARTMENT", "3": "RESPONSIBLE_FOR_LAW"}
+COLUMN_NAMES = {"1": "functions", "2": "departments", "3": "laws"}
+CHANGE_KINDS = ("added", "removed", "updated")
+
+
+def normalize_minister_number(minister_number):
+    """Strip parentheses but keep leading zeros to match stored data (e.g., "04")."""
     clean_number = str(minister_number).strip('()')
-    normalized_minister_number = clean_number.zfill(2) if clean_number.isdigit() else clean_number
-    
-    q = f"""
-    MATCH (b:BaseGazette {{gazette_id: $parent_id}})-[:HAS_MINISTER]->(m:Minister {{number: $minister_number, gazette_id: $parent_id}})
-    OPTIONAL MATCH (m)-[r:{rel}]->(n:{label} {{minister_number: $minister_number, gazette_id: $parent_id}})
-        WHERE (( $item_number IS NOT NULL AND n.item_number = $item_number) OR ($item_number IS NULL AND n.name = $item_name))
-            AND (n.is_active IS NULL OR n.is_active = true)
-    RETURN n IS NOT NULL AS node_exists, id(n) AS node_id, r IS NOT NULL AS rel_exists, n.name AS current_name
-    LIMIT 1
-    """
-    res = session.run(q, parent_id=parent_id, minister_number=normalized_minister_number,
-                      item_number=item_number, item_name=item_name)
-    rec = res.single()
-    if rec:
-        return {"node_exists": rec["node_exists"], "node_id": rec["node_id"],
-                "rel_exists": rec["rel_exists"], "current_name": rec["current_name"]}
-    return {"node_exists": False, "node_id": None, "rel_exists": False, "current_name": None}
+    return clean_number.zfill(2) if clean_number.isdigit() else clean_number
 
 
-def apply_change(session, parent_id, minister_number, column_no, raw_text, amend_id, published_date, action, base_gazette_file=None, minister_name=None):
+def resolve_change(minister_number, column_no, raw_text, action, base_gazette_file=None, minister_name=None):
     """
-    Apply a single change (added/removed/updated) to Neo4j.
-    
-    Properly tracks all changes through node and relationship properties:
-    
-    Node Properties:
-    - added_by, added_on: Amendment that first added this item
-    - updated_by, updated_on: Latest amendment that updated this item
-    - removed_by, removed_on: Amendment that removed this item
-    - is_active: Boolean flag (true if active, false if removed)
-    
-    Relationship Properties:
-    - added_by, added_on: When relationship was created
-    - updated_by, updated_on: When relationship was updated
-    - removed_by, removed_on: When relationship was removed
-    - is_active: Boolean flag (true if active, false if removed)
-    
-    This allows complete audit trail of changes through amendments.
+    Normalise one added/removed/updated item into a change row, or None if
+    the column is unknown. Item names prefer the base gazette's wording for
+    numbered items, falling back to the amendment text.
     """
     column = normalize_column(column_no)
-    label_map = {"1": "Function", "2": "Department", "3": "Law"}
-    rel_map = {"1": "HAS_FUNCTION", "2": "OVERSEES_DEPARTMENT", "3": "RESPONSIBLE_FOR_LAW"}
-
-    label = label_map.get(column)
-    rel = rel_map.get(column)
+    label = LABEL_MAP.get(column)
+    rel = REL_MAP.get(column)
     if not label or not rel:
         print(f"⚠️ Unknown column '{column_no}' for minister {minister_number}. Skipping.")
-        return
+        return None
 
     item_number = extract_item_number(raw_text)
     item_name = None
@@ -124,104 +116,271 @@ def apply_change(session, parent_id, minister_number, column_no, raw_text, amend
         else:
             item_name = str(raw_text).strip()
 
-    found = find_node_and_rel(session, parent_id, minister_number, label, rel, item_number, item_name)
-
-    # Normalize minister number by stripping parentheses but keep leading zeros to match stored data (e.g., "04")
-    clean_number = str(minister_number).strip('()')
-    normalized_minister_number = clean_number.zfill(2) if clean_number.isdigit() else clean_number
-    
-    params = {
-        "parent_id": parent_id,
-        "minister_number": normalized_minister_number,
+    return {
+        "action": action,
+        "label": label,
+        "rel": rel,
+        "minister_number": normalize_minister_number(minister_number),
+        "minister_name": minister_name,
         "item_number": item_number,
         "item_name": item_name,
-        "amend_id": amend_id,
-        "published_date": published_date
     }
-    # include minister_name for creating/merging amendment Minister node
-    params["minister_name"] = minister_name
 
-    # Skip if node exists and content unchanged (for added/updated)
-    if found["node_exists"] and action in ["added", "updated"]:
-        if found["current_name"] == item_name:
+
+def normalize_changes(data: dict, base_gazette_path=None) -> list:
+    """Flatten an amendment JSON into change rows, in the order they must be applied."""
+    rows = []
+    for change in data.get("changes", []):
+        op_type = (change.get("operation_type") or "").upper()
+        details = change.get("details", {}) or {}
+        minister_number = details.get("number") or details.get("minister_number")
+        minister_name = details.get("name") or details.get("minister_name")
+        column_no = details.get("column_no") or details.get("column")
+
+        if not minister_number or not column_no:
+            print(f"⚠️ Skipping change missing minister_number or column: {change}")
+            continue
+
+        sections = []
+        # Deletions
+        if op_type in ["DELETION", "UPDATE"]:
+            sections.append(("removed", details.get("deleted_sections", [])))
+        # Insertions / updates
+        if op_type in ["INSERTION", "UPDATE"]:
+            sections.append(("added", details.get("added_content", [])))
+            sections.append(("updated", details.get("updated_content", [])))
+
+        for action, items in sections:
+            for raw in items or []:
+                row = resolve_change(minister_number, column_no, raw, action, base_gazette_path, minister_name)
+                if row:
+                    rows.append(row)
+    return rows
+
+
+def change_key(row: dict) -> str:
+    item = f"#{row['item_number']}" if row["item_number"] is not None else f"={row['item_name']}"
+    return f"{row['minister_number']}|{row['rel']}|{item}"
+
+
+_LOOKUP_QUERY = """
+UNWIND $keys AS key
+MATCH (b:BaseGazette {gazette_id: $parent_id})-[:HAS_MINISTER]->(m:Minister {number: key.minister_number, gazette_id: $parent_id})
+MATCH (m)-[r]->(n {minister_number: key.minister_number, gazette_id: $parent_id})
+WHERE type(r) = key.rel AND key.label IN labels(n)
+  AND ((key.item_number IS NOT NULL AND n.item_number = key.item_number)
+       OR (key.item_number IS NULL AND n.name = key.item_name))
+RETURN DISTINCT key.key AS key, id(n) AS node_id, n.name AS name, n.is_active AS is_active
+ORDER BY key, node_id
+"""
+
+_TRACK_QUERY = """
+UNWIND $rows AS row
+MATCH (b:BaseGazette {gazette_id: $parent_id})-[:HAS_MINISTER]->(m:Minister {number: row.minister_number, gazette_id: $parent_id})
+MATCH (m)-[r]->(n)
+WHERE id(n) = row.node_id AND type(r) = row.rel
+SET n.removed_by = CASE WHEN row.removed THEN $amend_id ELSE n.removed_by END,
+    n.removed_on = CASE WHEN row.removed THEN $published_date ELSE n.removed_on END,
+    n.updated_by = CASE WHEN row.updated THEN $amend_id ELSE n.updated_by END,
+    n.updated_on = CASE WHEN row.updated THEN $published_date ELSE n.updated_on END,
+    n.is_active = row.is_active
+SET r.removed_by = CASE WHEN row.removed THEN $amend_id ELSE r.removed_by END,
+    r.removed_on = CASE WHEN row.removed THEN $published_date ELSE r.removed_on END,
+    r.updated_by = CASE WHEN row.updated THEN $amend_id ELSE r.updated_by END,
+    r.updated_on = CASE WHEN row.updated THEN $published_date ELSE r.updated_on END,
+    r.is_active = row.is_active
+"""
+
+# For additions created by an amendment, create the node under the AmendmentGazette
+# rather than attaching it to the BaseGazette. This preserves the base gazette
+# original data and keeps amendment-created nodes scoped to the amendment.
+_AMENDMENT_MINISTERS_QUERY = """
+UNWIND $rows AS row
+OPTIONAL MATCH (b:BaseGazette {gazette_id: $parent_id})-[:HAS_MINISTER]->(bm:Minister {number: row.minister_number, gazette_id: $parent_id})
+MERGE (am:Minister {number: row.minister_number, gazette_id: $amend_id})
+ON CREATE SET am.name = coalesce(bm.name, row.minister_name, row.minister_number)
+"""
+
+_CREATE_QUERY = """
+UNWIND $rows AS row
+MATCH (a:AmendmentGazette {gazette_id: $amend_id})
+MATCH (am:Minister {number: row.minister_number, gazette_id: $amend_id})
+CREATE (n:%(label)s {minister_number: row.minister_number, name: row.item_name, gazette_id: $amend_id,
+                    added_by: $amend_id, added_on: $published_date, is_active: true})
+SET n.item_number = row.item_number
+CREATE (am)-[r_rel:%(rel)s]->(n)
+CREATE (a)-[rr:ADDED_IN_AMENDMENT]->(n)
+SET r_rel.added_by = $amend_id, r_rel.added_on = $published_date, r_rel.is_active = true,
+    rr.added_by = $amend_id, rr.added_on = $published_date, rr.is_active = true
+"""
+
+
+def plan_amendment(changes: list, matches: list) -> dict:
+    """
+    Decide what each change does, given every base-gazette node its key matches.
+
+    Changes are replayed in order against an in-memory copy of the matched
+    nodes, so the outcome is the same as applying them one at a time:
+    - an added/updated item whose active node already has the same name is skipped;
+    - a removal marks every node with that key inactive (removed_by/removed_on),
+      so a later addition of the same key creates a fresh node;
+    - an addition/update of an existing item records updated_by/updated_on and
+      reactivates it ("Restored" when it was an addition);
+    - anything that matches no active node is created under the amendment's
+      own Minister with added_by/added_on (this includes removals of unknown
+      items, as before).
+
+    `matches` rows are {"key", "node_id", "name", "is_active"}. Returns the
+    per-node tracking rows, the ordered creation rows and per-outcome counts.
+    """
+    nodes = {}
+    by_key = {}
+    for match in matches:
+        nodes[match["node_id"]] = {
+            "name": match["name"],
+            "active": match["is_active"] is None or match["is_active"] is True,
+        }
+        by_key.setdefault(match["key"], []).append(match["node_id"])
+
+    tracked = {}
+    creations = []
+    counts = {"removed": 0, "updated": 0, "restored": 0, "created": 0, "unchanged": 0}
+
+    for change in changes:
+        action = change["action"]
+        node_ids = by_key.get(change_key(change), [])
+        found = next((nid for nid in node_ids if nodes[nid]["active"]), None)
+
+        if found is not None and action in ["added", "updated"] and nodes[found]["name"] == change["item_name"]:
             # Node unchanged → do not update tracking properties
-            return
-
-    if found["node_exists"]:
-        # Node exists → update tracking based on action type
-        if action == "removed":
-            # Mark node and relationship as removed, but keep for audit trail
-            q_update = f"""
-            MATCH (b:BaseGazette {{gazette_id: $parent_id}})-[:HAS_MINISTER]->(m:Minister {{number: $minister_number, gazette_id: $parent_id}})
-            MATCH (m)-[r:{rel}]->(n:{label} {{minister_number: $minister_number, gazette_id: $parent_id}})
-            WHERE ($item_number IS NOT NULL AND n.item_number = $item_number) OR ($item_number IS NULL AND n.name = $item_name)
-            SET n.removed_by = $amend_id,
-                n.removed_on = $published_date,
-                n.is_active = false
-            SET r.removed_by = $amend_id,
-                r.removed_on = $published_date,
-                r.is_active = false
-            """
-            action_desc = "Removed"
-        else:
-            # Track updates and additions
-            q_update = f"""
-            MATCH (b:BaseGazette {{gazette_id: $parent_id}})-[:HAS_MINISTER]->(m:Minister {{number: $minister_number, gazette_id: $parent_id}})
-            MATCH (m)-[r:{rel}]->(n:{label} {{minister_number: $minister_number, gazette_id: $parent_id}})
-            WHERE ($item_number IS NOT NULL AND n.item_number = $item_number) OR ($item_number IS NULL AND n.name = $item_name)
-            SET n.updated_by = $amend_id,
-                n.updated_on = $published_date,
-                n.is_active = true
-            SET r.updated_by = $amend_id,
-                r.updated_on = $published_date,
-                r.is_active = true
-            """
-            action_desc = "Updated" if action == "updated" else "Restored"
-        
-        session.run(q_update, **params)
-        print(f"ℹ️ {action_desc} {label} node for minister {normalized_minister_number} (amendment: {amend_id}).")
-    else:
-        # Node not found → create new node and relationship with proper tracking
-        # For additions created by an amendment, create the node under the AmendmentGazette
-        # rather than attaching it to the BaseGazette. This preserves the base gazette
-        # original data and keeps amendment-created nodes scoped to the amendment.
-        # Create amendment-scoped Minister (merge) and attach the new node to that Minister
-        if item_number:
-            q_create = f"""
-            MATCH (a:AmendmentGazette {{gazette_id: $amend_id}})
-            OPTIONAL MATCH (b:BaseGazette {{gazette_id: $parent_id}})-[:HAS_MINISTER]->(bm:Minister {{number: $minister_number, gazette_id: $parent_id}})
-            MERGE (am:Minister {{number: $minister_number, gazette_id: $amend_id}})
-            ON CREATE SET am.name = coalesce(bm.name, $minister_name, $minister_number)
-            CREATE (n:{label} {{item_number: $item_number, minister_number: $minister_number, name: $item_name, 
-                                gazette_id: $amend_id, added_by: $amend_id, added_on: $published_date, is_active: true}})
-            CREATE (am)-[r_rel:{rel}]->(n)
-            CREATE (a)-[rr:ADDED_IN_AMENDMENT]->(n)
-            SET r_rel.added_by = $amend_id, r_rel.added_on = $published_date, r_rel.is_active = true,
-                rr.added_by = $amend_id, rr.added_on = $published_date, rr.is_active = true
-            """
-        else:
-            q_create = f"""
-            MATCH (a:AmendmentGazette {{gazette_id: $amend_id}})
-            OPTIONAL MATCH (b:BaseGazette {{gazette_id: $parent_id}})-[:HAS_MINISTER]->(bm:Minister {{number: $minister_number, gazette_id: $parent_id}})
-            MERGE (am:Minister {{number: $minister_number, gazette_id: $amend_id}})
-            ON CREATE SET am.name = coalesce(bm.name, $minister_name, $minister_number)
-            CREATE (n:{label} {{name: $item_name, minister_number: $minister_number, gazette_id: $amend_id, 
-                                added_by: $amend_id, added_on: $published_date, is_active: true}})
-            CREATE (am)-[r_rel:{rel}]->(n)
-            CREATE (a)-[rr:ADDED_IN_AMENDMENT]->(n)
-            SET r_rel.added_by = $amend_id, r_rel.added_on = $published_date, r_rel.is_active = true,
-                rr.added_by = $amend_id, rr.added_on = $published_date, rr.is_active = true
-            """
-
-        session.run(q_create, **params)
-        print(f"ℹ️ Created amendment-scoped {label} node and linked to amendment Minister {normalized_minister_number} (amendment: {amend_id}).")
-
-
-def load_amendment_data(json_path, base_gazette_path=None):
+            counts["unchanged"] += 1
+            continue
+
+        if found is None:
+            creations.append(change)
+            counts["created"] += 1
+            continue
+
+        removed = action == "removed"
+        for nid in node_ids:
+            row = tracked.setdefault(nid, {
+                "node_id": nid, "minister_number": change["minister_number"], "rel": change["rel"],
+                "removed": False, "updated": False, "is_active": nodes[nid]["active"],
+            })
+            row["removed" if removed else "updated"] = True
+            row["is_active"] = nodes[nid]["active"] = not removed
+        counts["removed" if removed else ("updated" if action == "updated" else "restored")] += 1
+
+    return {"tracked": list(tracked.values()), "creations": creations, "counts": counts}
+
+
+def change_summary(plan: dict) -> dict:
     """
-    Load amendment data with proper change tracking.
-    
-    Each change is tracked at both node and relationship level.
+    Per-column added/removed/updated node counts of a planned amendment, plus
+    `change_count` (nodes it adds or removes), stored on its AmendmentGazette.
+    """
+    column_of = {}
+    for column, name in COLUMN_NAMES.items():
+        column_of[LABEL_MAP[column]] = column_of[REL_MAP[column]] = name
+
+    summary = {f"{name}_{kind}": 0 for name in COLUMN_NAMES.values() for kind in CHANGE_KINDS}
+    for change in plan["creations"]:
+        summary[f"{column_of[change['label']]}_added"] += 1
+    for row in plan["tracked"]:
+        for kind in ("removed", "updated"):
+            if row[kind]:
+                summary[f"{column_of[row['rel']]}_{kind}"] += 1
+    summary["change_count"] = len(plan["creations"]) + sum(1 for row in plan["tracked"] if row["removed"])
+    return summary
+
+
+def apply_amendment_changes(tx, parent_id, amend_id, published_date, changes: list, batch_size: int = 1000) -> dict:
+    """
+    Apply normalised change rows inside `tx` with a handful of set-based statements.
+
+    Properly tracks all changes through node and relationship properties:
+    - added_by, added_on: Amendment that first added this item
+    - updated_by, updated_on: Latest amendment that updated this item
+    - removed_by, removed_on: Amendment that removed this item
+    - is_active: Boolean flag (true if active, false if removed)
+
+    Returns the plan counts plus the number of statements sent.
+    """
+    params = {"parent_id": parent_id, "amend_id": amend_id, "published_date": published_date}
+    round_trips = 0
+
+    keys = {}
+    for change in changes:
+        keys.setdefault(change_key(change), {
+            "key": change_key(change), "minister_number": change["minister_number"], "label": change["label"],
+            "rel": change["rel"], "item_number": change["item_number"], "item_name": change["item_name"],
+        })
+    matches = []
+    key_rows = list(keys.values())
+    for i in range(0, len(key_rows), batch_size):
+        matches.extend(timed_run(tx, "amendment.lookup", _LOOKUP_QUERY, keys=key_rows[i:i + batch_size], **params).data())
+        round_trips += 1
+
+    plan = plan_amendment(changes, matches)
+
+    for i in range(0, len(plan["tracked"]), batch_size):
+        timed_run(tx, "amendment.track", _TRACK_QUERY, rows=plan["tracked"][i:i + batch_size], **params)
+        round_trips += 1
+
+    if plan["creations"]:
+        # amendment-scoped Ministers first, named after the first change that needs them
+        ministers = {}
+        for change in plan["creations"]:
+            ministers.setdefault(change["minister_number"], {
+                "minister_number": change["minister_number"], "minister_name": change["minister_name"],
+            })
+        timed_run(tx, "amendment.ministers", _AMENDMENT_MINISTERS_QUERY, rows=list(ministers.values()), **params)
+        round_trips += 1
+
+        for column in sorted(LABEL_MAP):
+            label, rel = LABEL_MAP[column], REL_MAP[column]
+            rows = [c for c in plan["creations"] if c["label"] == label]
+            query = _CREATE_QUERY % {"label": label, "rel": rel}
+            for i in range(0, len(rows), batch_size):
+                timed_run(tx, f"amendment.create.{label}", query, rows=rows[i:i + batch_size], **params)
+                round_trips += 1
+
+    # so /amendments reads counts instead of scanning item nodes per amendment
+    timed_run(tx, "amendment.summary", "MATCH (a:AmendmentGazette {gazette_id: $amend_id}) SET a += $summary",
+              amend_id=amend_id, summary=change_summary(plan))
+    round_trips += 1
+
+    return {**plan["counts"], "round_trips": round_trips}
+
+
+def _write_amendment(tx, meta, amend_gazette_id, parent_gazette_id, published_date, changes):
+    """Write the amendment node, its AMENDED_BY link and all changes inside `tx`."""
+    # Create Amendment node
+    timed_run(tx, "amendment.gazette", """
+    MERGE (a:AmendmentGazette {gazette_id: $amend_id})
+    SET a.published_date = $published_date, a.published_by = $published_by,
+        a.gazette_type = $gazette_type, a.language = $language, a.pdf_url = $pdf_url
+    """, amend_id=amend_gazette_id, published_date=published_date,
+    published_by=meta.get("published_by"), gazette_type=meta.get("gazette_type"),
+    language=meta.get("language"), pdf_url=meta.get("pdf_url"))
+
+    # Link to base gazette
+    timed_run(tx, "amendment.link", """
+    MERGE (b:BaseGazette {gazette_id: $parent_id})
+    MERGE (a:AmendmentGazette {gazette_id: $amend_id})
+    MERGE (b)-[r:AMENDED_BY]->(a)
+    SET r.date = $date
+    """, parent_id=parent_gazette_id, amend_id=amend_gazette_id, date=published_date)
+
+    # Process changes
+    return apply_amendment_changes(tx, parent_gazette_id, amend_gazette_id, published_date, changes)
+
+
+def read_amendment(json_path, base_gazette_path=None) -> dict:
+    """
+    Read an amendment JSON, resolve its base gazette file and normalise its changes.
+
+    `base_gazette_path` may be the base file itself or a directory to search.
     """
     with open(json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
@@ -234,39 +393,11 @@ def load_amendment_data(json_path, base_gazette_path=None):
     if not amend_gazette_id or not parent_gazette_id:
         raise ValueError("Amendment JSON missing gazette_id or parent_gazette.gazette_id")
 
-    # Fallback base file: prefer an explicitly passed file. If base_gazette_path is a directory,
-    # try to find matching base file by gazette id inside that directory.
-    def _find_base_in_dir_by_id(base_dir, parent_id):
-        if not base_dir or not os.path.isdir(base_dir):
-            return None
-        pid_safe = str(parent_id).replace("/", "-")
-        for root, _, files in os.walk(base_dir):
-            for fname in files:
-                if not fname.lower().endswith(".json"):
-                    continue
-                # quick filename check
-                if pid_safe in fname or str(parent_id) in fname:
-                    return os.path.join(root, fname)
-                # content check (safe)
-                fpath = os.path.join(root, fname)
-                try:
-                    with open(fpath, "r", encoding="utf-8") as bf:
-                        bdata = json.load(bf)
-                    file_gzid = bdata.get("gazette_id") or bdata.get("metadata", {}).get("gazette_id")
-                    if file_gzid and str(file_gzid) == str(parent_id):
-                        return fpath
-                except Exception:
-                    continue
-        return None
-
     # If caller passed a directory as base_gazette_path, resolve it to the actual file
+    # through the gazette_id → file index (parsed once per directory, not per amendment)
     if base_gazette_path and os.path.isdir(base_gazette_path):
-        found = _find_base_in_dir_by_id(base_gazette_path, parent_gazette_id)
-        if found:
-            base_gazette_path = found
-        else:
-            # if not found, leave it None so other fallback logic may try
-            base_gazette_path = None
+        # if not found, leave it None so other fallback logic may try
+        base_gazette_path = index_for(base_gazette_path).lookup(parent_gazette_id)
 
     # Existing fallback (your original logic) now runs if base_gazette_path still None
     if not base_gazette_path and parent_gazette_id:
@@ -277,52 +408,78 @@ def load_amendment_data(json_path, base_gazette_path=None):
         if os.path.exists(candidate) and os.path.isfile(candidate):
             base_gazette_path = candidate
 
-    with driver.session() as session:
-        # Create Amendment node
-        session.run("""
-        MERGE (a:AmendmentGazette {gazette_id: $amend_id})
-        SET a.published_date = $published_date, a.published_by = $published_by,
-            a.gazette_type = $gazette_type, a.language = $language, a.pdf_url = $pdf_url
-        """, amend_id=amend_gazette_id, published_date=published_date,
-        published_by=meta.get("published_by"), gazette_type=meta.get("gazette_type"),
-        language=meta.get("language"), pdf_url=meta.get("pdf_url"))
-
-        # Link to base gazette
-        session.run("""
-        MERGE (b:BaseGazette {gazette_id: $parent_id})
-        MERGE (a:AmendmentGazette {gazette_id: $amend_id})
-        MERGE (b)-[r:AMENDED_BY]->(a)
-        SET r.date = $date
-        """, parent_id=parent_gazette_id, amend_id=amend_gazette_id, date=published_date)
-
-        # Process changes
-        for change in data.get("changes", []):
-            op_type = (change.get("operation_type") or "").upper()
-            details = change.get("details", {}) or {}
-            minister_number = details.get("number") or details.get("minister_number")
-            minister_name = details.get("name") or details.get("minister_name")
-            column_no = details.get("column_no") or details.get("column")
-
-            if not minister_number or not column_no:
-                print(f"⚠️ Skipping change missing minister_number or column: {change}")
-                continue
-
-            # Deletions
-            if op_type in ["DELETION", "UPDATE"]:
-                for raw in details.get("deleted_sections", []) or []:
-                    apply_change(session, parent_gazette_id, minister_number, column_no, raw,
-                                 amend_gazette_id, published_date, "removed", base_gazette_path, minister_name=minister_name)
-
-            # Insertions / updates
-            if op_type in ["INSERTION", "UPDATE"]:
-                for raw in details.get("added_content", []) or []:
-                    apply_change(session, parent_gazette_id, minister_number, column_no, raw,
-                                 amend_gazette_id, published_date, "added", base_gazette_path, minister_name=minister_name)
-                for raw in details.get("updated_content", []) or []:
-                    apply_change(session, parent_gazette_id, minister_number, column_no, raw,
-                                 amend_gazette_id, published_date, "updated", base_gazette_path, minister_name=minister_name)
+    return {
+        "meta": meta,
+        "gazette_id": amend_gazette_id,
+        "parent_id": parent_gazette_id,
+        "published_date": published_date,
+        "changes": normalize_changes(data, base_gazette_path),
+    }
+
 
+def load_amendment_data(json_path, base_gazette_path=None, store: GraphStore = None):
+    """
+    Load amendment data with proper change tracking.
+    
+    Each change is tracked at both node and relationship level.
+    """
+    amendment = read_amendment(json_path, base_gazette_path)
+    meta = amendment["meta"]
+    amend_gazette_id = amendment["gazette_id"]
+    parent_gazette_id = amendment["parent_id"]
+    published_date = amendment["published_date"]
+    changes = amendment["changes"]
+
+    store = store or Neo4jGraphStore(driver)
+    stats = store.write_amendment(meta, amend_gazette_id, parent_gazette_id, published_date, changes)
+
+    print(
+        f"ℹ️ {amend_gazette_id}: {stats['removed']} removed, {stats['updated']} updated, "
+        f"{stats['restored']} restored, {stats['created']} created, {stats['unchanged']} unchanged "
+        f"({len(changes)} changes in {stats['round_trips'] + 3} round-trips)."
+    )
     print(f"✅ Applied amendment {amend_gazette_id} to parent {parent_gazette_id} with proper change tracking.")
+    return stats
+
+
+_RESET_BASE_QUERY = """
+MATCH (b:BaseGazette)-[:HAS_MINISTER]->(m:Minister)-[r]->(n)
+WHERE b.gazette_id IN $parent_ids AND m.gazette_id = b.gazette_id AND n.gazette_id = b.gazette_id
+REMOVE n.removed_by, n.removed_on, n.updated_by, n.updated_on, n.is_active,
+       r.removed_by, r.removed_on, r.updated_by, r.updated_on, r.is_active
+RETURN count(DISTINCT n) AS reset
+"""
+
+
+def _retract_amendments(tx, parent_ids, amend_ids) -> dict:
+    deleted = 0
+    for label in ("Law", "Department", "Function", "Minister", "AmendmentGazette"):
+        record = timed_run(
+            tx, f"retract.amendments.{label}",
+            f"MATCH (n:{label}) WHERE n.gazette_id IN $amend_ids DETACH DELETE n RETURN count(*) AS deleted",
+            amend_ids=amend_ids,
+        ).single()
+        deleted += record["deleted"]
+    reset = timed_run(tx, "retract.amendments.reset", _RESET_BASE_QUERY, parent_ids=parent_ids).single()["reset"]
+    return {"deleted": deleted, "reset": reset}
+
+
+def retract_amendments(parent_ids, amend_ids, store: GraphStore = None) -> dict:
+    """
+    Undo every amendment applied to a base gazette.
+
+    Deletes the amendment gazettes and the items they created, and clears the
+    removal/update tracking they left on the base gazette's items, restoring
+    the base as its own loader wrote it. Only a whole chain can be retracted:
+    tracking properties do not record which earlier amendment they replaced.
+    `parent_ids` may list several spellings of the base id.
+    """
+    stats = (store or Neo4jGraphStore(driver)).retract_amendments(list(parent_ids), list(amend_ids))
+    print(
+        f"🗑️ Retracted {len(amend_ids)} amendments of {', '.join(parent_ids)}: "
+        f"{stats['deleted']} nodes deleted, {stats['reset']} base items reset."
+    )
+    return stats
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+import os
+import re
+import json
+import threading
+from typing import Dict, Optional
+from doctracer.ingest.manifest import normalize_gazette_id
+
+INDEX_FILENAME = ".gazette_index.json"
+
+_ID_IN_FILENAME = re.compile(r"^(\d+[-/]\d+)")
+
+
+def _gazette_id_from_json(path: str) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        # ignore malformed files
+        return None
+    if not isinstance(data, dict):
+        return None
+    return data.get("gazette_id") or (data.get("metadata") or {}).get("gazette_id")
+
+
+class GazetteFileIndex:
+    """
+    Persistent gazette_id → JSON file index for a directory tree.
+
+    Each file is parsed once; its gazette_id is stored with the file's mtime
+    and size in `<directory>/.gazette_index.json`, so later runs only re-read
+    files that were added or changed. Ids are matched through
+    `normalize_gazette_id`, so '2289/43', '2289-43' and '2289/043' all
+    resolve to the same file. A file without a gazette_id in its content is
+    indexed by the id at the start of its name (e.g. 2289-43_E.json).
+    """
+
+    def __init__(self, directory: str):
+        self.directory = os.path.abspath(directory)
+        self.index_path = os.path.join(self.directory, INDEX_FILENAME)
+        self._files: Dict[str, dict] = {}
+        self._by_id: Dict[str, str] = {}
+        self.parsed = 0
+        self._lock = threading.RLock()
+        self._load()
+        self.refresh()
+
+    def _load(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self._files = json.load(f).get("files", {})
+        except (OSError, ValueError):
+            self._files = {}
+
+    def _save(self):
+        tmp_path = f"{self.index_path}.{os.getpid()}.{threading.get_ident()}.part"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"files": self._files}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # a read-only data directory only costs us the next run's parse
+            pass
+
+    def refresh(self) -> int:
+        """Re-stat the tree and parse new or modified files. Returns the number parsed."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> int:
+        seen = {}
+        parsed = 0
+        for root, _, files in os.walk(self.directory):
+            for fname in sorted(files):
+                if not fname.lower().endswith(".json") or fname == INDEX_FILENAME:
+                    continue
+                rel_path = os.path.relpath(os.path.join(root, fname), self.directory)
+                st = os.stat(os.path.join(root, fname))
+                entry = self._files.get(rel_path)
+                if not entry or entry["mtime"] != st.st_mtime or entry["size"] != st.st_size:
+                    entry = {
+                        "mtime": st.st_mtime,
+                        "size": st.st_size,
+                        "gazette_id": _gazette_id_from_json(os.path.join(root, fname)),
+                    }
+                    parsed += 1
+                seen[rel_path] = entry
+
+        changed = parsed or len(seen) != len(self._files)
+        self._files = seen
+        self.parsed += parsed
+        self._rebuild()
+        if changed:
+            self._save()
+        return parsed
+
+    def _rebuild(self):
+        by_content, by_name = {}, {}
+        for rel_path, entry in sorted(self._files.items()):
+            path = os.path.join(self.directory, rel_path)
+            if entry.get("gazette_id"):
+                by_content.setdefault(normalize_gazette_id(entry["gazette_id"]), path)
+            m = _ID_IN_FILENAME.match(os.path.basename(rel_path))
+            if m:
+                by_name.setdefault(normalize_gazette_id(m.group(1)), path)
+        # an id stated inside a file beats one guessed from a file name
+        self._by_id = {**by_name, **by_content}
+
+    def lookup(self, gazette_id) -> Optional[str]:
+        """Return the file for `gazette_id`, re-scanning once if it is not indexed yet."""
+        if not gazette_id:
+            return None
+        key = normalize_gazette_id(gazette_id)
+        path = self._by_id.get(key)
+        if path and os.path.exists(path):
+            return path
+        self.refresh()
+        return self._by_id.get(key)
+
+    def __len__(self):
+        return len(self._by_id)
+
+
+_INDEXES: Dict[str, GazetteFileIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def index_for(directory: str) -> GazetteFileIndex:
+    """Return the process-wide index for `directory`, building it on first use."""
+    key = os.path.abspath(directory)
+    with _INDEXES_LOCK:
+        if key not in _INDEXES:
+            _INDEXES[key] = GazetteFileIndex(key)
+        return _INDEXES[key]
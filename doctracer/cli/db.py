@@ -0,0 +1,57 @@
+import json
+import click
+from urllib.request import Request, urlopen
+from neo4j.exceptions import Neo4jError
+from doctracer.cli.import_files import export_import_files
+from doctracer.neo4j_interface import Neo4jInterface
+from doctracer.neo4j_schema import SCHEMA, ensure_schema, missing_schema
+from doctracer.query_stats import format_report
+
+
+@click.group(name='db')
+def db():
+    """Manage the Neo4j database."""
+    pass
+
+
+@db.command()
+@click.option('--check', is_flag=True, default=False,
+              help='Only report missing constraints/indexes; exit with status 1 if any are missing')
+def init(check: bool):
+    """Create the constraints and indexes the loaders and API rely on (idempotent)."""
+    with Neo4jInterface() as neo4j:
+        if check:
+            missing = missing_schema(neo4j.driver)
+            for item in missing:
+                click.echo(f"✗ missing {item.name:<28} {item.describe()}")
+            click.echo(f"{len(SCHEMA) - len(missing)}/{len(SCHEMA)} schema items present.")
+            if missing:
+                raise SystemExit(1)
+            return
+
+        try:
+            created = ensure_schema(neo4j.driver)
+        except Neo4jError as e:
+            # typically a uniqueness constraint over data that already has duplicates
+            raise click.ClickException(f"Schema creation failed: {e.message}")
+
+        for item in created:
+            click.echo(f"✓ created {item.name:<28} {item.describe()}")
+        click.echo(f"✅ Schema ready ({len(created)} created, {len(SCHEMA) - len(created)} already present).")
+
+
+@db.command(name='query-stats')
+@click.option('--api', 'api_url', default='http://localhost:5000', show_default=True, help='Base URL of the DocTracer API')
+@click.option('--reset', is_flag=True, default=False, help='Clear the API\'s statistics after printing them')
+def query_stats(api_url: str, reset: bool):
+    """Print per-statement Cypher timings collected by a running API."""
+    url = f"{api_url.rstrip('/')}/debug/query-stats"
+    with urlopen(url, timeout=30) as response:
+        stats = json.load(response)
+    click.echo(format_report(stats["statements"]))
+    click.echo(f"(slow-query log threshold: {stats['slow_query_ms']:.0f} ms)")
+    if reset:
+        urlopen(Request(url, method="DELETE"), timeout=30).close()
+
+
+db.add_command(export_import_files)
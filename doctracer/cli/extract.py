@@ -4,6 +4,8 @@ from pathlib import Path
 from doctracer.extract.gazette.extragazetteamendment import ExtraGazetteAmendmentProcessor
 
 from doctracer.extract.gazette.extragazettetable import ExtraGazetteTableProcessor
+from doctracer.extract.gazette.checkpoint import BlockJournal, DEFAULT_CHECKPOINT_DIR, list_journals
+from doctracer.extract.language import DEFAULT_PROCESS_LANGUAGES, LANGUAGE_NAMES, LanguageRouter
 
 PROCESSOR_TYPES = {
     'extragazette_amendment': ExtraGazetteAmendmentProcessor,
@@ -33,20 +35,62 @@ PROCESSOR_TYPES = {
     required=True,
     help='Output file path'
 )
-def extract(processor_type: str, input_path: str, output_path: str):
+@click.option(
+    '--checkpoint-dir',
+    'checkpoint_dir',
+    type=click.Path(file_okay=False),
+    default=DEFAULT_CHECKPOINT_DIR,
+    show_default=True,
+    help='Directory for per-gazette block journals (resume after a crash)'
+)
+@click.option(
+    '--no-resume',
+    is_flag=True,
+    default=False,
+    help='Discard any existing journal for this gazette and start from the first block'
+)
+@click.option(
+    '--language',
+    'languages',
+    type=click.Choice(sorted(LANGUAGE_NAMES)),
+    multiple=True,
+    default=DEFAULT_PROCESS_LANGUAGES,
+    show_default=True,
+    help='First-page languages to process (repeatable); other editions are skipped before conversion'
+)
+@click.option(
+    '--no-minimise',
+    is_flag=True,
+    default=False,
+    help='Send the raw docling text to the LLM (skip header/footer and whitespace stripping)'
+)
+def extract(processor_type: str, input_path: str, output_path: str, checkpoint_dir: str, no_resume: bool,
+            languages: tuple, no_minimise: bool):
     """Extract information from gazette PDFs."""
     input_path = Path(input_path)
+
+    if input_path.is_file():
+        decision = LanguageRouter(languages).route(str(input_path))
+        if not decision.process:
+            click.echo(f"↷ Skipped {input_path.name}: detected {LANGUAGE_NAMES[decision.language]} edition")
+            return
     
     # Initialize the appropriate processor class
     processor_class = PROCESSOR_TYPES[processor_type]
 
+    journal = BlockJournal.for_pdf(str(input_path), checkpoint_dir)
+    if no_resume and journal.path.exists():
+        journal.path.unlink()
+    elif journal.done and not journal.completed:
+        click.echo(f"↻ Resuming {input_path.name}: {journal.done}/{journal.total or '?'} blocks already journaled")
+
     # For 'extragazette_amendment', process a single file
     if processor_type == 'extragazette_amendment':
         if not input_path.is_file():
             raise click.BadParameter("Input must be a single PDF file for 'extragazette_amendment'")
         
-        processor = processor_class(input_path)
-        output: str = processor.process_gazettes()
+        processor = processor_class(input_path, checkpoint_dir=checkpoint_dir, minimise=not no_minimise)
+        output: str = _run_with_progress(processor)
 
         with open(output_path, 'w') as text_file:
             text_file.write(output)
@@ -58,10 +102,48 @@ def extract(processor_type: str, input_path: str, output_path: str):
         if not input_path.is_file():
             raise click.BadParameter("Input must be a single PDF file for 'extragazette_table'")
 
-        processor = processor_class(input_path)
-        output: str = processor.process_gazettes()
+        processor = processor_class(input_path, checkpoint_dir=checkpoint_dir, minimise=not no_minimise)
+        output: str = _run_with_progress(processor)
 
         with open(output_path, 'w', encoding='utf-8') as file:
             file.write(output)
 
         click.echo(f"✓ Processed. Results saved to {output_path}")
+
+
+def _run_with_progress(processor) -> str:
+    """Run the processor, reporting journaled progress if it fails part way through."""
+    try:
+        return processor.process_gazettes()
+    except Exception:
+        if processor.journal:
+            p = processor.journal.progress()
+            click.echo(
+                f"✗ {p['gazette']} failed after {p['done']}/{p['total'] or '?'} blocks; "
+                f"rerun the same command to resume from the first missing block",
+                err=True,
+            )
+        raise
+
+
+@click.command()
+@click.option(
+    '--checkpoint-dir',
+    'checkpoint_dir',
+    type=click.Path(file_okay=False),
+    default=DEFAULT_CHECKPOINT_DIR,
+    show_default=True,
+    help='Directory containing block journals'
+)
+@click.option('--all', 'show_all', is_flag=True, default=False, help='Include completed gazettes')
+def progress(checkpoint_dir: str, show_all: bool):
+    """Report block progress for in-flight gazette extractions."""
+    journals = [j for j in list_journals(checkpoint_dir) if show_all or not j["complete"]]
+    if not journals:
+        click.echo("No in-flight gazettes.")
+        return
+
+    for j in journals:
+        status = "complete" if j["complete"] else "in-flight"
+        total = j["total"] or "?"
+        click.echo(f"{j['gazette']:<20} {j['done']:>4}/{total:<4} {status:<10} {j['processor']}")
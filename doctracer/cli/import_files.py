@@ -0,0 +1,81 @@
+import os
+import csv
+from typing import List, Optional, Tuple
+import click
+from doctracer.graph.memory_store import MemoryGraphStore
+
+# properties written with a non-string import type
+_PROPERTY_TYPES = {"is_active": "boolean"}
+
+
+class ImportGraph(MemoryGraphStore):
+    """In-memory replay of the Cypher loaders, written out as bulk-import files."""
+
+    def write_csv(self, output_dir: str) -> List[Tuple[str, str]]:
+        """
+        Write one header-in-file CSV per label and relationship type.
+        Returns [('nodes' | 'relationships', path), ...] for neo4j-admin import.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        written = []
+
+        def _columns(items):
+            columns = []
+            for item in items:
+                for k in item.props:
+                    if k not in columns:
+                        columns.append(k)
+            return columns
+
+        def _header(k):
+            return f"{k}:{_PROPERTY_TYPES[k]}" if k in _PROPERTY_TYPES else k
+
+        def _value(v):
+            return str(v).lower() if isinstance(v, bool) else v
+
+        for label in sorted({n.label for n in self.nodes}):
+            nodes = [n for n in self.nodes if n.label == label]
+            columns = _columns(nodes)
+            path = os.path.join(output_dir, f"nodes_{label}.csv")
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow([":ID"] + [_header(k) for k in columns] + [":LABEL"])
+                for n in nodes:
+                    writer.writerow([n.id] + [_value(n.props.get(k)) for k in columns] + [label])
+            written.append(("nodes", path))
+
+        for rel_type in sorted({r.type for r in self.rels}):
+            rels = [r for r in self.rels if r.type == rel_type]
+            columns = _columns(rels)
+            path = os.path.join(output_dir, f"rels_{rel_type}.csv")
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow([":START_ID"] + [_header(k) for k in columns] + [":END_ID", ":TYPE"])
+                for r in rels:
+                    writer.writerow([r.start.id] + [_value(r.props.get(k)) for k in columns] + [r.end.id, rel_type])
+            written.append(("relationships", path))
+        return written
+
+
+def build_import_graph(base_dir: Optional[str], amendment_dir: Optional[str]) -> ImportGraph:
+    """Replay every base gazette, then every amendment in published-date order."""
+    return ImportGraph.from_json(base_dir, amendment_dir)
+
+
+@click.command(name='export-import-files')
+@click.option('--base-dir', type=click.Path(file_okay=False), default='output/base', show_default=True)
+@click.option('--amendment-dir', type=click.Path(file_okay=False), default='output/amendment', show_default=True)
+@click.option('--output', 'output_dir', type=click.Path(file_okay=False), default='import', show_default=True,
+              help='Directory for the node/relationship CSV files')
+@click.option('--database', default='neo4j', show_default=True, help='Database name used in the printed import command')
+def export_import_files(base_dir: str, amendment_dir: str, output_dir: str, database: str):
+    """Write bulk-import CSVs for a full graph rebuild with neo4j-admin."""
+    graph = build_import_graph(base_dir, amendment_dir)
+    written = graph.write_csv(output_dir)
+
+    for name, count in graph.counts().items():
+        click.echo(f"  {name:<22} {count}")
+    args = " ".join(f"--{kind}={os.path.abspath(path)}" for kind, path in written)
+    click.echo(f"✅ Wrote {len(written)} files to {output_dir}. With the database stopped, run:")
+    click.echo(f"  neo4j-admin database import full {database} --overwrite-destination {args}")
+    click.echo("  then start Neo4j and run `doctracer db init` to create constraints and indexes.")
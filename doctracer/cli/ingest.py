@@ -0,0 +1,67 @@
+import click
+from doctracer.extract.gazette.checkpoint import DEFAULT_CHECKPOINT_DIR
+from doctracer.extract.language import DEFAULT_PROCESS_LANGUAGES, LANGUAGE_NAMES, LanguageRouter
+from doctracer.ingest import IngestPipeline, PdfFetcher, load_manifest
+
+
+@click.command()
+@click.option(
+    '--manifest',
+    'manifest_path',
+    type=click.Path(exists=True, dir_okay=False),
+    required=True,
+    help='gazettes*.csv manifest (gazette_id,date,url,name,description)'
+)
+@click.option(
+    '--relationships',
+    'relationships_path',
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help='Parent/child relationships CSV (defaults to the matching gazette_relationships_with_dates*.csv)'
+)
+@click.option(
+    '--pdf-dir',
+    'pdf_dirs',
+    type=click.Path(exists=True, file_okay=False),
+    multiple=True,
+    help='Directory searched for already-downloaded PDFs (repeatable)'
+)
+@click.option('--cache-dir', type=click.Path(file_okay=False), default='data/pdf_cache', show_default=True,
+              help='Where fetched PDFs are cached')
+@click.option('--output', 'output_dir', type=click.Path(file_okay=False), default='output', show_default=True,
+              help='Output root; JSON is written to <output>/base and <output>/amendment')
+@click.option('--workers', type=int, default=4, show_default=True, help='Extraction/loading worker threads')
+@click.option('--load/--no-load', default=False, show_default=True, help='Load extracted JSON into Neo4j')
+@click.option('--force', is_flag=True, default=False, help='Re-extract gazettes that already have output JSON')
+@click.option('--checkpoint-dir', type=click.Path(file_okay=False), default=DEFAULT_CHECKPOINT_DIR,
+              show_default=True, help='Directory for per-gazette block journals')
+@click.option('--language', 'languages', type=click.Choice(sorted(LANGUAGE_NAMES)), multiple=True,
+              default=DEFAULT_PROCESS_LANGUAGES, show_default=True,
+              help='First-page languages to process (repeatable); other editions are skipped')
+def ingest(manifest_path, relationships_path, pdf_dirs, cache_dir, output_dir, workers, load, force, checkpoint_dir,
+           languages):
+    """Fetch, extract and load every gazette listed in a manifest CSV."""
+    entries = load_manifest(manifest_path, relationships_path)
+    bases = sum(1 for e in entries if e.kind == "base")
+    click.echo(f"📂 {len(entries)} gazettes in {manifest_path} ({bases} base, {len(entries) - bases} amendment)")
+
+    router = LanguageRouter(languages)
+    pipeline = IngestPipeline(
+        entries,
+        PdfFetcher(cache_dir, search_dirs=pdf_dirs),
+        output_dir=output_dir,
+        workers=workers,
+        load=load,
+        force=force,
+        checkpoint_dir=checkpoint_dir,
+        router=router,
+    )
+    summary = pipeline.run()
+
+    for stage in ("fetch", "extract", "load"):
+        if summary[stage]:
+            counts = ", ".join(f"{k}={v}" for k, v in sorted(summary[stage].items()))
+            click.echo(f"  {stage:<8} {counts}")
+    click.echo(router.format_report())
+    for task, error in summary["failed"].items():
+        click.echo(f"  ❌ {task}: {error}", err=True)
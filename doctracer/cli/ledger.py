@@ -0,0 +1,191 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+from datetime import date
+from typing import Dict, Iterable, List
+
+DEFAULT_LEDGER = "load_ledger.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS loads (
+    gazette_id      TEXT PRIMARY KEY,   -- normalised id, e.g. '2289/43'
+    kind            TEXT NOT NULL,
+    parent_id       TEXT,
+    graph_id        TEXT NOT NULL,      -- ids exactly as written to the graph
+    graph_parent_id TEXT,
+    path            TEXT NOT NULL,
+    sha256          TEXT NOT NULL,
+    loaded_at       REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS loads_parent ON loads (parent_id);
+"""
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def graph_ids(path: str, kind: str):
+    """(gazette_id, parent gazette_id) exactly as the loaders write them for this file."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if kind == "base":
+        return data.get("gazette_id"), None
+    meta = data.get("metadata", {})
+    parent_id = (meta.get("parent_gazette") or {}).get("gazette_id") or data.get("parent_gazette") or data.get("parent")
+    return meta.get("gazette_id"), parent_id
+
+
+class LoadLedger:
+    """
+    Local SQLite record of which gazette JSON (by content hash) is in the graph.
+
+    One row per gazette id; a row is written only after the gazette's load
+    transaction has committed, and removed before its writes are retracted,
+    so a crash between the two at worst causes an extra reload.
+    """
+
+    def __init__(self, path: str = DEFAULT_LEDGER):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def entries(self) -> Dict[str, dict]:
+        conn = self._connect()
+        try:
+            return {r["gazette_id"]: dict(r) for r in conn.execute("SELECT * FROM loads")}
+        finally:
+            conn.close()
+
+    def record(self, entry, path: str, sha256: str):
+        """Record a loaded ManifestEntry-style entry; graph ids are read from the file itself."""
+        graph_id, graph_parent_id = graph_ids(path, entry.kind)
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO loads
+                    (gazette_id, kind, parent_id, graph_id, graph_parent_id, path, sha256, loaded_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (entry.gazette_id, entry.kind, entry.parent_id, graph_id or entry.gazette_id, graph_parent_id,
+                 os.path.abspath(path), sha256, time.time()),
+            )
+        finally:
+            conn.close()
+
+    def forget(self, gazette_ids: Iterable[str]):
+        conn = self._connect()
+        try:
+            conn.executemany("DELETE FROM loads WHERE gazette_id = ?", [(g,) for g in gazette_ids])
+        finally:
+            conn.close()
+
+    def clear(self):
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM loads")
+        finally:
+            conn.close()
+
+
+def plan_delta(entries: List, hashes: Dict[str, str], recorded: Dict[str, dict],
+               amendments_scanned: bool = True) -> dict:
+    """
+    Decide what a reload has to touch, given scanned manifest-style entries,
+    their current content hashes and the ledger rows.
+
+    - unchanged files are skipped;
+    - a new or changed base gazette has its previous writes retracted and is
+      reloaded; its amendments' writes are retracted too and they are re-applied,
+      since their audit properties lived on the retracted nodes;
+    - amendments that only append to a chain (dated after every amendment
+      already loaded for that base) are simply applied;
+    - any other change inside a chain (an edited, inserted or removed
+      amendment) retracts the whole chain and re-applies it in date order,
+      because an amendment's effect on is_active/updated_by cannot be undone
+      in isolation.
+
+    With `amendments_scanned=False` (a base-only run) recorded amendments are
+    left alone unless their base is retracted.
+
+    Returns {"load": ids, "retract_bases": ids, "retract_chains": {parent: ids}, "unchanged": ids}.
+    """
+    by_id = {e.gazette_id: e for e in entries}
+    load, retract_bases, unchanged = set(), set(), set()
+    retract_chains: Dict[str, set] = {}
+
+    def _changed(gazette_id):
+        row = recorded.get(gazette_id)
+        return row is None or row["sha256"] != hashes[gazette_id]
+
+    chains: Dict[str, List] = {}
+    for e in entries:
+        if e.kind == "amendment":
+            chains.setdefault(e.parent_id, []).append(e)
+    recorded_chains: Dict[str, set] = {}
+    for gazette_id, row in recorded.items():
+        if row["kind"] == "amendment" and row["parent_id"]:
+            recorded_chains.setdefault(row["parent_id"], set()).add(gazette_id)
+
+    for e in entries:
+        if e.kind != "base":
+            continue
+        if _changed(e.gazette_id):
+            load.add(e.gazette_id)
+            if e.gazette_id in recorded:
+                retract_bases.add(e.gazette_id)
+                retract_chains[e.gazette_id] = set(recorded_chains.get(e.gazette_id, ()))
+        else:
+            unchanged.add(e.gazette_id)
+
+    parents = set(chains) | set(recorded_chains) if amendments_scanned else set()
+    for parent_id in parents:
+        chain = sorted(chains.get(parent_id, []), key=lambda e: (e.published_date or date.min, e.gazette_id))
+        loaded = recorded_chains.get(parent_id, set())
+        if parent_id in retract_chains:
+            load.update(e.gazette_id for e in chain)
+            continue
+
+        changed = [e for e in chain if _changed(e.gazette_id)]
+        removed = loaded - {e.gazette_id for e in chain}
+        if not changed and not removed:
+            unchanged.update(e.gazette_id for e in chain)
+            continue
+
+        appended_only = not removed and all(
+            c.gazette_id not in recorded and all(
+                (c.published_date or date.min, c.gazette_id) > (by_id[g].published_date or date.min, g)
+                for g in loaded if g in by_id
+            )
+            for c in changed
+        )
+        if appended_only:
+            load.update(c.gazette_id for c in changed)
+            unchanged.update(e.gazette_id for e in chain if e not in changed)
+        else:
+            retract_chains[parent_id] = set(loaded)
+            load.update(e.gazette_id for e in chain)
+
+    return {
+        "load": load,
+        "retract_bases": retract_bases,
+        "retract_chains": {p: sorted(ids) for p, ids in retract_chains.items()},
+        "unchanged": unchanged,
+    }
@@ -1,16 +1,14 @@
 import os
 import json
+import time
 import argparse
-from amendment_to_neo4j import load_amendment_data
+from doctracer.cli.amendment_to_neo4j import base_cache_info, load_amendment_data
+from doctracer.cli.base_index import index_for
+from doctracer.cli.ledger import DEFAULT_LEDGER, LoadLedger
+from doctracer.cli.load_graph import load_graph, report_results
 
-def find_base_file_for_amendment(amendment_path: str, base_dir: str):
-    """
-    Given an amendment JSON path and a base directory, read the amendment's
-    parent_gazette.gazette_id and search base_dir for a JSON file that either:
-      - contains a matching "gazette_id" field in file content, or
-      - has the parent id in its filename.
-    Returns the matching base file path or None if not found.
-    """
+def read_parent_id(amendment_path: str):
+    """Return the parent gazette id recorded in an amendment JSON, or None."""
     # safe read amendment JSON to get parent id
     try:
         with open(amendment_path, "r", encoding="utf-8") as f:
@@ -29,88 +27,76 @@ def find_base_file_for_amendment(amendment_path: str, base_dir: str):
     # last fallback in metadata keys
     if not parent_id:
         parent_id = adm.get("metadata", {}).get("parent") or adm.get("parent_gazette", {}).get("gazette_id")
+    return parent_id
 
+
+def find_base_file_for_amendment(amendment_path: str, base_dir: str):
+    """
+    Given an amendment JSON path and a base directory, read the amendment's
+    parent_gazette.gazette_id and look it up in the base directory's
+    gazette_id → file index (matching file content or file name).
+    Returns the matching base file path or None if not found.
+    """
+    parent_id = read_parent_id(amendment_path)
     if not parent_id:
         # no parent id available
         return None
+    return index_for(base_dir).lookup(parent_id)
 
-    pid_safe = str(parent_id).replace("/", "-")
-
-    # search base_dir recursively
-    for root, _, files in os.walk(base_dir):
-        for fname in files:
-            if not fname.lower().endswith(".json"):
-                continue
-            fpath = os.path.join(root, fname)
-            # quick filename match
-            if pid_safe in fname or str(parent_id) in fname:
-                return fpath
-            # otherwise inspect file content (fast fail on unreadable)
-            try:
-                with open(fpath, "r", encoding="utf-8") as bf:
-                    bdata = json.load(bf)
-                # try expected keys where gazette_id might live
-                file_gzid = bdata.get("gazette_id") or bdata.get("metadata", {}).get("gazette_id")
-                if file_gzid and str(file_gzid) == str(parent_id):
-                    return fpath
-            except Exception:
-                # ignore malformed files
-                continue
-
-    return None
 
-
-def load_all_amendments(amendments_dir: str, base_dir: str | None = None):
+def load_all_amendments(amendments_dir: str, base_dir: str | None = None, workers: int = 4,
+                        ledger_path: str | None = DEFAULT_LEDGER):
     """
     Recursively load all amendment JSONs under `amendments_dir`.
-    If base_dir is provided and is a directory, attempt to find the matching base file
-    for each amendment and pass that file to load_amendment_data.
+
+    Amendments of different base gazettes load in parallel on `workers`
+    threads; amendments of the same base are applied in published-date order.
+    If base_dir is provided, each amendment's base file is resolved through the
+    gazette_id index and passed to load_amendment_data for item names.
+    Amendments unchanged since their last load (per the ledger at
+    `ledger_path`) are skipped; pass `ledger_path=None` to reapply everything.
     """
     if not os.path.exists(amendments_dir):
         raise FileNotFoundError(f"❌ Directory not found: {amendments_dir}")
 
-    # Collect all amendment JSONs recursively
-    json_files = []
-    for root, dirs, files in os.walk(amendments_dir):
-        for file in files:
-            if file.lower().endswith(".json"):
-                json_files.append(os.path.join(root, file))
-
-    if not json_files:
-        print(f"⚠️ No JSON files found in {amendments_dir}")
-        return
-
-    print(f"📂 Found {len(json_files)} amendment files in {amendments_dir}")
+    if base_dir and os.path.isdir(base_dir):
+        index = index_for(base_dir)
+        print(f"🗂️ Indexed {len(index)} base gazettes in {base_dir} ({index.parsed} files parsed)")
     print("=========================================")
 
-    for file_path in json_files:
-        print(f"➡️ Loading amendment: {file_path}")
-        # locate base file if base_dir provided
+    def _load(file_path, _base):
         base_file = None
-        if base_dir:
-            if os.path.isdir(base_dir):
-                base_file = find_base_file_for_amendment(file_path, base_dir)
-                if base_file:
-                    print(f"   🔍 Found base: {base_file}")
-                else:
-                    print(f"   ⚠️ Base file not found in {base_dir} for amendment; loader will try fallback.")
-            elif os.path.isfile(base_dir):
-                # user gave a single base file path -> use it (not typical)
-                base_file = base_dir
-
-        try:
-            load_amendment_data(file_path, base_file)
-        except Exception as e:
-            print(f"❌ Failed to load {file_path}: {e}")
-        print("-----------------------------------------")
+        if base_dir and os.path.isdir(base_dir):
+            base_file = find_base_file_for_amendment(file_path, base_dir)
+            if not base_file:
+                print(f"   ⚠️ Base file not found in {base_dir} for {file_path}; loader will try fallback.")
+        elif base_dir and os.path.isfile(base_dir):
+            # user gave a single base file path -> use it (not typical)
+            base_file = base_dir
+        return load_amendment_data(file_path, base_file)
+
+    start = time.perf_counter()
+    results = load_graph(base_dir, amendments_dir, workers=workers, load_bases=False, amendment_loader=_load,
+                         ledger=LoadLedger(ledger_path) if ledger_path else None)
+    if not results:
+        print(f"ℹ️ Nothing to load in {amendments_dir}")
+        return
+    report_results(results, time.perf_counter() - start)
 
-    print("✅ All amendment files processed (completed loop).")
+    info = base_cache_info()
+    print(
+        f"🗃️ Base gazette cache: {info.hits} hits, {info.misses} misses, "
+        f"{info.currsize}/{info.maxsize} gazettes cached"
+    )
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Load all amendment gazettes into Neo4j.")
     parser.add_argument("--dir", required=True, help="Directory containing amendment JSON files (recursively)")
     parser.add_argument("--base", required=False, help="Optional base gazette directory (for fallback)")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel loader threads (one chain per thread)")
+    parser.add_argument("--ledger", default=DEFAULT_LEDGER, help="SQLite load ledger (content hashes of loaded files)")
+    parser.add_argument("--full", action="store_true", help="Reapply every amendment, ignoring the ledger")
     args = parser.parse_args()
 
-    load_all_amendments(args.dir, args.base)
+    load_all_amendments(args.dir, args.base, args.workers, ledger_path=None if args.full else args.ledger)
@@ -1,31 +1,38 @@
 import os
-from doctracer.cli.table_to_neo4j import load_table_data
-
-def load_all_gazettes(json_dir: str):
-    """Recursively load all JSON files in a folder and subfolders using os.walk."""
+import time
+from doctracer.cli.table_to_neo4j import DEFAULT_BATCH_SIZE, load_table_data
+from doctracer.cli.ledger import DEFAULT_LEDGER, LoadLedger
+from doctracer.cli.load_graph import load_graph, report_results
+
+def load_all_gazettes(json_dir: str, batch_size: int = DEFAULT_BATCH_SIZE, workers: int = 4,
+                      ledger_path: str | None = DEFAULT_LEDGER):
+    """
+    Recursively load all base gazette JSON files in a folder, `workers` gazettes at a time.
+
+    Files unchanged since their last load (per the ledger at `ledger_path`) are
+    skipped; pass `ledger_path=None` to reload everything.
+    """
     if not os.path.exists(json_dir):
         print(f"❌ Path does not exist: {json_dir}")
         return
 
-    # Collect all JSON files recursively
-    json_files = []
-    for root, dirs, files in os.walk(json_dir):
-        for file in files:
-            if file.lower().endswith(".json"):  # case-insensitive
-                json_files.append(os.path.join(root, file))
-
-    if not json_files:
-        print(f"❌ No JSON files found in {json_dir}")
+    start = time.perf_counter()
+    results = load_graph(
+        json_dir, None, workers=workers,
+        base_loader=lambda path: load_table_data(path, batch_size=batch_size),
+        ledger=LoadLedger(ledger_path) if ledger_path else None,
+    )
+    if not results:
+        print(f"ℹ️ Nothing to load in {json_dir}")
         return
 
-    print(f"Found {len(json_files)} JSON files in {json_dir}\n")
-
-    for file_path in json_files:
-        try:
-            print(f"Processing: {file_path}")
-            load_table_data(file_path)
-        except Exception as e:
-            print(f"❌ Failed to load {file_path}: {e}")
+    elapsed = time.perf_counter() - start
+    report_results(results, elapsed)
+    loaded = [r for r in results.values() if isinstance(r, dict)]
+    total_rows = sum(r["rows"] for r in loaded)
+    total_round_trips = sum(r["round_trips"] for r in loaded)
+    rate = total_rows / elapsed if elapsed else 0.0
+    print(f"Loaded {total_rows} rows in {total_round_trips} round-trips ({rate:.0f} rows/s).")
 
 
 if __name__ == "__main__":
@@ -33,6 +40,11 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="Load all base gazette JSONs into Neo4j")
     parser.add_argument("--input_dir", required=True, help="Path to folder containing JSON files")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per UNWIND statement")
+    parser.add_argument("--workers", type=int, default=4, help="Gazettes loaded in parallel")
+    parser.add_argument("--ledger", default=DEFAULT_LEDGER, help="SQLite load ledger (content hashes of loaded files)")
+    parser.add_argument("--full", action="store_true", help="Reload every file, ignoring the ledger")
     args = parser.parse_args()
 
-    load_all_gazettes(args.input_dir)
+    load_all_gazettes(args.input_dir, batch_size=args.batch_size, workers=args.workers,
+                      ledger_path=None if args.full else args.ledger)
@@ -0,0 +1,264 @@
+import os
+import json
+import time
+from datetime import date
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+import click
+from doctracer.ingest.manifest import ManifestEntry, load_dependencies, normalize_gazette_id
+from doctracer.ingest.scheduler import run_dag, DependencyFailed
+from doctracer.cli.ledger import DEFAULT_LEDGER, LoadLedger, file_sha256, graph_ids, plan_delta
+from doctracer.graph import GraphStore
+from doctracer.query_stats import QUERY_STATS, format_report
+
+
+def _json_files(directory: Optional[str]) -> List[str]:
+    """Gazette JSON under `directory`; dot-files (like base_index's .gazette_index.json) are skipped."""
+    files = []
+    if directory and os.path.isdir(directory):
+        for root, _, names in os.walk(directory):
+            files += [os.path.join(root, n) for n in sorted(names)
+                      if n.lower().endswith(".json") and not n.startswith(".")]
+    return sorted(files)
+
+
+def _parse_date(value) -> Optional[date]:
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except (TypeError, ValueError):
+        return None
+
+
+def scan_gazette_json(base_dir: Optional[str], amendment_dir: Optional[str]) -> Tuple[List[ManifestEntry], Dict[str, str]]:
+    """
+    Read the metadata of every extracted gazette JSON under the two directories.
+
+    Returns manifest-style entries (so `load_dependencies` can order them) and
+    gazette_id → file path. Files without a gazette_id, and repeated ids, are
+    reported and left out.
+    """
+    entries: List[ManifestEntry] = []
+    paths: Dict[str, str] = {}
+
+    for kind, directory in (("base", base_dir), ("amendment", amendment_dir)):
+        for path in _json_files(directory):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"⚠️ Could not read {path}: {e}")
+                continue
+
+            meta = data.get("metadata", {}) if kind == "amendment" else data
+            gazette_id = meta.get("gazette_id")
+            parent_id = None
+            if kind == "amendment":
+                parent_id = (meta.get("parent_gazette") or {}).get("gazette_id") or data.get("parent_gazette") or data.get("parent")
+            if not gazette_id or (kind == "amendment" and not parent_id):
+                print(f"⚠️ Skipping {path}: missing gazette_id or parent gazette")
+                continue
+
+            gazette_id = normalize_gazette_id(gazette_id)
+            if gazette_id in paths:
+                print(f"⚠️ Skipping {path}: gazette {gazette_id} already provided by {paths[gazette_id]}")
+                continue
+
+            paths[gazette_id] = path
+            entries.append(ManifestEntry(
+                gazette_id=gazette_id,
+                file_stem=os.path.splitext(os.path.basename(path))[0],
+                published_date=_parse_date(meta.get("published_date") or meta.get("Gazette Published Date")),
+                kind=kind,
+                parent_id=normalize_gazette_id(parent_id) if parent_id else None,
+            ))
+    return entries, paths
+
+
+def _default_base_loader(path: str, store: Optional[GraphStore] = None):
+    from doctracer.cli.table_to_neo4j import load_table_data
+    return load_table_data(path, store=store)
+
+
+def _default_amendment_loader(path: str, base: Optional[str], store: Optional[GraphStore] = None):
+    from doctracer.cli.amendment_to_neo4j import load_amendment_data
+    return load_amendment_data(path, base, store=store)
+
+
+def _default_retract_base(gazette_id: str, store: Optional[GraphStore] = None):
+    from doctracer.cli.table_to_neo4j import retract_table_data
+    return retract_table_data(gazette_id, store=store)
+
+
+def _default_retract_chain(parent_ids: List[str], amend_ids: List[str], store: Optional[GraphStore] = None):
+    from doctracer.cli.amendment_to_neo4j import retract_amendments
+    return retract_amendments(parent_ids, amend_ids, store=store)
+
+
+def _default_refresh_snapshots(base_ids: List[str], store: Optional[GraphStore] = None):
+    from doctracer.structure import refresh_snapshots
+    if store is None:
+        from doctracer.cli.table_to_neo4j import driver
+        from doctracer.graph import Neo4jGraphStore
+        store = Neo4jGraphStore(driver)
+    return refresh_snapshots(store, base_ids)
+
+
+def _loaded_bases(entries: List[ManifestEntry], paths: Dict[str, str], results: Dict[str, object]) -> List[str]:
+    """Graph ids of the base gazettes whose chain had a gazette loaded."""
+    base_ids = set()
+    for entry in entries:
+        if entry.gazette_id not in results or isinstance(results[entry.gazette_id], Exception):
+            continue
+        gazette_id, parent_id = graph_ids(paths[entry.gazette_id], entry.kind)
+        base_ids.add(gazette_id if entry.kind == "base" else parent_id)
+    return sorted(b for b in base_ids if b)
+
+
+def _apply_delta(entries, paths, ledger: LoadLedger, amendments_scanned: bool,
+                 retract_base: Callable, retract_chain: Callable):
+    """Retract what changed since the ledger was written; return the entries still to load."""
+    hashes = {gazette_id: file_sha256(path) for gazette_id, path in paths.items()}
+    recorded = ledger.entries()
+    delta = plan_delta(entries, hashes, recorded, amendments_scanned=amendments_scanned)
+
+    # chains first: resetting a base's tracking needs the base items still in place
+    for parent_id, amend_ids in sorted(delta["retract_chains"].items()):
+        if not amend_ids:
+            continue
+        rows = [recorded[g] for g in amend_ids]
+        parent_ids = {r["graph_parent_id"] for r in rows if r["graph_parent_id"]}
+        if parent_id in recorded:
+            parent_ids.add(recorded[parent_id]["graph_id"])
+        ledger.forget(amend_ids)
+        retract_chain(sorted(parent_ids), [r["graph_id"] for r in rows])
+    for gazette_id in sorted(delta["retract_bases"]):
+        graph_id = recorded[gazette_id]["graph_id"]
+        ledger.forget([gazette_id])
+        retract_base(graph_id)
+
+    print(
+        f"⏭️ {len(delta['unchanged'])} unchanged gazettes skipped, {len(delta['load'])} to load "
+        f"({len(delta['retract_bases'])} bases and "
+        f"{sum(len(ids) for ids in delta['retract_chains'].values())} amendments retracted first)."
+    )
+    if not amendments_scanned and any(delta["retract_chains"].values()):
+        print("⚠️ Amendments of reloaded base gazettes were retracted; load the amendment directory again to re-apply them.")
+    return [e for e in entries if e.gazette_id in delta["load"]], hashes
+
+
+def load_graph(
+    base_dir: Optional[str],
+    amendment_dir: Optional[str] = None,
+    workers: int = 4,
+    load_bases: bool = True,
+    base_loader: Optional[Callable] = None,
+    amendment_loader: Optional[Callable] = None,
+    ledger: Optional[LoadLedger] = None,
+    retract_base: Optional[Callable] = None,
+    retract_chain: Optional[Callable] = None,
+    store: Optional[GraphStore] = None,
+    refresh_snapshots: Optional[Callable] = None,
+) -> Dict[str, object]:
+    """
+    Load base and amendment JSON files into Neo4j in dependency order.
+
+    Independent base gazettes, and independent amendment chains, load in
+    parallel on `workers` threads. An amendment waits for its parent base and
+    for the previous amendment of the same parent (by published date), so each
+    chain is applied in publication order. With `load_bases=False` the base
+    directory is not scanned; amendments resolve their base file through the
+    gazette_id index when they load.
+
+    With a `ledger`, files whose content hash matches the last successful load
+    are skipped and changed ones have their previous writes retracted before
+    they are reloaded (see `plan_delta`); each gazette is recorded once its
+    load has committed.
+
+    Once the loads finish, `refresh_snapshots` recomputes the structure
+    snapshots of every base gazette whose chain had a gazette loaded.
+
+    The default loaders write to Neo4j, or to `store` when one is given
+    (e.g. a MemoryGraphStore in tests and benchmarks).
+
+    Returns gazette_id → loader result (or the exception it raised) for the
+    gazettes that were loaded.
+    """
+    base_loader = base_loader or partial(_default_base_loader, store=store)
+    amendment_loader = amendment_loader or partial(_default_amendment_loader, store=store)
+    retract_base = retract_base or partial(_default_retract_base, store=store)
+    retract_chain = retract_chain or partial(_default_retract_chain, store=store)
+    refresh_snapshots = refresh_snapshots or partial(_default_refresh_snapshots, store=store)
+
+    entries, paths = scan_gazette_json(base_dir if load_bases else None, amendment_dir)
+    hashes: Dict[str, str] = {}
+    if ledger is not None:
+        entries, hashes = _apply_delta(
+            entries, paths, ledger, amendment_dir is not None, retract_base, retract_chain
+        )
+    by_id = {e.gazette_id: e for e in entries}
+
+    def _task(gazette_id: str):
+        entry = by_id[gazette_id]
+        path = paths[gazette_id]
+        if entry.kind == "base":
+            result = base_loader(path)
+        else:
+            result = amendment_loader(path, paths.get(entry.parent_id) or base_dir)
+        if ledger is not None:
+            ledger.record(entry, path, hashes[gazette_id])
+        return result
+
+    # run_dag ignores dependencies that are not themselves scheduled (e.g. bases
+    # already in the graph when only amendments are being loaded)
+    results = run_dag(load_dependencies(entries), _task, workers=workers)
+
+    base_ids = _loaded_bases(entries, paths, results)
+    if base_ids:
+        try:
+            snapshots = refresh_snapshots(base_ids)
+            print(f"📸 Refreshed structure snapshots of {len(base_ids)} base gazettes ({len(snapshots)} gazettes)")
+        except Exception as e:
+            # the API computes missing snapshots on first read
+            print(f"⚠️ Could not refresh structure snapshots: {e}")
+    return results
+
+
+def report_results(results: Dict[str, object], elapsed: float) -> int:
+    """Print a load summary. Returns the number of gazettes that did not load."""
+    failed = {k: v for k, v in results.items() if isinstance(v, Exception)}
+    for gazette_id, error in sorted(failed.items()):
+        marker = "↷" if isinstance(error, DependencyFailed) else "❌"
+        click.echo(f"{marker} {gazette_id}: {error}")
+    click.echo(f"✅ Loaded {len(results) - len(failed)}/{len(results)} gazettes in {elapsed:.1f}s.")
+    return len(failed)
+
+
+@click.command()
+@click.option('--base-dir', type=click.Path(file_okay=False), help='Directory of base gazette JSON files')
+@click.option('--amendment-dir', type=click.Path(file_okay=False), help='Directory of amendment JSON files')
+@click.option('--workers', type=int, default=4, show_default=True, help='Parallel loader threads')
+@click.option('--skip-bases', is_flag=True, default=False,
+              help='Only load amendments (base JSON is still used for item names)')
+@click.option('--ledger', 'ledger_path', type=click.Path(dir_okay=False), default=DEFAULT_LEDGER, show_default=True,
+              help='SQLite file recording the content hash of every loaded gazette')
+@click.option('--full', is_flag=True, default=False,
+              help='Ignore the ledger and reload every file (the ledger is still updated)')
+@click.option('--query-stats', is_flag=True, default=False, help='Print per-statement Cypher timings after loading')
+def load(base_dir: Optional[str], amendment_dir: Optional[str], workers: int, skip_bases: bool,
+         ledger_path: str, full: bool, query_stats: bool):
+    """Load extracted gazette JSON into Neo4j, parents before amendments.
+
+    Unchanged files (by content hash) are skipped; use --full to reload everything.
+    """
+    if not base_dir and not amendment_dir:
+        raise click.UsageError("Give --base-dir and/or --amendment-dir")
+
+    ledger = LoadLedger(ledger_path)
+    if full:
+        ledger.clear()
+    start = time.perf_counter()
+    results = load_graph(base_dir, amendment_dir, workers=workers, load_bases=not skip_bases, ledger=ledger)
+    if query_stats:
+        click.echo(format_report(QUERY_STATS.report()))
+    if report_results(results, time.perf_counter() - start):
+        raise SystemExit(1)
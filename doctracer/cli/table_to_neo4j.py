@@ -1,8 +1,11 @@
 import json
 import re
+import time
 from neo4j import GraphDatabase
 from dotenv import load_dotenv
 import os
+from doctracer.graph import GraphStore, Neo4jGraphStore
+from doctracer.query_stats import timed_run
 
 load_dotenv()
 
@@ -10,7 +13,8 @@ URI = os.getenv("NEO4J_URI")
 USER = os.getenv("NEO4J_USER")
 PASSWORD = os.getenv("NEO4J_PASSWORD")
 
-driver = GraphDatabase.driver(URI, auth=(USER, PASSWORD))
+# None when Neo4j is not configured (e.g. offline import-file export)
+driver = GraphDatabase.driver(URI, auth=(USER, PASSWORD)) if URI else None
 
 
 def extract_item_number_and_name(item_str):
@@ -24,148 +28,192 @@ def extract_item_number_and_name(item_str):
     return None, s
 
 
-def load_table_data(file_path: str):
-    """Load a single base gazette JSON file into Neo4j."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+DEFAULT_BATCH_SIZE = 1000
+
+_BASE_GAZETTE_QUERY = """
+MERGE (b:BaseGazette {gazette_id: $gazette_id})
+SET b.published_date = $published_date,
+    b.published_by = $published_by,
+    b.gazette_type = $gazette_type,
+    b.language = $language,
+    b.pdf_url = $pdf_url,
+    b.president = $president
+"""
+
+# FIX: Add gazette_id to Minister node to avoid cross-gazette conflicts
+_MINISTERS_QUERY = """
+UNWIND $rows AS row
+MERGE (m:Minister {number: row.minister_number, gazette_id: $gazette_id})
+SET m.name = row.minister_name
+WITH m
+MATCH (b:BaseGazette {gazette_id: $gazette_id})
+MERGE (b)-[:HAS_MINISTER]->(m)
+"""
+
+_NUMBERED_ITEM_QUERY = """
+UNWIND $rows AS row
+MATCH (m:Minister {number: row.minister_number, gazette_id: $gazette_id})
+MERGE (x:%(label)s {item_number: row.item_number, minister_number: row.minister_number, gazette_id: $gazette_id})
+ON CREATE SET x.name = row.item_name, x.created_in = $gazette_id, x.added_date = $published_date
+ON MATCH SET x.name = coalesce(x.name, row.item_name)
+MERGE (m)-[:%(rel)s]->(x)
+"""
+
+_NAMED_ITEM_QUERY = """
+UNWIND $rows AS row
+MATCH (m:Minister {number: row.minister_number, gazette_id: $gazette_id})
+MERGE (x:%(label)s {name: row.item_name, gazette_id: $gazette_id, minister_ref: row.minister_number})
+ON CREATE SET x.created_in = $gazette_id, x.added_date = $published_date
+MERGE (m)-[:%(rel)s]->(x)
+"""
+
+_LAWS_QUERY = """
+UNWIND $rows AS row
+MATCH (m:Minister {number: row.minister_number, gazette_id: $gazette_id})
+MERGE (l:Law {name: row.law_name, minister_number: row.minister_number, gazette_id: $gazette_id})
+ON CREATE SET l.created_in = $gazette_id, l.added_date = $published_date
+MERGE (m)-[:RESPONSIBLE_FOR_LAW]->(l)
+"""
+
+# (row list key, query) in the order they must be written: ministers first,
+# since every item statement MATCHes its minister.
+_ITEM_COLUMNS = [("functions", "Function", "HAS_FUNCTION"), ("departments", "Department", "OVERSEES_DEPARTMENT")]
+_STATEMENTS = [("ministers", _MINISTERS_QUERY)]
+for _column, _label, _rel in _ITEM_COLUMNS:
+    _STATEMENTS.append((f"{_column}_numbered", _NUMBERED_ITEM_QUERY % {"label": _label, "rel": _rel}))
+    _STATEMENTS.append((f"{_column}_named", _NAMED_ITEM_QUERY % {"label": _label, "rel": _rel}))
+_STATEMENTS.append(("laws", _LAWS_QUERY))
+
+
+def build_table_rows(data: dict) -> dict:
+    """
+    Turn a base gazette JSON document into UNWIND parameter lists, one per
+    statement in _STATEMENTS. Row order follows the document so MERGE
+    semantics (last minister name wins, first item name is kept) match the
+    row-at-a-time loader.
+    """
+    rows = {key: [] for key, _ in _STATEMENTS}
+
+    for minister in data.get("ministers", []):
+        minister_name = minister.get("name")
+        minister_number = str(minister.get("number")) if minister.get("number") is not None else None
+
+        if not minister_number:
+            print(f"⚠️ Skipping minister without number: {minister_name}")
+            continue
+
+        rows["ministers"].append({"minister_number": minister_number, "minister_name": minister_name})
+
+        for column, _, _ in _ITEM_COLUMNS:
+            for item_str in minister.get(column, []):
+                item_number, item_name = extract_item_number_and_name(item_str)
+                if not item_name:
+                    continue
+                if item_number:
+                    rows[f"{column}_numbered"].append(
+                        {"minister_number": minister_number, "item_number": item_number, "item_name": item_name}
+                    )
+                else:
+                    rows[f"{column}_named"].append({"minister_number": minister_number, "item_name": item_name})
 
+        for law_name in minister.get("laws", []):
+            name = law_name.strip()
+            if not name:
+                continue
+            rows["laws"].append({"minister_number": minister_number, "law_name": name})
+
+    return rows
+
+
+def _batches(rows: list, batch_size: int):
+    for i in range(0, len(rows), batch_size):
+        yield rows[i:i + batch_size]
+
+
+def _write_table(tx, data: dict, rows: dict, batch_size: int) -> int:
+    """Write one base gazette inside `tx`. Returns the number of statements sent."""
     gazette_id = data.get("gazette_id")
     published_date = data.get("published_date")
-    published_by = data.get("published_by")
-    gazette_type = data.get("gazette_type")
-    language = data.get("language")
-    pdf_url = data.get("pdf_url")
-    president = data.get("president")
 
+    # Base Gazette
+    timed_run(
+        tx, "base.gazette", _BASE_GAZETTE_QUERY,
+        gazette_id=gazette_id,
+        published_date=published_date,
+        published_by=data.get("published_by"),
+        gazette_type=data.get("gazette_type"),
+        language=data.get("language"),
+        pdf_url=data.get("pdf_url"),
+        president=data.get("president"),
+    )
+    round_trips = 1
+
+    for key, query in _STATEMENTS:
+        for batch in _batches(rows[key], batch_size):
+            timed_run(tx, f"base.{key}", query, rows=batch, gazette_id=gazette_id, published_date=published_date)
+            round_trips += 1
+    return round_trips
+
+
+def load_table_data(file_path: str, batch_size: int = DEFAULT_BATCH_SIZE, store: GraphStore = None) -> dict:
+    """
+    Load a single base gazette JSON file into Neo4j (or into `store`).
+
+    All ministers and items are written with UNWIND statements of at most
+    `batch_size` rows inside one managed write transaction, so a gazette either
+    loads completely or not at all. Returns row and round-trip counts.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    gazette_id = data.get("gazette_id")
     if not gazette_id:
         raise ValueError(f"Missing gazette_id in base JSON: {file_path}")
 
-    with driver.session() as session:
-        # Base Gazette
-        session.run(
-            """
-            MERGE (b:BaseGazette {gazette_id: $gazette_id})
-            SET b.published_date = $published_date,
-                b.published_by = $published_by,
-                b.gazette_type = $gazette_type,
-                b.language = $language,
-                b.pdf_url = $pdf_url,
-                b.president = $president
-            """,
+    rows = build_table_rows(data)
+    start = time.perf_counter()
+
+    store = store or Neo4jGraphStore(driver)
+    round_trips = store.write_base(data, rows, batch_size) + 1  # + commit
+
+    elapsed = time.perf_counter() - start
+    total_rows = 1 + sum(len(r) for r in rows.values())
+    stats = {
+        "gazette_id": gazette_id,
+        "rows": total_rows,
+        "round_trips": round_trips,
+        "seconds": elapsed,
+        "rows_per_second": total_rows / elapsed if elapsed else 0.0,
+    }
+    print(
+        f"✅ Base Gazette {gazette_id} loaded/updated (with gazette_id scoping): "
+        f"{total_rows} rows in {round_trips} round-trips, {stats['rows_per_second']:.0f} rows/s."
+    )
+    return stats
+
+
+def _retract_table(tx, gazette_id: str) -> int:
+    deleted = 0
+    for label in ("Law", "Department", "Function", "Minister"):
+        record = timed_run(
+            tx, f"retract.base.{label}",
+            f"MATCH (n:{label} {{gazette_id: $gazette_id}}) DETACH DELETE n RETURN count(*) AS deleted",
             gazette_id=gazette_id,
-            published_date=published_date,
-            published_by=published_by,
-            gazette_type=gazette_type,
-            language=language,
-            pdf_url=pdf_url,
-            president=president,
-        )
-
-        for minister in data.get("ministers", []):
-            minister_name = minister.get("name")
-            minister_number = str(minister.get("number")) if minister.get("number") is not None else None
-
-            if not minister_number:
-                print(f"⚠️ Skipping minister without number: {minister_name}")
-                continue
+        ).single()
+        deleted += record["deleted"]
+    return deleted
 
-            # FIX: Add gazette_id to Minister node to avoid cross-gazette conflicts
-            session.run(
-                """
-                MERGE (m:Minister {number: $minister_number, gazette_id: $gazette_id})
-                SET m.name = $minister_name
-                WITH m
-                MATCH (b:BaseGazette {gazette_id: $gazette_id})
-                MERGE (b)-[:HAS_MINISTER]->(m)
-                """,
-                minister_number=minister_number,
-                minister_name=minister_name,
-                gazette_id=gazette_id,
-            )
-
-            # Functions
-            for func_str in minister.get("functions", []):
-                item_number, item_name = extract_item_number_and_name(func_str)
-                if item_number:
-                    session.run(
-                        """
-                        MATCH (m:Minister {number: $minister_number, gazette_id: $gazette_id})
-                        MERGE (f:Function {item_number: $item_number, minister_number: $minister_number, gazette_id: $gazette_id})
-                        ON CREATE SET f.name = $item_name, f.created_in = $gazette_id, f.added_date = $published_date
-                        ON MATCH SET f.name = coalesce(f.name, $item_name)
-                        MERGE (m)-[:HAS_FUNCTION]->(f)
-                        """,
-                        minister_number=minister_number,
-                        item_number=item_number,
-                        item_name=item_name,
-                        gazette_id=gazette_id,
-                        published_date=published_date,
-                    )
-                else:
-                    session.run(
-                        """
-                        MATCH (m:Minister {number: $minister_number, gazette_id: $gazette_id})
-                        MERGE (f:Function {name: $item_name, gazette_id: $gazette_id, minister_ref: $minister_number})
-                        ON CREATE SET f.created_in = $gazette_id, f.added_date = $published_date
-                        MERGE (m)-[:HAS_FUNCTION]->(f)
-                        """,
-                        minister_number=minister_number,
-                        item_name=item_name,
-                        gazette_id=gazette_id,
-                        published_date=published_date,
-                    )
 
-            # Departments
-            for dept_str in minister.get("departments", []):
-                item_number, item_name = extract_item_number_and_name(dept_str)
-                if item_number:
-                    session.run(
-                        """
-                        MATCH (m:Minister {number: $minister_number, gazette_id: $gazette_id})
-                        MERGE (d:Department {item_number: $item_number, minister_number: $minister_number, gazette_id: $gazette_id})
-                        ON CREATE SET d.name = $item_name, d.created_in = $gazette_id, d.added_date = $published_date
-                        ON MATCH SET d.name = coalesce(d.name, $item_name)
-                        MERGE (m)-[:OVERSEES_DEPARTMENT]->(d)
-                        """,
-                        minister_number=minister_number,
-                        item_number=item_number,
-                        item_name=item_name,
-                        gazette_id=gazette_id,
-                        published_date=published_date,
-                    )
-                else:
-                    session.run(
-                        """
-                        MATCH (m:Minister {number: $minister_number, gazette_id: $gazette_id})
-                        MERGE (d:Department {name: $item_name, gazette_id: $gazette_id, minister_ref: $minister_number})
-                        ON CREATE SET d.created_in = $gazette_id, d.added_date = $published_date
-                        MERGE (m)-[:OVERSEES_DEPARTMENT]->(d)
-                        """,
-                        minister_number=minister_number,
-                        item_name=item_name,
-                        gazette_id=gazette_id,
-                        published_date=published_date,
-                    )
+def retract_table_data(gazette_id: str, store: GraphStore = None) -> int:
+    """
+    Delete the ministers, functions, departments and laws a base gazette load wrote.
 
-            # Laws
-            for law_name in minister.get("laws", []):
-                name = law_name.strip()
-                if not name:
-                    continue
-                session.run(
-                    """
-                    MATCH (m:Minister {number: $minister_number, gazette_id: $gazette_id})
-                    MERGE (l:Law {name: $law_name, minister_number: $minister_number, gazette_id: $gazette_id})
-                    ON CREATE SET l.created_in = $gazette_id, l.added_date = $published_date
-                    MERGE (m)-[:RESPONSIBLE_FOR_LAW]->(l)
-                    """,
-                    minister_number=minister_number,
-                    law_name=name,
-                    gazette_id=gazette_id,
-                    published_date=published_date,
-                )
-
-    print(f"✅ Base Gazette {gazette_id} loaded/updated (with gazette_id scoping).")
+    The BaseGazette node itself (and its AMENDED_BY links) is kept; reloading
+    the file MERGEs it again. Returns the number of nodes deleted.
+    """
+    deleted = (store or Neo4jGraphStore(driver)).retract_base(gazette_id)
+    print(f"🗑️ Retracted base gazette {gazette_id}: {deleted} nodes deleted.")
+    return deleted
 
 
 if __name__ == "__main__":
@@ -173,5 +221,6 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="Load a single base gazette JSON into Neo4j")
     parser.add_argument("--input", required=True, help="Path to base gazette JSON")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per UNWIND statement")
     args = parser.parse_args()
-    load_table_data(args.input)
+    load_table_data(args.input, batch_size=args.batch_size)
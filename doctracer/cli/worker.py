@@ -0,0 +1,94 @@
+import functools
+from pathlib import Path
+import click
+from doctracer.cli.extract import PROCESSOR_TYPES
+from doctracer.extract.gazette.checkpoint import DEFAULT_CHECKPOINT_DIR
+from doctracer.extract.language import DEFAULT_PROCESS_LANGUAGES, LANGUAGE_NAMES, LanguageRouter
+from doctracer.ingest.jobqueue import JobQueue, default_process, default_worker_id, run_worker
+
+DEFAULT_QUEUE = 'jobs.sqlite'
+
+queue_option = click.option(
+    '--queue',
+    'queue_path',
+    type=click.Path(dir_okay=False),
+    default=DEFAULT_QUEUE,
+    show_default=True,
+    help='SQLite queue file (place it on a filesystem shared by all worker hosts)'
+)
+
+
+@click.group(name='queue')
+def queue():
+    """Manage the shared extraction job queue."""
+    pass
+
+
+@queue.command()
+@queue_option
+@click.option('--type', 'processor_type', type=click.Choice(PROCESSOR_TYPES.keys()), required=True,
+              help='Type of gazette processor to use')
+@click.option('--input', 'input_path', type=click.Path(exists=True), required=True,
+              help='Input PDF file or directory (searched recursively)')
+@click.option('--output-dir', type=click.Path(file_okay=False), required=True,
+              help='Directory where each <pdf stem>.json result is written')
+@click.option('--max-attempts', type=int, default=3, show_default=True)
+def submit(queue_path, processor_type, input_path, output_dir, max_attempts):
+    """Enqueue PDF extraction jobs."""
+    input_path = Path(input_path)
+    pdfs = [input_path] if input_path.is_file() else sorted(input_path.rglob('*.pdf'))
+    q = JobQueue(queue_path)
+    added = sum(
+        q.submit(str(pdf), processor_type, str(Path(output_dir) / f"{pdf.stem}.json"), max_attempts)
+        for pdf in pdfs
+    )
+    click.echo(f"✓ Enqueued {added} new jobs ({len(pdfs) - added} already queued)")
+
+
+@queue.command()
+@queue_option
+def status(queue_path):
+    """Show job counts by status and the last error of failed jobs."""
+    q = JobQueue(queue_path)
+    counts = q.counts()
+    for state in ('pending', 'running', 'done', 'failed'):
+        click.echo(f"{state:<8} {counts.get(state, 0)}")
+    for failure in q.failures():
+        click.echo(f"  ❌ {failure['pdf_path']} ({failure['attempts']} attempts): {failure['last_error']}")
+
+
+@queue.command()
+@queue_option
+def requeue(queue_path):
+    """Retry all failed jobs."""
+    click.echo(f"✓ Requeued {JobQueue(queue_path).requeue_failed()} failed jobs")
+
+
+@click.command()
+@queue_option
+@click.option('--lease', 'lease_seconds', type=float, default=300.0, show_default=True,
+              help='Seconds a claimed job stays leased without a heartbeat')
+@click.option('--max-jobs', type=int, default=None, help='Exit after this many jobs')
+@click.option('--wait', is_flag=True, default=False, help='Keep polling when the queue is empty')
+@click.option('--checkpoint-dir', type=click.Path(file_okay=False), default=DEFAULT_CHECKPOINT_DIR,
+              show_default=True, help='Block journal directory (share it so retries on other hosts resume)')
+@click.option('--language', 'languages', type=click.Choice(sorted(LANGUAGE_NAMES)), multiple=True,
+              default=DEFAULT_PROCESS_LANGUAGES, show_default=True,
+              help='First-page languages to process (repeatable); other editions are skipped')
+def worker(queue_path, lease_seconds, max_jobs, wait, checkpoint_dir, languages):
+    """Pull extraction jobs from the queue and process them."""
+    worker_id = default_worker_id()
+    router = LanguageRouter(languages)
+    click.echo(f"👷 Worker {worker_id} polling {queue_path}")
+    stats = run_worker(
+        JobQueue(queue_path, lease_seconds=lease_seconds),
+        worker_id=worker_id,
+        process=functools.partial(default_process, checkpoint_dir=checkpoint_dir, router=router),
+        max_jobs=max_jobs,
+        idle_exit=not wait,
+    )
+    click.echo(
+        f"✓ Worker finished: {stats['done']} done, {stats['skipped']} skipped, "
+        f"{stats['failed']} failed, {stats['lost']} lost leases"
+    )
+    click.echo(router.format_report())
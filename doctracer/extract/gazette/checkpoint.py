@@ -0,0 +1,130 @@
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_CHECKPOINT_DIR = "checkpoints"
+
+
+def _block_hash(block: str) -> str:
+    return hashlib.sha1(block.encode("utf-8")).hexdigest()
+
+
+class BlockJournal:
+    """
+    Append-only JSONL journal of parsed block results for a single gazette.
+
+    Every completed block is written (and fsync'ed) as soon as the LLM result
+    is parsed, so a crash or rate-limit failure half way through a gazette only
+    loses the block that was in flight. Entries are keyed by block index and a
+    hash of the block text: if the split changes between runs, stale entries
+    are simply not reused.
+
+    Line format:
+        {"type": "header", "processor": ..., "total": N}
+        {"type": "block", "key": "3", "hash": "...", "result": ...}
+        {"type": "complete"}
+    """
+
+    def __init__(self, path: str, processor: str = ""):
+        self.path = Path(path)
+        self.processor = processor
+        self.total: Optional[int] = None
+        self.completed = False
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @classmethod
+    def for_pdf(cls, pdf_path: str, checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR, processor: str = ""):
+        """Return the journal for `pdf_path` inside `checkpoint_dir`."""
+        stem = Path(pdf_path).stem
+        return cls(os.path.join(checkpoint_dir, f"{stem}.jsonl"), processor=processor)
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # a torn line from a crash mid-write; that block is simply redone
+                    continue
+                kind = entry.get("type")
+                if kind == "header":
+                    if self.processor and entry.get("processor") not in (None, "", self.processor):
+                        # journal written by a different processor type → start over
+                        self._entries.clear()
+                        self.total = None
+                        self.completed = False
+                        self._reset_file()
+                        return
+                    self.processor = self.processor or entry.get("processor", "")
+                    self.total = entry.get("total")
+                elif kind == "block":
+                    self._entries[str(entry["key"])] = entry
+                elif kind == "complete":
+                    self.completed = True
+
+    def _reset_file(self):
+        if self.path.exists():
+            self.path.unlink()
+
+    def _append(self, entry: dict):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def start(self, total: int):
+        """Record the number of blocks for this run (used for progress reporting)."""
+        if self.total != total:
+            self.total = total
+            self.completed = False
+            self._append({"type": "header", "processor": self.processor, "total": total})
+
+    def get(self, key, block: str):
+        """Return the journaled result for `key`, or None if missing or the block text changed."""
+        entry = self._entries.get(str(key))
+        if entry and entry.get("hash") == _block_hash(block):
+            return entry.get("result")
+        return None
+
+    def record(self, key, block: str, result: Any):
+        """Persist the parsed result of a block."""
+        entry = {"type": "block", "key": str(key), "hash": _block_hash(block), "result": result}
+        self._entries[str(key)] = entry
+        self._append(entry)
+
+    def complete(self):
+        """Mark the gazette as fully processed."""
+        if not self.completed:
+            self.completed = True
+            self._append({"type": "complete"})
+
+    @property
+    def done(self) -> int:
+        """Number of journaled blocks."""
+        return len(self._entries)
+
+    def progress(self) -> dict:
+        return {
+            "gazette": self.path.stem,
+            "processor": self.processor,
+            "done": self.done,
+            "total": self.total,
+            "complete": self.completed,
+        }
+
+
+def list_journals(checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR) -> List[dict]:
+    """Return progress info for every journal in `checkpoint_dir`."""
+    directory = Path(checkpoint_dir)
+    if not directory.is_dir():
+        return []
+    return [BlockJournal(str(p)).progress() for p in sorted(directory.glob("*.jsonl"))]
@@ -34,9 +34,18 @@ class ExtraGazetteAmendmentProcessor(BaseGazetteProcessor):
         blocks = split_amendment_blocks(text)
 
         all_results = []
+        failed = False
+        if self.journal:
+            self.journal.start(len(blocks))
 
         # 2️⃣ Process each block separately using the same prompt template
-        for block in blocks:
+        for index, block in enumerate(blocks):
+            if self.journal:
+                cached = self.journal.get(index, block)
+                if cached is not None:
+                    all_results.extend(cached)
+                    continue
+
             prompt = PromptCatalog.get_prompt(
                 PromptCatalog.CHANGES_AMENDMENT_BLOCK_EXTRACTION,
                 gazette_text=block
@@ -47,11 +56,19 @@ class ExtraGazetteAmendmentProcessor(BaseGazetteProcessor):
             try:
                 clean_result = re.sub(r"^```(?:json)?\s*|\s*```$", "", raw_result.strip())
                 block_json = json.loads(clean_result)
-                all_results.extend(block_json if isinstance(block_json, list) else [block_json])
+                block_results = block_json if isinstance(block_json, list) else [block_json]
+                all_results.extend(block_results)
+                if self.journal:
+                    self.journal.record(index, block, block_results)
             except json.JSONDecodeError:
                 print("❌ Failed to parse JSON for a block!")
+                failed = True
                 continue
 
+        # a skipped block leaves the journal open, so the gazette still shows as in progress
+        if self.journal and not failed:
+            self.journal.complete()
+
         # 4️⃣ Return combined JSON of all blocks
         return json.dumps(all_results, ensure_ascii=False)
 
@@ -62,7 +79,7 @@ class ExtraGazetteAmendmentProcessor(BaseGazetteProcessor):
     def process_gazettes(self) -> str:
 
         plumber_text = extract_text_from_pdfplumber(self.pdf_path)
-        docling_text = extract_text_from_docling(self.pdf_path)
+        docling_text = self._prepare_text(extract_text_from_docling(self.pdf_path))
 
         raw_meta    = self._extract_metadata(plumber_text)
         raw_changes = self._extract_changes(docling_text)
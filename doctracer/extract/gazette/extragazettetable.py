@@ -68,7 +68,7 @@ class ExtraGazetteTableProcessor(BaseGazetteProcessor):
         
         # Step 1: Extract text from PDF
         plumber_text = extract_text_from_pdfplumber(self.pdf_path)
-        docling_text = extract_text_from_docling(self.pdf_path)
+        docling_text = self._prepare_text(extract_text_from_docling(self.pdf_path))
 
         # Step 2: Extract metadata
         try:
@@ -81,13 +81,24 @@ class ExtraGazetteTableProcessor(BaseGazetteProcessor):
 
         # Step 4: Iteratively extract each block
         all_ministers = []
-        for block in minister_blocks:
+        failed = False
+        if self.journal:
+            self.journal.start(len(minister_blocks))
+        for index, block in enumerate(minister_blocks):
+            if self.journal:
+                cached = self.journal.get(index, block)
+                if cached is not None:
+                    all_ministers.extend(cached)
+                    continue
             try:
                 result = self._extract_changes_from_text(block)
                 if "ministers" in result:
                     all_ministers.extend(result["ministers"])
+                if self.journal:
+                    self.journal.record(index, block, result.get("ministers", []))
             except Exception as e:
                 print(f"⚠️ Skipping block due to error: {e}")
+                failed = True
                 continue
 
         # Step 5: Merge duplicate ministers (by number)
@@ -119,4 +130,7 @@ class ExtraGazetteTableProcessor(BaseGazetteProcessor):
             ministers=ministers_list
         )
 
+        # a skipped block leaves the journal open, so the gazette still shows as in progress
+        if self.journal and not failed:
+            self.journal.complete()
         return gazette.model_dump_json(indent=2)
@@ -1,13 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, Optional
 from doctracer.prompt.executor import PromptExecutor
 from doctracer.extract.pdf_extractor import extract_text_from_docling
+from doctracer.extract.gazette.checkpoint import BlockJournal
+from doctracer.extract.minimise import minimise_text, format_stats
 
 
 class BaseGazetteProcessor(ABC):
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, checkpoint_dir: Optional[str] = None, minimise: bool = True):
         self.pdf_path = pdf_path
+        self.minimise = minimise
+        # Token counts of the docling text before/after minimisation (see _prepare_text)
+        self.text_stats: Optional[dict] = None
         self.executor = self._initialize_executor()
+        # Per-gazette block journal; None disables checkpointing
+        self.journal = (
+            BlockJournal.for_pdf(pdf_path, checkpoint_dir, processor=type(self).__name__)
+            if checkpoint_dir else None
+        )
 
     @abstractmethod
     def _initialize_executor(self) -> PromptExecutor:
@@ -24,10 +35,18 @@ class BaseGazetteProcessor(ABC):
         """Extract changes from gazette text."""
         pass
 
+    def _prepare_text(self, docling_text: str) -> str:
+        """Strip repeated page furniture from docling text before it is prompted."""
+        if not self.minimise:
+            return docling_text
+        text, self.text_stats = minimise_text(docling_text)
+        print(f"✂ {Path(self.pdf_path).name}: {format_stats(self.text_stats)}")
+        return text
+
     def process_gazettes(self) -> str:
         """Process all gazette PDFs and return results."""
         
-        gazette_text = extract_text_from_docling(self.pdf_path)
+        gazette_text = self._prepare_text(extract_text_from_docling(self.pdf_path))
         metadata = self._extract_metadata(gazette_text)
         changes = self._extract_changes(gazette_text)
         
@@ -0,0 +1,144 @@
+import re
+import time
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from doctracer.extract.pdf_extractor import extract_text_from_pdfplumber
+
+# Unicode blocks for the two non-Latin gazette languages
+_SINHALA = re.compile(r"[\u0D80-\u0DFF]")
+_TAMIL = re.compile(r"[\u0B80-\u0BFF]")
+_LATIN_WORD = re.compile(r"[A-Za-z]{2,}")
+
+# Function words that dominate any English gazette notification. Sinhala and
+# Tamil gazettes set in legacy (FM-Abhaya / Bamini style) fonts come out of
+# pdfplumber as Latin-looking noise such as "m%cd;dka;%sl", which contains
+# almost none of these.
+_ENGLISH_WORDS = frozenset("""
+the of and to in is by for that with as on be are this under from or shall
+it at any have has been which gazette minister ministry notification
+published authority government part section democratic socialist republic
+sri lanka constitution president schedule column
+""".split())
+
+# documents.gov.lk names the three editions <id>_E.pdf, <id>_S.pdf and <id>_T.pdf
+_FILENAME_HINTS = {"E": "en", "S": "si", "T": "ta"}
+
+LANGUAGE_NAMES = {"en": "English", "si": "Sinhala", "ta": "Tamil", "unknown": "Unknown"}
+
+# Languages processed by default; 'unknown' covers scanned/empty first pages,
+# which are better sent through the pipeline than silently dropped.
+DEFAULT_PROCESS_LANGUAGES = ("en", "unknown")
+
+
+def filename_language(pdf_path: str) -> Optional[str]:
+    """Language implied by the _E/_S/_T suffix of a gazette file name, if any."""
+    m = re.search(r"_([EST])$", Path(pdf_path).stem, re.IGNORECASE)
+    return _FILENAME_HINTS[m.group(1).upper()] if m else None
+
+
+def detect_language(text: str, filename: Optional[str] = None, min_words: int = 20,
+                    english_ratio: float = 0.12) -> str:
+    """
+    Detect the language of a gazette from its first-page text.
+
+    Returns 'en', 'si', 'ta' or 'unknown'. Unicode Sinhala/Tamil script wins
+    outright; otherwise the share of common English words decides whether the
+    Latin text is real English or a legacy-font rendering, in which case the
+    file name suffix tells Sinhala from Tamil.
+    """
+    hint = filename_language(filename) if filename else None
+
+    sinhala = len(_SINHALA.findall(text))
+    tamil = len(_TAMIL.findall(text))
+    words = _LATIN_WORD.findall(text)
+    if sinhala + tamil > len(words):
+        return "si" if sinhala >= tamil else "ta"
+
+    if len(words) < min_words:
+        # too little text to judge (scanned page, blank cover); trust the file name
+        return hint or "unknown"
+
+    ratio = sum(1 for w in words if w.lower() in _ENGLISH_WORDS) / len(words)
+    if ratio >= english_ratio:
+        return "en"
+    if hint in ("si", "ta"):
+        return hint
+    return "unknown"
+
+
+class RouteDecision:
+    def __init__(self, pdf_path: str, language: str, process: bool, detect_seconds: float):
+        self.pdf_path = pdf_path
+        self.language = language
+        self.process = process
+        self.detect_seconds = detect_seconds
+
+    def __repr__(self):
+        action = "process" if self.process else "skip"
+        return f"RouteDecision({Path(self.pdf_path).name!r}, {self.language}, {action})"
+
+
+class LanguageRouter:
+    """
+    Route PDFs by first-page language before docling conversion and prompting.
+
+    Keeps per-language counts and an estimate of the time saved by skipping:
+    each skipped PDF is credited with the mean processing time of the PDFs
+    that were processed in the same batch (or `fallback_seconds` if none were).
+    Safe to share between worker threads.
+    """
+
+    def __init__(self, process_languages: Iterable[str] = DEFAULT_PROCESS_LANGUAGES,
+                 fallback_seconds: float = 60.0):
+        self.process_languages = set(process_languages)
+        self.fallback_seconds = fallback_seconds
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._detect_seconds = 0.0
+        self._processed_seconds = 0.0
+        self._processed = 0
+
+    def route(self, pdf_path: str) -> RouteDecision:
+        start = time.perf_counter()
+        try:
+            text = extract_text_from_pdfplumber(str(pdf_path))
+        except Exception:
+            text = ""
+        language = detect_language(text, filename=str(pdf_path))
+        decision = RouteDecision(str(pdf_path), language, language in self.process_languages,
+                                 time.perf_counter() - start)
+
+        with self._lock:
+            counts = self._counts.setdefault(language, {"processed": 0, "skipped": 0})
+            counts["processed" if decision.process else "skipped"] += 1
+            self._detect_seconds += decision.detect_seconds
+        return decision
+
+    def record_processing(self, seconds: float):
+        """Record how long a routed PDF took to convert and extract."""
+        with self._lock:
+            self._processed += 1
+            self._processed_seconds += seconds
+
+    def report(self) -> dict:
+        with self._lock:
+            skipped = sum(c["skipped"] for c in self._counts.values())
+            mean = self._processed_seconds / self._processed if self._processed else self.fallback_seconds
+            return {
+                "languages": {lang: dict(c) for lang, c in sorted(self._counts.items())},
+                "skipped": skipped,
+                "detect_seconds": round(self._detect_seconds, 3),
+                "estimated_seconds_saved": round(max(0.0, skipped * mean - self._detect_seconds), 1),
+            }
+
+    def format_report(self) -> str:
+        report = self.report()
+        lines = ["🌐 Language routing:"]
+        for lang, counts in report["languages"].items():
+            lines.append(f"  {LANGUAGE_NAMES.get(lang, lang):<8} processed={counts['processed']} skipped={counts['skipped']}")
+        lines.append(
+            f"  detection took {report['detect_seconds']:.2f}s, "
+            f"~{report['estimated_seconds_saved']:.0f}s of conversion/LLM time saved"
+        )
+        return "\n".join(lines)
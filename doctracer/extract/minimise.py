@@ -0,0 +1,175 @@
+import re
+from collections import Counter
+from typing import Tuple
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("o200k_base")
+except Exception:  # optional: fall back to a regex estimate when tiktoken is unavailable
+    _ENCODING = None
+
+_LIGATURES = {
+    "\ufb00": "ff", "\ufb01": "fi", "\ufb02": "fl", "\ufb03": "ffi", "\ufb04": "ffl", "\ufb05": "st", "\ufb06": "st",
+}
+_ENTITIES = {"&amp;": "&", "&lt;": "<", "&gt;": ">", "&quot;": '"', "&#39;": "'"}
+
+# One alternation so ligatures, entities, line-broken hyphens, whitespace runs and
+# markdown table rules are all normalised in a single scan of the text.
+_NORMALISE = re.compile(
+    r"(?P<lig>[\ufb00-\ufb06])"
+    r"|(?P<ent>&(?:amp|lt|gt|quot|#39);)"
+    r"|(?P<hyph>(?<=[a-z])-[ \t]*\n[ \t]*(?=[a-z]))"
+    r"|(?P<rule>-{4,})"
+    r"|(?P<trail>[ \t\u00a0]+(?=\n))"
+    r"|(?P<ws>[ \t\u00a0\u2000-\u200a]{2,}|[\t\u00a0\u2000-\u200a])"
+    r"|(?P<blank>\n{3,})"
+)
+
+# Lines that carry structure the block splitters or prompts depend on; these
+# are never dropped even when they repeat.
+_PROTECTED = re.compile(
+    r"^\s*(?:\||-\s|•|\*|\d+\s*\.|=== CHANGE|-\s*\(\d+\))|column|minister"
+    r"|duties\s*(?:&|and)\s*functions|departments\s*,\s*statutory\s*institutions"
+    r"|laws?\s*(?:(?:&|and)\s*ordinances?\s*)?to\s*be\s*implemented",
+    re.IGNORECASE,
+)
+_PAGE_NUMBER = re.compile(r"^\s*(?:page\s*)?\d{1,3}\s*[A-Z]?\s*$", re.IGNORECASE)
+# the running header docling emits at the top of every page
+_MASTHEAD = re.compile(r"^\s*PART\s+[IVX]+\s*:\s*SEC.*GAZETTE\s+EXTRAORDINARY", re.IGNORECASE)
+# non-blank lines either side of a page break that may be page furniture
+_FURNITURE_WINDOW = 2
+_LEGACY_MARKERS = re.compile(r"[%;§ß¾úÜ\^&$`=]")
+_ENGLISH_HINT = re.compile(r"\b(?:the|of|and|to|in|is|by|for|no|act|part|section|gazette)\b", re.IGNORECASE)
+_DIGITS = re.compile(r"\d+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Token count with tiktoken when installed, else a word/punctuation estimate."""
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text, disallowed_special=()))
+    return len(re.findall(r"\w+|[^\w\s]|\s{2,}", text))
+
+
+def _normalise(text: str) -> str:
+    def _replace(m):
+        kind = m.lastgroup
+        if kind == "lig":
+            return _LIGATURES.get(m.group(), m.group())
+        if kind == "ent":
+            return _ENTITIES[m.group()]
+        if kind == "hyph":
+            # rejoin the line but keep the hyphen: 'self-\ngoverning' is 'self-governing'
+            return "-"
+        if kind == "rule":
+            return "---"
+        if kind == "ws":
+            return " "
+        if kind == "trail":
+            return ""
+        return "\n\n"
+
+    return _NORMALISE.sub(_replace, text)
+
+
+def _is_legacy_noise(line: str) -> bool:
+    """Sinhala/Tamil headings set in legacy fonts come through as symbol-heavy Latin noise."""
+    if _ENGLISH_HINT.search(line):
+        return False
+    words = line.split()
+    return len(words) >= 3 and len(_LEGACY_MARKERS.findall(line)) >= 2
+
+
+def minimise_text(text: str, min_repeats: int = 3) -> Tuple[str, dict]:
+    """
+    Strip page furniture from docling text before it is sent to the LLM.
+
+    - normalises ligatures, HTML entities, words hyphenated across lines
+      (rejoined, hyphen kept), whitespace runs and markdown table rules in
+      one pass;
+    - drops page-number lines (next to a masthead, or prefixed 'page') and
+      legacy-font Sinhala/Tamil heading noise;
+    - drops repeats of page furniture seen `min_repeats` or more times
+      (mastheads, and running headers like 'SCHEDULE (Contd.)' within
+      `_FURNITURE_WINDOW` lines of a masthead or page number), keeping the
+      first. Digits are ignored only when comparing mastheads, whose dates
+      change per page.
+
+    Content away from page breaks is never de-duplicated, and table rows,
+    list items, numbered items, column headings and anything mentioning a
+    column or minister are never dropped, so block splitting and extraction
+    see the same content. Returns (minimised_text, stats).
+    """
+    tokens_before = estimate_tokens(text)
+    normalised = _normalise(text)
+    lines = normalised.split("\n")
+
+    content = [i for i, l in enumerate(lines) if l.strip()]
+
+    def _window(pos):
+        return content[max(0, pos - _FURNITURE_WINDOW):pos + _FURNITURE_WINDOW + 1]
+
+    # a bare number is a page number only next to a masthead ('3A' above the
+    # running header) or when it says 'page'; elsewhere it may be an item number
+    near_masthead = set()
+    for pos, i in enumerate(content):
+        if _MASTHEAD.match(lines[i]):
+            near_masthead.update(_window(pos))
+    page_numbers = {
+        i for i in content
+        if _PAGE_NUMBER.match(lines[i].strip())
+        and (i in near_masthead or lines[i].strip().lower().startswith("page"))
+    }
+
+    # non-blank lines next to a page break (a masthead or page-number line)
+    near_break = set(near_masthead)
+    for pos, i in enumerate(content):
+        if i in page_numbers:
+            near_break.update(_window(pos))
+
+    def _furniture_key(i):
+        line = lines[i]
+        if i not in near_break or _PROTECTED.search(line):
+            return None
+        stripped = line.strip().lower()
+        return _DIGITS.sub("#", stripped) if _MASTHEAD.match(line) else stripped
+
+    keys = {i: _furniture_key(i) for i in near_break}
+    counts = Counter(k for k in keys.values() if k is not None)
+    seen = set()
+    kept = []
+    dropped = {"repeated": 0, "page_number": 0, "legacy_noise": 0}
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped or _PROTECTED.search(line):
+            kept.append(line)
+            continue
+        if i in page_numbers:
+            dropped["page_number"] += 1
+            continue
+        if _is_legacy_noise(stripped):
+            dropped["legacy_noise"] += 1
+            continue
+        key = keys.get(i)
+        if key is not None and counts[key] >= min_repeats:
+            if key in seen:
+                dropped["repeated"] += 1
+                continue
+            seen.add(key)
+        kept.append(line)
+
+    minimised = re.sub(r"\n{3,}", "\n\n", "\n".join(kept)).strip()
+    tokens_after = estimate_tokens(minimised)
+    stats = {
+        "chars_before": len(text),
+        "chars_after": len(minimised),
+        "tokens_before": tokens_before,
+        "tokens_after": tokens_after,
+        "lines_dropped": dropped,
+    }
+    return minimised, stats
+
+
+def format_stats(stats: dict) -> str:
+    before, after = stats["tokens_before"], stats["tokens_after"]
+    saved = 100.0 * (before - after) / before if before else 0.0
+    return f"{before} → {after} tokens (-{saved:.1f}%)"
@@ -0,0 +1,10 @@
+from .base import GraphStore
+from .neo4j_store import AsyncNeo4jReads, Neo4jGraphStore
+from .memory_store import MemoryGraphStore
+
+__all__ = [
+    "GraphStore",
+    "Neo4jGraphStore",
+    "AsyncNeo4jReads",
+    "MemoryGraphStore",
+]
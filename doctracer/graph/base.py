@@ -0,0 +1,119 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+
+class GraphStore(ABC):
+    """
+    The graph operations the loaders and the API depend on.
+
+    Loader methods take the rows the loaders already build (`build_table_rows`,
+    `normalize_changes`), so the same parsing and change-planning code runs
+    against every store. Read methods return plain dicts shaped like the
+    records of the corresponding Cypher queries in backend/api.py.
+    """
+
+    # -- loaders ------------------------------------------------------------
+
+    @abstractmethod
+    def write_base(self, data: dict, rows: dict, batch_size: int) -> int:
+        """Write a base gazette and its table rows. Returns the statements sent."""
+
+    @abstractmethod
+    def write_amendment(self, meta: dict, amend_id: str, parent_id: str, published_date, changes: list) -> dict:
+        """Apply an amendment's normalised changes. Returns the plan counts and `round_trips`."""
+
+    @abstractmethod
+    def retract_base(self, gazette_id: str) -> int:
+        """Delete the items a base gazette load wrote. Returns the number of nodes deleted."""
+
+    @abstractmethod
+    def retract_amendments(self, parent_ids: List[str], amend_ids: List[str]) -> dict:
+        """Undo a base gazette's amendment chain. Returns {"deleted", "reset"}."""
+
+    @abstractmethod
+    def data_version(self) -> int:
+        """Counter bumped after every committed write; 0 for a graph never written through a store."""
+
+    # -- structure snapshots ------------------------------------------------
+
+    @abstractmethod
+    def write_snapshots(self, snapshots: List[dict], version: int) -> int:
+        """
+        Store structure snapshots ({"gazette_id", "base_gazette_id", "structure",
+        "changes"}, see doctracer.structure) if the data version is still
+        `version`. Returns the number written (0 if the graph changed since).
+        Writes to a gazette or its base drop that gazette's snapshot.
+        """
+
+    @abstractmethod
+    def snapshot(self, gazette_id: str) -> Optional[dict]:
+        """The stored snapshot of a gazette, or None."""
+
+    # -- API reads ----------------------------------------------------------
+
+    @abstractmethod
+    def gazettes(self) -> List[dict]:
+        """Every base and amendment gazette, by published date."""
+
+    @abstractmethod
+    def gazette(self, gazette_id: str) -> Optional[dict]:
+        """A single base or amendment gazette (with its `president`, 'Unknown' if not recorded), or None."""
+
+    @abstractmethod
+    def amendments(self) -> List[dict]:
+        """
+        Every amendment gazette with its parent, number of tracked changes and
+        `change_counts` ({column: {"added", "removed", "updated"}}, None if
+        the amendment was loaded before counts were stored).
+        """
+
+    @abstractmethod
+    def amendment_parent(self, amend_id: str) -> Optional[str]:
+        """The base gazette an amendment is linked to, or None."""
+
+    @abstractmethod
+    def base_structure(self, gazette_id: str) -> Optional[List[dict]]:
+        """
+        Ministers of a base gazette as {"name", "number", "departments", "laws",
+        "functions"}, item names grouped by minister name. None if there is no
+        such base gazette.
+        """
+
+    @abstractmethod
+    def search_documents(self) -> List[dict]:
+        """
+        Every searchable name with where it occurs: {"type" ("minister",
+        "department", "function" or "law"), "name", "gazette_id",
+        "minister_name", "minister_number"}, for doctracer.search.
+        """
+
+    @abstractmethod
+    def amendment_change_rows(self, amend_id: str) -> Optional[List[Dict]]:
+        """
+        One row per item an amendment added or removed and each Minister it is
+        linked to. None if there is no such amendment gazette.
+        """
+
+    @abstractmethod
+    def evolution(self, date_from: Optional[str] = None, date_to: Optional[str] = None,
+                  offset: int = 0, limit: Optional[int] = None) -> List[dict]:
+        """
+        One row per gazette published between `date_from` and `date_to`
+        (inclusive ISO dates, either may be None), ordered by published date
+        then id and sliced by `offset`/`limit`: {"gazette_id", "published_date",
+        "parent_gazette_id", "labels", "ministers"}, each minister linked to the
+        gazette as {"name", "departments", "laws"}.
+        """
+
+    @abstractmethod
+    def gazette_count(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> int:
+        """Number of gazettes `evolution` would page through for these dates."""
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,596 @@
+import os
+import json
+import threading
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+from doctracer.graph.base import GraphStore
+
+_ITEM_LABELS = {"functions": ("Function", "HAS_FUNCTION"), "departments": ("Department", "OVERSEES_DEPARTMENT")}
+
+_CHANGE_LABELS = ("Function", "Department", "Law")
+
+# node properties with a value → nodes index, as in neo4j_schema's range indexes
+_INDEXED_PROPERTIES = ("added_by", "removed_by")
+
+_TRACKING_PROPERTIES = ("removed_by", "removed_on", "updated_by", "updated_on", "is_active")
+
+
+class _Node:
+    __slots__ = ("id", "label", "props", "out", "inc", "key")
+
+    def __init__(self, node_id: int, label: str, props: dict):
+        self.id = node_id
+        self.label = label
+        self.props = props
+        self.out: List["_Rel"] = []
+        self.inc: List["_Rel"] = []
+        self.key: Optional[tuple] = None
+
+
+class _Rel:
+    __slots__ = ("start", "type", "end", "props")
+
+    def __init__(self, start: _Node, rel_type: str, end: _Node, props: dict):
+        self.start = start
+        self.type = rel_type
+        self.end = end
+        self.props = props
+
+
+class MemoryGraphStore(GraphStore):
+    """
+    In-process graph that replays the Cypher loaders.
+
+    `write_base` follows table_to_neo4j (MERGE keys, ON CREATE/ON MATCH rules)
+    and `write_amendment` reuses the amendment engine's plan step, so nodes,
+    relationships and audit properties come out as the loaders would leave
+    them in Neo4j. Nodes are indexed on the keys the loaders and API match on:
+    MERGE keys (gazette_id, minister number, item number), label, gazette_id
+    and added_by/removed_by. All access is serialised by a lock, so parallel
+    loaders can share one store.
+    """
+
+    def __init__(self):
+        self._nodes: Dict[int, _Node] = {}
+        self._rels: Dict[_Rel, None] = {}
+        self._next_id = 0
+        self._merge_nodes: Dict[tuple, _Node] = {}
+        self._merge_rels: Dict[tuple, _Rel] = {}
+        self._by_label: Dict[str, Dict[int, _Node]] = {}
+        self._by_gazette: Dict[Tuple[str, str], Dict[int, _Node]] = {}
+        self._by_property: Dict[Tuple[str, object], Dict[int, _Node]] = {}
+        self._version = 0
+        self._snapshots: Dict[str, Tuple[str, str]] = {}  # gazette_id → (base_gazette_id, JSON)
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_json(cls, base_dir: Optional[str], amendment_dir: Optional[str]) -> "MemoryGraphStore":
+        """Replay every base gazette, then every amendment in published-date order."""
+        from doctracer.cli.base_index import index_for
+        from doctracer.cli.load_graph import scan_gazette_json
+        from doctracer.cli.amendment_to_neo4j import read_amendment
+
+        entries, paths = scan_gazette_json(base_dir, amendment_dir)
+        graph = cls()
+
+        for entry in entries:
+            if entry.kind == "base":
+                with open(paths[entry.gazette_id], "r", encoding="utf-8") as f:
+                    graph.load_base(json.load(f))
+
+        amendments = sorted((e for e in entries if e.kind == "amendment"),
+                            key=lambda e: (e.published_date or date.min, e.gazette_id))
+        for entry in amendments:
+            base_path = paths.get(entry.parent_id)
+            if not base_path and base_dir and os.path.isdir(base_dir):
+                base_path = index_for(base_dir).lookup(entry.parent_id)
+            graph.load_amendment(read_amendment(paths[entry.gazette_id], base_path or base_dir))
+        return graph
+
+    @property
+    def nodes(self) -> List[_Node]:
+        return list(self._nodes.values())
+
+    @property
+    def rels(self) -> List[_Rel]:
+        return list(self._rels)
+
+    # -- primitives ---------------------------------------------------------
+
+    def _index(self, node: _Node, prop: str, value, add: bool):
+        if value is None:
+            return
+        bucket = self._by_property.setdefault((prop, value), {})
+        if add:
+            bucket[node.id] = node
+        else:
+            bucket.pop(node.id, None)
+
+    def _create(self, label: str, props: dict) -> _Node:
+        node = _Node(self._next_id, label, {k: v for k, v in props.items() if v is not None})
+        self._next_id += 1
+        self._nodes[node.id] = node
+        self._by_label.setdefault(label, {})[node.id] = node
+        if "gazette_id" in node.props:
+            self._by_gazette.setdefault((label, node.props["gazette_id"]), {})[node.id] = node
+        for prop in _INDEXED_PROPERTIES:
+            self._index(node, prop, node.props.get(prop), True)
+        return node
+
+    def _merge(self, label: str, key: dict) -> Tuple[_Node, bool]:
+        """MERGE on `key`. Returns (node, created)."""
+        if any(v is None for v in key.values()):
+            raise ValueError(f"Cannot merge {label} using null property value: {key}")
+        index = (label,) + tuple(sorted(key.items()))
+        node = self._merge_nodes.get(index)
+        if node:
+            return node, False
+        node = self._merge_nodes[index] = self._create(label, key)
+        node.key = index
+        return node, True
+
+    def _relate(self, start: _Node, rel_type: str, end: _Node, props: Optional[dict] = None, merge=True) -> _Rel:
+        key = (start.id, rel_type, end.id)
+        if merge and key in self._merge_rels:
+            return self._merge_rels[key]
+        rel = _Rel(start, rel_type, end, dict(props or {}))
+        self._rels[rel] = None
+        start.out.append(rel)
+        end.inc.append(rel)
+        if merge:
+            self._merge_rels[key] = rel
+        return rel
+
+    def _set(self, target, **props):
+        for k, v in props.items():
+            if isinstance(target, _Node) and k in _INDEXED_PROPERTIES:
+                self._index(target, k, target.props.get(k), False)
+                self._index(target, k, v, True)
+            if v is None:
+                target.props.pop(k, None)
+            else:
+                target.props[k] = v
+
+    def _delete(self, node: _Node):
+        """DETACH DELETE."""
+        for rel in node.out + node.inc:
+            self._rels.pop(rel, None)
+            if rel.end is not node:
+                rel.end.inc.remove(rel)
+            if rel.start is not node:
+                rel.start.out.remove(rel)
+            key = (rel.start.id, rel.type, rel.end.id)
+            if self._merge_rels.get(key) is rel:
+                del self._merge_rels[key]
+        node.out, node.inc = [], []
+        if node.key:
+            self._merge_nodes.pop(node.key, None)
+        self._by_label[node.label].pop(node.id, None)
+        if "gazette_id" in node.props:
+            self._by_gazette[(node.label, node.props["gazette_id"])].pop(node.id, None)
+        for prop in _INDEXED_PROPERTIES:
+            self._index(node, prop, node.props.get(prop), False)
+        del self._nodes[node.id]
+
+    def _labelled(self, labels: Iterable[str]) -> List[_Node]:
+        return [n for label in labels for n in self._by_label.get(label, {}).values()]
+
+    # -- loaders ------------------------------------------------------------
+
+    def load_base(self, data: dict) -> int:
+        """Apply a base gazette JSON exactly as load_table_data would."""
+        from doctracer.cli.table_to_neo4j import build_table_rows
+        if not data.get("gazette_id"):
+            raise ValueError("Missing gazette_id in base JSON")
+        return self.write_base(data, build_table_rows(data))
+
+    def write_base(self, data: dict, rows: dict, batch_size: int = 0) -> int:
+        with self._lock:
+            self._write_base(data, rows)
+            self._after_write([data.get("gazette_id")])
+        return 0
+
+    def _write_base(self, data: dict, rows: dict):
+        gazette_id = data.get("gazette_id")
+        published_date = data.get("published_date")
+
+        base, _ = self._merge("BaseGazette", {"gazette_id": gazette_id})
+        self._set(base, published_date=published_date, published_by=data.get("published_by"),
+                  gazette_type=data.get("gazette_type"), language=data.get("language"),
+                  pdf_url=data.get("pdf_url"), president=data.get("president"))
+
+        for row in rows["ministers"]:
+            minister, _ = self._merge("Minister", {"number": row["minister_number"], "gazette_id": gazette_id})
+            self._set(minister, name=row["minister_name"])
+            self._relate(base, "HAS_MINISTER", minister)
+
+        created = {"created_in": gazette_id, "added_date": published_date}
+        for column, (label, rel) in _ITEM_LABELS.items():
+            for row in rows[f"{column}_numbered"]:
+                minister = self._merge_nodes[("Minister", ("gazette_id", gazette_id), ("number", row["minister_number"]))]
+                item, is_new = self._merge(label, {"item_number": row["item_number"],
+                                                   "minister_number": row["minister_number"],
+                                                   "gazette_id": gazette_id})
+                if is_new:
+                    self._set(item, name=row["item_name"], **created)
+                elif item.props.get("name") is None:
+                    self._set(item, name=row["item_name"])
+                self._relate(minister, rel, item)
+            for row in rows[f"{column}_named"]:
+                minister = self._merge_nodes[("Minister", ("gazette_id", gazette_id), ("number", row["minister_number"]))]
+                item, is_new = self._merge(label, {"name": row["item_name"], "gazette_id": gazette_id,
+                                                   "minister_ref": row["minister_number"]})
+                if is_new:
+                    self._set(item, **created)
+                self._relate(minister, rel, item)
+
+        for row in rows["laws"]:
+            minister = self._merge_nodes[("Minister", ("gazette_id", gazette_id), ("number", row["minister_number"]))]
+            law, is_new = self._merge("Law", {"name": row["law_name"], "minister_number": row["minister_number"],
+                                              "gazette_id": gazette_id})
+            if is_new:
+                self._set(law, **created)
+            self._relate(minister, "RESPONSIBLE_FOR_LAW", law)
+
+    def _base_minister(self, parent_id: str, number: str) -> Optional[_Node]:
+        minister = self._merge_nodes.get(("Minister", ("gazette_id", parent_id), ("number", number)))
+        base = self._merge_nodes.get(("BaseGazette", ("gazette_id", parent_id)))
+        if minister and base and (base.id, "HAS_MINISTER", minister.id) in self._merge_rels:
+            return minister
+        return None
+
+    def _lookup(self, parent_id: str, changes: list) -> list:
+        """In-memory version of the amendment engine's UNWIND lookup."""
+        from doctracer.cli.amendment_to_neo4j import change_key
+
+        matches, seen = [], set()
+        for change in changes:
+            key = change_key(change)
+            if key in seen:
+                continue
+            seen.add(key)
+            minister = self._base_minister(parent_id, change["minister_number"])
+            if not minister:
+                continue
+            found = {}
+            for rel in minister.out:
+                n = rel.end
+                if rel.type != change["rel"] or n.label != change["label"]:
+                    continue
+                if n.props.get("minister_number") != change["minister_number"] or n.props.get("gazette_id") != parent_id:
+                    continue
+                if change["item_number"] is not None:
+                    if n.props.get("item_number") != change["item_number"]:
+                        continue
+                elif n.props.get("name") != change["item_name"]:
+                    continue
+                found[n.id] = n
+            for node_id in sorted(found):
+                n = found[node_id]
+                matches.append({"key": key, "node_id": node_id, "name": n.props.get("name"),
+                                "is_active": n.props.get("is_active")})
+        return matches
+
+    def load_amendment(self, amendment: dict) -> dict:
+        """Apply the output of read_amendment exactly as load_amendment_data would."""
+        return self.write_amendment(amendment["meta"], amendment["gazette_id"], amendment["parent_id"],
+                                    amendment["published_date"], amendment["changes"])
+
+    def write_amendment(self, meta: dict, amend_id: str, parent_id: str, published_date, changes: list) -> dict:
+        with self._lock:
+            result = self._write_amendment(meta, amend_id, parent_id, published_date, changes)
+            self._after_write([amend_id])
+            return result
+
+    def _write_amendment(self, meta, amend_id, parent_id, published_date, changes) -> dict:
+        from doctracer.cli.amendment_to_neo4j import LABEL_MAP, REL_MAP, change_summary, plan_amendment
+
+        gazette, _ = self._merge("AmendmentGazette", {"gazette_id": amend_id})
+        self._set(gazette, published_date=published_date, published_by=meta.get("published_by"),
+                  gazette_type=meta.get("gazette_type"), language=meta.get("language"), pdf_url=meta.get("pdf_url"))
+        base, _ = self._merge("BaseGazette", {"gazette_id": parent_id})
+        link = self._relate(base, "AMENDED_BY", gazette)
+        self._set(link, date=published_date)
+
+        plan = plan_amendment(changes, self._lookup(parent_id, changes))
+
+        for row in plan["tracked"]:
+            minister = self._base_minister(parent_id, row["minister_number"])
+            node = self._nodes[row["node_id"]]
+            targets = [node] + [r for r in minister.out if r.end is node and r.type == row["rel"]]
+            for target in targets:
+                if row["removed"]:
+                    self._set(target, removed_by=amend_id, removed_on=published_date)
+                if row["updated"]:
+                    self._set(target, updated_by=amend_id, updated_on=published_date)
+                self._set(target, is_active=row["is_active"])
+
+        audit = {"added_by": amend_id, "added_on": published_date, "is_active": True}
+        for change in plan["creations"]:
+            number = change["minister_number"]
+            minister, is_new = self._merge("Minister", {"number": number, "gazette_id": amend_id})
+            if is_new:
+                base_minister = self._base_minister(parent_id, number)
+                # coalesce(bm.name, $minister_name, $minister_number)
+                candidates = [base_minister.props.get("name") if base_minister else None, change["minister_name"], number]
+                self._set(minister, name=next(c for c in candidates if c is not None))
+
+        # creations run one statement per column, in column order
+        for column in sorted(LABEL_MAP):
+            label, rel = LABEL_MAP[column], REL_MAP[column]
+            for change in plan["creations"]:
+                if change["label"] != label:
+                    continue
+                minister = self._merge_nodes[("Minister", ("gazette_id", amend_id), ("number", change["minister_number"]))]
+                item = self._create(label, {"minister_number": change["minister_number"], "name": change["item_name"],
+                                            "gazette_id": amend_id, **audit, "item_number": change["item_number"]})
+                self._relate(minister, rel, item, audit, merge=False)
+                self._relate(gazette, "ADDED_IN_AMENDMENT", item, audit, merge=False)
+
+        self._set(gazette, **change_summary(plan))
+        return {**plan["counts"], "round_trips": 0}
+
+    def retract_base(self, gazette_id: str) -> int:
+        with self._lock:
+            self._after_write([gazette_id])
+            deleted = 0
+            for label in ("Law", "Department", "Function", "Minister"):
+                for node in list(self._by_gazette.get((label, gazette_id), {}).values()):
+                    self._delete(node)
+                    deleted += 1
+            return deleted
+
+    def retract_amendments(self, parent_ids: List[str], amend_ids: List[str]) -> dict:
+        with self._lock:
+            self._after_write(list(parent_ids) + list(amend_ids))
+            deleted = 0
+            for label in ("Law", "Department", "Function", "Minister", "AmendmentGazette"):
+                for amend_id in amend_ids:
+                    for node in list(self._by_gazette.get((label, amend_id), {}).values()):
+                        self._delete(node)
+                        deleted += 1
+
+            reset = set()
+            for parent_id in parent_ids:
+                for base in self._by_gazette.get(("BaseGazette", parent_id), {}).values():
+                    for has_minister in base.out:
+                        minister = has_minister.end
+                        if has_minister.type != "HAS_MINISTER" or minister.props.get("gazette_id") != parent_id:
+                            continue
+                        for rel in minister.out:
+                            if rel.end.props.get("gazette_id") != parent_id:
+                                continue
+                            self._set(rel.end, **dict.fromkeys(_TRACKING_PROPERTIES))
+                            self._set(rel, **dict.fromkeys(_TRACKING_PROPERTIES))
+                            reset.add(rel.end.id)
+            return {"deleted": deleted, "reset": len(reset)}
+
+    def _after_write(self, gazette_ids: List[str]):
+        stale = set(gazette_ids)
+        for gazette_id, (base_id, _) in list(self._snapshots.items()):
+            if gazette_id in stale or base_id in stale:
+                del self._snapshots[gazette_id]
+        self._version += 1
+
+    def data_version(self) -> int:
+        with self._lock:
+            return self._version
+
+    # -- structure snapshots ------------------------------------------------
+
+    def write_snapshots(self, snapshots: List[dict], version: int) -> int:
+        with self._lock:
+            if version != self._version:
+                return 0
+            for s in snapshots:
+                # stored serialised, so callers can't mutate a stored snapshot
+                self._snapshots[s["gazette_id"]] = (s["base_gazette_id"], json.dumps(s))
+            return len(snapshots)
+
+    def snapshot(self, gazette_id: str) -> Optional[dict]:
+        with self._lock:
+            stored = self._snapshots.get(gazette_id)
+        return json.loads(stored[1]) if stored else None
+
+    # -- API reads ----------------------------------------------------------
+
+    @staticmethod
+    def _by_date(rows: List[dict]) -> List[dict]:
+        # ORDER BY published_date: nulls last
+        return sorted(rows, key=lambda r: (r["published_date"] is None, str(r["published_date"])))
+
+    def _parents(self, amendment: _Node) -> List[_Node]:
+        return [r.start for r in amendment.inc if r.type == "AMENDED_BY" and r.start.label == "BaseGazette"]
+
+    def gazettes(self) -> List[dict]:
+        with self._lock:
+            rows = [
+                {
+                    "gazette_id": g.props.get("gazette_id"),
+                    "published_date": g.props.get("published_date"),
+                    "parent_gazette_id": g.props.get("parent_gazette_id"),
+                    "president": g.props.get("president", "Unknown"),
+                    "labels": [g.label],
+                }
+                for g in self._labelled(("BaseGazette", "AmendmentGazette"))
+            ]
+        return self._by_date(rows)
+
+    def gazette(self, gazette_id: str) -> Optional[dict]:
+        with self._lock:
+            for label in ("BaseGazette", "AmendmentGazette"):
+                for g in self._by_gazette.get((label, gazette_id), {}).values():
+                    return {
+                        "gazette_id": g.props.get("gazette_id"),
+                        "published_date": g.props.get("published_date"),
+                        "parent_gazette_id": g.props.get("parent_gazette_id"),
+                        "president": g.props.get("president") or "Unknown",
+                        "labels": [g.label],
+                    }
+        return None
+
+    def _changed_by(self, amend_id: str) -> List[_Node]:
+        found = {}
+        for prop in _INDEXED_PROPERTIES:
+            for node in self._by_property.get((prop, amend_id), {}).values():
+                if node.label in _CHANGE_LABELS:
+                    found[node.id] = node
+        return list(found.values())
+
+    def amendments(self) -> List[dict]:
+        from doctracer.cli.amendment_to_neo4j import CHANGE_KINDS, COLUMN_NAMES
+        with self._lock:
+            rows = []
+            for a in self._labelled(("AmendmentGazette",)):
+                change_count = a.props.get("change_count")
+                change_counts = None
+                if change_count is None:
+                    change_count = len(self._changed_by(a.props["gazette_id"]))
+                else:
+                    change_counts = {
+                        name: {kind: a.props.get(f"{name}_{kind}") for kind in CHANGE_KINDS}
+                        for name in COLUMN_NAMES.values()
+                    }
+                for b in self._parents(a) or [None]:
+                    president = a.props.get("president") or (b.props.get("president") if b else None)
+                    rows.append({
+                        "gazette_id": a.props["gazette_id"],
+                        "published_date": a.props.get("published_date"),
+                        "parent_gazette_id": b.props.get("gazette_id") if b else None,
+                        "president": president or "Unknown",
+                        "change_count": change_count,
+                        "change_counts": change_counts,
+                    })
+        return self._by_date(rows)
+
+    def amendment_parent(self, amend_id: str) -> Optional[str]:
+        with self._lock:
+            for a in self._by_gazette.get(("AmendmentGazette", amend_id), {}).values():
+                parents = self._parents(a)
+                return parents[0].props.get("gazette_id") if parents else None
+        return None
+
+    def base_structure(self, gazette_id: str) -> Optional[List[dict]]:
+        columns = (("departments", "OVERSEES_DEPARTMENT", "Department"),
+                   ("laws", "RESPONSIBLE_FOR_LAW", "Law"),
+                   ("functions", "HAS_FUNCTION", "Function"))
+        with self._lock:
+            bases = list(self._by_gazette.get(("BaseGazette", gazette_id), {}).values())
+            if not bases:
+                return None
+            ministers = {r.end.id: r.end for b in bases for r in b.out
+                         if r.type == "HAS_MINISTER" and r.end.label == "Minister"}
+
+            # grouped by minister name, like the Cypher aggregation
+            items: Dict[str, Dict[str, list]] = {column: {} for column, _, _ in columns}
+            for m in ministers.values():
+                for column, rel_type, label in columns:
+                    names = items[column].setdefault(m.props.get("name"), [])
+                    for r in m.out:
+                        name = r.end.props.get("name")
+                        if r.type == rel_type and r.end.label == label and name is not None and name not in names:
+                            names.append(name)
+
+            rows, seen = [], set()
+            for m in ministers.values():
+                name, number = m.props.get("name"), m.props.get("number")
+                if (name, number) in seen:
+                    continue
+                seen.add((name, number))
+                rows.append({"name": name, "number": number,
+                             **{column: list(items[column][name]) for column, _, _ in columns}})
+        return rows
+
+    def _dated(self, date_from: Optional[str], date_to: Optional[str]) -> List[_Node]:
+        # a null published_date only passes when there is no filter, as in Cypher
+        def _in_range(date_value):
+            if date_from is None and date_to is None:
+                return True
+            return (date_value is not None and (date_from is None or str(date_value) >= date_from)
+                    and (date_to is None or str(date_value) <= date_to))
+
+        gazettes = [g for g in self._labelled(("BaseGazette", "AmendmentGazette"))
+                    if _in_range(g.props.get("published_date"))]
+        return sorted(gazettes, key=lambda g: (g.props.get("published_date") is None,
+                                               str(g.props.get("published_date")), g.props.get("gazette_id")))
+
+    def evolution(self, date_from: Optional[str] = None, date_to: Optional[str] = None,
+                  offset: int = 0, limit: Optional[int] = None) -> List[dict]:
+        columns = (("departments", "OVERSEES_DEPARTMENT", "Department"), ("laws", "RESPONSIBLE_FOR_LAW", "Law"))
+        with self._lock:
+            page = self._dated(date_from, date_to)[offset:None if limit is None else offset + limit]
+            rows = []
+            for g in page:
+                linked = {r.end.id: r.end for r in g.out if r.end.label == "Minister"}
+                linked.update({r.start.id: r.start for r in g.inc if r.start.label == "Minister"})
+                ministers = []
+                for m in linked.values():
+                    minister = {"name": m.props.get("name")}
+                    for column, rel_type, label in columns:
+                        names = {r.end.props.get("name") for r in m.out if r.type == rel_type and r.end.label == label}
+                        minister[column] = sorted(n for n in names if n is not None)
+                    ministers.append(minister)
+                rows.append({
+                    "gazette_id": g.props.get("gazette_id"),
+                    "published_date": g.props.get("published_date"),
+                    "parent_gazette_id": g.props.get("parent_gazette_id"),
+                    "labels": [g.label],
+                    "ministers": ministers,
+                })
+        return rows
+
+    def gazette_count(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> int:
+        with self._lock:
+            return len(self._dated(date_from, date_to))
+
+    def search_documents(self) -> List[dict]:
+        types = {"HAS_FUNCTION": "function", "OVERSEES_DEPARTMENT": "department", "RESPONSIBLE_FOR_LAW": "law"}
+        documents = []
+        with self._lock:
+            for m in self._labelled(("Minister",)):
+                minister = {"minister_name": m.props.get("name"), "minister_number": m.props.get("number")}
+                if minister["minister_name"]:
+                    documents.append({"type": "minister", "name": minister["minister_name"],
+                                      "gazette_id": m.props.get("gazette_id"), **minister})
+                for r in m.out:
+                    if r.type in types and r.end.label in _CHANGE_LABELS and r.end.props.get("name") is not None:
+                        documents.append({"type": types[r.type], "name": r.end.props["name"],
+                                          "gazette_id": r.end.props.get("gazette_id"), **minister})
+        return documents
+
+    def amendment_change_rows(self, amend_id: str) -> Optional[List[Dict]]:
+        with self._lock:
+            if not self._by_gazette.get(("AmendmentGazette", amend_id)):
+                return None
+            rows = []
+            for n in self._changed_by(amend_id):
+                row = {
+                    "node_labels": [n.label],
+                    "node_name": n.props.get("name"),
+                    "description": n.props.get("description"),
+                    "item_number": n.props.get("item_number"),
+                    "added_by": n.props.get("added_by"),
+                    "removed_by": n.props.get("removed_by"),
+                }
+                links = [(r.start if r.end is n else r.end, r) for r in n.inc + n.out]
+                links = [(m, r) for m, r in links if m.label == "Minister"]
+                for m, r in links or [(None, None)]:
+                    rows.append({
+                        **row,
+                        "minister_name": m.props.get("name") if m else None,
+                        "minister_number": m.props.get("number") if m else None,
+                        "rel_type": r.type if r else None,
+                    })
+            return rows
+
+    # -- stats --------------------------------------------------------------
+
+    def counts(self) -> Dict[str, int]:
+        """Node counts per label and relationship counts per type."""
+        result: Dict[str, int] = {}
+        with self._lock:
+            for node in self._nodes.values():
+                result[node.label] = result.get(node.label, 0) + 1
+            for rel in self._rels:
+                result[rel.type] = result.get(rel.type, 0) + 1
+        return dict(sorted(result.items()))
@@ -0,0 +1,352 @@
+import json
+from typing import Dict, List, Optional
+from doctracer.graph.base import GraphStore
+from doctracer.query_stats import timed_run
+
+_GAZETTES_QUERY = """
+MATCH (g)
+WHERE g:BaseGazette OR g:AmendmentGazette
+RETURN g.gazette_id AS gazette_id,
+       g.published_date AS published_date,
+       coalesce(properties(g)['parent_gazette_id'], null) AS parent_gazette_id,
+       coalesce(g.president, 'Unknown') AS president,
+       labels(g) AS labels
+ORDER BY published_date
+"""
+
+_GAZETTE_QUERY = """
+MATCH (g)
+WHERE (g:BaseGazette OR g:AmendmentGazette) AND g.gazette_id = $gazette_id
+RETURN g.gazette_id AS gazette_id,
+       g.published_date AS published_date,
+       coalesce(properties(g)['parent_gazette_id'], null) AS parent_gazette_id,
+       coalesce(g.president, 'Unknown') AS president,
+       labels(g) AS labels
+LIMIT 1
+"""
+
+# Counts are stored on the amendment when it loads; amendments loaded before
+# that fall back to counting their item nodes.
+_AMENDMENTS_QUERY = """
+MATCH (a:AmendmentGazette)
+OPTIONAL MATCH (a)<-[:AMENDED_BY]-(b:BaseGazette)
+RETURN a.gazette_id AS gazette_id,
+       a.published_date AS published_date,
+       b.gazette_id AS parent_gazette_id,
+       coalesce(a.president, b.president, 'Unknown') AS president,
+       CASE WHEN a.change_count IS NULL THEN COUNT {
+           MATCH (n)
+           WHERE (n:Function OR n:Department OR n:Law)
+             AND (n.added_by = a.gazette_id OR n.removed_by = a.gazette_id)
+       } ELSE a.change_count END AS change_count,
+       CASE WHEN a.change_count IS NULL THEN null ELSE {
+           functions: {added: a.functions_added, removed: a.functions_removed, updated: a.functions_updated},
+           departments: {added: a.departments_added, removed: a.departments_removed, updated: a.departments_updated},
+           laws: {added: a.laws_added, removed: a.laws_removed, updated: a.laws_updated}
+       } END AS change_counts
+ORDER BY a.published_date
+"""
+
+_AMENDMENT_PARENT_QUERY = """
+MATCH (a:AmendmentGazette {gazette_id: $amendment_id})
+OPTIONAL MATCH (a)<-[:AMENDED_BY]-(b:BaseGazette)
+RETURN a, b.gazette_id as parent_id
+"""
+
+# The whole minister tree in one round-trip: each minister's items come from
+# COLLECT subqueries anchored on that minister, robust to the Base* label variants.
+_BASE_STRUCTURE_QUERY = """
+MATCH (g:BaseGazette {gazette_id: $gazette_id})
+RETURN COLLECT {
+    MATCH (g)-[:HAS_MINISTER]->(m)
+    WHERE m:BaseMinister OR m:Minister
+    WITH DISTINCT m
+    RETURN {
+        name: m.name,
+        number: m.number,
+        departments: COLLECT {
+            MATCH (m)-[:OVERSEES_DEPARTMENT]->(n)
+            WHERE (n:BaseDepartment OR n:Department) AND n.name IS NOT NULL
+            RETURN DISTINCT n.name
+        },
+        laws: COLLECT {
+            MATCH (m)-[:RESPONSIBLE_FOR_LAW]->(n)
+            WHERE (n:BaseLaw OR n:Law) AND n.name IS NOT NULL
+            RETURN DISTINCT n.name
+        },
+        functions: COLLECT {
+            MATCH (m)-[:HAS_FUNCTION]->(n)
+            WHERE (n:BaseFunction OR n:Function) AND n.name IS NOT NULL
+            RETURN DISTINCT n.name
+        }
+    }
+} AS ministers
+"""
+
+_ITEM_COLUMNS = ("departments", "laws", "functions")
+
+# every Minister with its item names, for the search index
+_SEARCH_DOCUMENTS_QUERY = """
+MATCH (m:Minister)
+RETURN m.gazette_id AS gazette_id, m.name AS minister_name, m.number AS minister_number,
+       COLLECT {
+           MATCH (m)-[:HAS_FUNCTION|OVERSEES_DEPARTMENT|RESPONSIBLE_FOR_LAW]->(n)
+           WHERE n.name IS NOT NULL AND (n:Function OR n:Department OR n:Law)
+           RETURN {
+               type: CASE WHEN n:Function THEN 'function' WHEN n:Department THEN 'department' ELSE 'law' END,
+               name: n.name,
+               gazette_id: n.gazette_id
+           }
+       } AS items
+"""
+
+_CHANGE_ROWS_QUERY = """
+MATCH (n)
+WHERE (n:Function OR n:Department OR n:Law)
+  AND (n.added_by = $gazette_id OR n.removed_by = $gazette_id)
+OPTIONAL MATCH (m)-[r]-(n)
+WHERE m:Minister
+RETURN labels(n) as node_labels,
+       n.name as node_name,
+       n.description as description,
+       n.item_number as item_number,
+       n.added_by as added_by,
+       n.removed_by as removed_by,
+       m.name as minister_name,
+       m.number as minister_number,
+       type(r) as rel_type
+"""
+_DATE_FILTER = """
+MATCH (g)
+WHERE (g:BaseGazette OR g:AmendmentGazette)
+  AND ($date_from IS NULL OR g.published_date >= $date_from)
+  AND ($date_to IS NULL OR g.published_date <= $date_to)
+"""
+
+# One row per gazette: each minister's departments and laws are collected in
+# their own subquery instead of one OPTIONAL MATCH chain, which returned
+# departments x laws rows per minister.
+_EVOLUTION_QUERY = _DATE_FILTER + """
+WITH g ORDER BY g.published_date, g.gazette_id
+SKIP $offset %(limit)s
+RETURN g.gazette_id AS gazette_id,
+       g.published_date AS published_date,
+       properties(g)['parent_gazette_id'] AS parent_gazette_id,
+       labels(g) AS labels,
+       COLLECT {
+           MATCH (g)--(m)
+           WHERE m:BaseMinister OR m:AmendmentMinister OR m:Minister
+           WITH DISTINCT m
+           RETURN {
+               name: m.name,
+               departments: COLLECT {
+                   MATCH (m)-[:OVERSEES_DEPARTMENT]->(d)
+                   WHERE (d:BaseDepartment OR d:AmendmentDepartment OR d:Department) AND d.name IS NOT NULL
+                   RETURN DISTINCT d.name
+               },
+               laws: COLLECT {
+                   MATCH (m)-[:RESPONSIBLE_FOR_LAW]->(l)
+                   WHERE (l:BaseLaw OR l:AmendmentLaw OR l:Law) AND l.name IS NOT NULL
+                   RETURN DISTINCT l.name
+               }
+           }
+       } AS ministers
+ORDER BY published_date, gazette_id
+"""
+
+_GAZETTE_COUNT_QUERY = _DATE_FILTER + "RETURN count(g) AS total"
+
+# Runs after every committed write: bumps the counter API caches validate
+# against and drops the structure snapshots the write made stale (the written
+# gazettes' and those built on them), in one short transaction. The version
+# node is locked first, as in _WRITE_SNAPSHOTS_QUERY, so the two serialise.
+_AFTER_WRITE_QUERY = """
+MERGE (v:DataVersion {id: 'graph'})
+SET v.version = coalesce(v.version, 0) + 1, v.updated_on = datetime()
+WITH v
+OPTIONAL MATCH (s:StructureSnapshot)
+WHERE s.gazette_id IN $gazette_ids OR s.base_gazette_id IN $gazette_ids
+DETACH DELETE s
+"""
+
+_VERSION_QUERY = "MATCH (v:DataVersion {id: 'graph'}) RETURN v.version AS version"
+
+# Takes the version node's write lock before comparing, so an _AFTER_WRITE_QUERY
+# can't bump the version (and drop snapshots) between the check and the MERGE.
+_WRITE_SNAPSHOTS_QUERY = """
+MERGE (v:DataVersion {id: 'graph'})
+SET v.snapshot_lock = true
+WITH v
+WHERE coalesce(v.version, 0) = $version
+UNWIND $rows AS row
+MERGE (s:StructureSnapshot {gazette_id: row.gazette_id})
+SET s.base_gazette_id = row.base_gazette_id, s.structure = row.structure, s.changes = row.changes,
+    s.computed_on = datetime()
+RETURN count(s) AS written
+"""
+
+_SNAPSHOT_QUERY = """
+MATCH (s:StructureSnapshot {gazette_id: $gazette_id})
+RETURN s.gazette_id AS gazette_id, s.base_gazette_id AS base_gazette_id, s.structure AS structure, s.changes AS changes
+"""
+
+
+def _after_write(tx, gazette_ids: List[str]):
+    timed_run(tx, "store.after_write", _AFTER_WRITE_QUERY, gazette_ids=gazette_ids)
+
+
+class Neo4jGraphStore(GraphStore):
+    """GraphStore over a Neo4j driver, running the loaders' Cypher unchanged."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def close(self):
+        self.driver.close()
+
+    def _read(self, name: str, query: str, **params) -> List[dict]:
+        with self.driver.session() as session:
+            return timed_run(session, name, query, **params).data()
+
+    # -- loaders ------------------------------------------------------------
+
+    def write_base(self, data: dict, rows: dict, batch_size: int) -> int:
+        from doctracer.cli.table_to_neo4j import _write_table
+        with self.driver.session() as session:
+            # managed transaction: retried as a whole on deadlocks/transient errors
+            statements = session.execute_write(_write_table, data, rows, batch_size)
+            # its own short transaction, after the load commits, so parallel
+            # loaders don't hold the version node's lock for a whole load
+            session.execute_write(_after_write, [data.get("gazette_id")])
+            return statements
+
+    def write_amendment(self, meta: dict, amend_id: str, parent_id: str, published_date, changes: list) -> dict:
+        from doctracer.cli.amendment_to_neo4j import _write_amendment
+        with self.driver.session() as session:
+            result = session.execute_write(_write_amendment, meta, amend_id, parent_id, published_date, changes)
+            session.execute_write(_after_write, [amend_id])
+            return result
+
+    def retract_base(self, gazette_id: str) -> int:
+        from doctracer.cli.table_to_neo4j import _retract_table
+        with self.driver.session() as session:
+            result = session.execute_write(_retract_table, gazette_id)
+            session.execute_write(_after_write, [gazette_id])
+            return result
+
+    def retract_amendments(self, parent_ids: List[str], amend_ids: List[str]) -> dict:
+        from doctracer.cli.amendment_to_neo4j import _retract_amendments
+        with self.driver.session() as session:
+            result = session.execute_write(_retract_amendments, list(parent_ids), list(amend_ids))
+            session.execute_write(_after_write, list(parent_ids) + list(amend_ids))
+            return result
+
+    def data_version(self) -> int:
+        rows = self._read("store.data_version", _VERSION_QUERY)
+        return rows[0]["version"] if rows else 0
+
+    # -- structure snapshots ------------------------------------------------
+
+    def write_snapshots(self, snapshots: List[dict], version: int) -> int:
+        rows = [
+            {**s, "structure": json.dumps(s["structure"]),
+             "changes": None if s["changes"] is None else json.dumps(s["changes"])}
+            for s in snapshots
+        ]
+        with self.driver.session() as session:
+            return session.execute_write(
+                lambda tx: timed_run(tx, "store.write_snapshots", _WRITE_SNAPSHOTS_QUERY,
+                                     rows=rows, version=version).single()["written"]
+            )
+
+    def snapshot(self, gazette_id: str) -> Optional[dict]:
+        rows = self._read("store.snapshot", _SNAPSHOT_QUERY, gazette_id=gazette_id)
+        if not rows:
+            return None
+        row = rows[0]
+        return {**row, "structure": json.loads(row["structure"]),
+                "changes": None if row["changes"] is None else json.loads(row["changes"])}
+
+    # -- API reads ----------------------------------------------------------
+
+    def gazettes(self) -> List[dict]:
+        return self._read("store.gazettes", _GAZETTES_QUERY)
+
+    def gazette(self, gazette_id: str) -> Optional[dict]:
+        rows = self._read("store.gazette", _GAZETTE_QUERY, gazette_id=gazette_id)
+        return rows[0] if rows else None
+
+    def amendments(self) -> List[dict]:
+        return self._read("store.amendments", _AMENDMENTS_QUERY)
+
+    def amendment_parent(self, amend_id: str) -> Optional[str]:
+        with self.driver.session() as session:
+            record = timed_run(session, "store.amendment_parent", _AMENDMENT_PARENT_QUERY, amendment_id=amend_id).single()
+        return record["parent_id"] if record else None
+
+    def base_structure(self, gazette_id: str) -> Optional[List[dict]]:
+        rows = self._read("store.base_structure", _BASE_STRUCTURE_QUERY, gazette_id=gazette_id)
+        if not rows:
+            return None
+
+        # item names are grouped by minister name, one entry per (name, number)
+        items: Dict[str, Dict[str, dict]] = {column: {} for column in _ITEM_COLUMNS}
+        ministers: Dict[tuple, dict] = {}
+        for m in rows[0]["ministers"]:
+            ministers.setdefault((m["name"], m["number"]), m)
+            for column in _ITEM_COLUMNS:
+                items[column].setdefault(m["name"], {}).update(dict.fromkeys(m[column]))
+
+        return [
+            {"name": name, "number": number, **{column: list(items[column][name]) for column in _ITEM_COLUMNS}}
+            for name, number in ministers
+        ]
+
+    def evolution(self, date_from: Optional[str] = None, date_to: Optional[str] = None,
+                  offset: int = 0, limit: Optional[int] = None) -> List[dict]:
+        query = _EVOLUTION_QUERY % {"limit": "" if limit is None else "LIMIT $limit"}
+        return self._read("store.evolution", query, date_from=date_from, date_to=date_to,
+                          offset=offset, limit=limit)
+
+    def gazette_count(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> int:
+        return self._read("store.gazette_count", _GAZETTE_COUNT_QUERY, date_from=date_from, date_to=date_to)[0]["total"]
+
+    def search_documents(self) -> List[dict]:
+        documents = []
+        for row in self._read("store.search_documents", _SEARCH_DOCUMENTS_QUERY):
+            minister = {"minister_name": row["minister_name"], "minister_number": row["minister_number"]}
+            if row["minister_name"]:
+                documents.append({"type": "minister", "name": row["minister_name"], "gazette_id": row["gazette_id"],
+                                  **minister})
+            documents += [{**item, **minister} for item in row["items"]]
+        return documents
+
+    def amendment_change_rows(self, amend_id: str) -> Optional[List[Dict]]:
+        with self.driver.session() as session:
+            if not timed_run(session, "store.amendment_exists", "MATCH (a:AmendmentGazette {gazette_id: $gazette_id}) RETURN a",
+                             gazette_id=amend_id).single():
+                return None
+            return timed_run(session, "store.amendment_changes", _CHANGE_ROWS_QUERY, gazette_id=amend_id).data()
+
+
+class AsyncNeo4jReads:
+    """
+    Neo4jGraphStore's listing reads on an AsyncNeo4jInterface (for the ASGI
+    app): the same statements, QUERY_STATS names and row shapes, awaited on
+    the async driver instead of holding a thread.
+    """
+
+    def __init__(self, neo4j):
+        self.neo4j = neo4j
+
+    async def close(self):
+        await self.neo4j.close()
+
+    async def _read(self, name: str, query: str, **params) -> List[dict]:
+        return [record.data() for record in await self.neo4j.execute_query(query, params, name=name)]
+
+    async def gazettes(self) -> List[dict]:
+        return await self._read("store.gazettes", _GAZETTES_QUERY)
+
+    async def amendments(self) -> List[dict]:
+        return await self._read("store.amendments", _AMENDMENTS_QUERY)
@@ -0,0 +1,15 @@
+from .manifest import ManifestEntry, load_manifest, load_dependencies, normalize_gazette_id
+from .fetch import PdfFetcher, FetchResult
+from .scheduler import run_dag
+from .pipeline import IngestPipeline
+
+__all__ = [
+    "ManifestEntry",
+    "load_manifest",
+    "load_dependencies",
+    "normalize_gazette_id",
+    "PdfFetcher",
+    "FetchResult",
+    "run_dag",
+    "IngestPipeline",
+]
@@ -0,0 +1,116 @@
+import os
+import json
+import logging
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+import requests
+
+_log = logging.getLogger(__name__)
+
+
+class FetchResult:
+    def __init__(self, name: str, path: Optional[Path], status: str, error: Optional[str] = None):
+        self.name = name
+        self.path = path
+        # 'local' | 'downloaded' | 'not_modified' | 'missing' | 'error'
+        self.status = status
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.path is not None
+
+    def __repr__(self):
+        return f"FetchResult({self.name!r}, status={self.status!r})"
+
+
+class PdfFetcher:
+    """
+    Resolve gazette PDFs from local directories, falling back to downloading
+    them into `cache_dir`.
+
+    Downloads are revalidated with conditional GETs: the ETag / Last-Modified
+    of every cached file is kept in a `<name>.pdf.meta.json` sidecar and sent
+    back as If-None-Match / If-Modified-Since, so an unchanged PDF costs one
+    304 round-trip instead of a full download.
+    """
+
+    def __init__(self, cache_dir: str, search_dirs: Iterable[str] = (), timeout: float = 60.0,
+                 revalidate: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        self.revalidate = revalidate
+        self._local = threading.local()
+        self._local_index = self._index_local(search_dirs)
+
+    @staticmethod
+    def _index_local(search_dirs: Iterable[str]) -> Dict[str, Path]:
+        index = {}
+        for d in search_dirs:
+            for root, _, files in os.walk(d):
+                for fname in files:
+                    if fname.lower().endswith(".pdf"):
+                        index.setdefault(fname, Path(root) / fname)
+        return index
+
+    def _session(self) -> requests.Session:
+        # requests.Session is not guaranteed thread-safe; keep one per worker thread
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def fetch(self, name: str, url: Optional[str]) -> FetchResult:
+        """Return the local path of `name` (e.g. '2289-43_E.pdf'), downloading `url` if needed."""
+        if name in self._local_index:
+            return FetchResult(name, self._local_index[name], "local")
+
+        target = self.cache_dir / name
+        meta_path = target.with_name(target.name + ".meta.json")
+        if not url:
+            if target.exists():
+                return FetchResult(name, target, "not_modified")
+            return FetchResult(name, None, "missing", "no URL in manifest and no local copy")
+
+        headers = {}
+        if target.exists() and meta_path.exists():
+            if not self.revalidate:
+                return FetchResult(name, target, "not_modified")
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        # write to a temp file first so an interrupted download never looks cached
+        tmp = target.with_name(target.name + ".part")
+        try:
+            with self._session().get(url, headers=headers, timeout=self.timeout, stream=True) as resp:
+                if resp.status_code == 304:
+                    return FetchResult(name, target, "not_modified")
+                resp.raise_for_status()
+
+                with open(tmp, "wb") as f:
+                    for chunk in resp.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+                os.replace(tmp, target)
+                meta_path.write_text(json.dumps({
+                    "url": url,
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                }), encoding="utf-8")
+            return FetchResult(name, target, "downloaded")
+        except requests.RequestException as e:
+            tmp.unlink(missing_ok=True)
+            if target.exists():
+                _log.warning(f"Revalidation of {name} failed ({e}); using cached copy")
+                return FetchResult(name, target, "not_modified")
+            return FetchResult(name, None, "error", str(e))
+
+    def fetch_all(self, items: List[Tuple[str, Optional[str]]], workers: int = 8) -> Dict[str, FetchResult]:
+        """Fetch (name, url) pairs concurrently. Returns name → FetchResult."""
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            results = pool.map(lambda item: self.fetch(*item), items)
+            return {r.name: r for r in results}
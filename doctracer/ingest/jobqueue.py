@@ -0,0 +1,330 @@
+import os
+import time
+import socket
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+_log = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    pdf_path      TEXT NOT NULL,
+    processor     TEXT NOT NULL,
+    output_path   TEXT NOT NULL,
+    status        TEXT NOT NULL DEFAULT 'pending',
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    max_attempts  INTEGER NOT NULL DEFAULT 3,
+    available_at  REAL NOT NULL DEFAULT 0,
+    lease_owner   TEXT,
+    lease_expires REAL,
+    last_error    TEXT,
+    created_at    REAL NOT NULL,
+    updated_at    REAL NOT NULL,
+    UNIQUE (pdf_path, processor)
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, available_at);
+"""
+
+
+class Job:
+    def __init__(self, row: sqlite3.Row):
+        self.id = row["id"]
+        self.pdf_path = row["pdf_path"]
+        self.processor = row["processor"]
+        self.output_path = row["output_path"]
+        self.attempts = row["attempts"]
+        self.max_attempts = row["max_attempts"]
+
+    def __repr__(self):
+        return f"Job({self.id}, {self.pdf_path!r}, attempt={self.attempts})"
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+class JobQueue:
+    """
+    Durable extraction job queue in a single SQLite file.
+
+    Workers on any host that can see the file claim jobs under a lease; a
+    worker that dies stops heartbeating, its lease expires and the job is
+    picked up again by someone else. Failed jobs are retried with exponential
+    backoff up to `max_attempts`.
+
+    The database uses the rollback journal (not WAL) because WAL needs shared
+    memory that network filesystems do not provide; every claim runs inside a
+    `BEGIN IMMEDIATE` transaction, so two workers can never take the same job.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 300.0, backoff_seconds: float = 30.0):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.backoff_seconds = backoff_seconds
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.execute("PRAGMA busy_timeout=60000")
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            # BEGIN itself may have failed (e.g. still locked after busy_timeout)
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def submit(self, pdf_path: str, processor: str, output_path: str, max_attempts: int = 3) -> bool:
+        """Enqueue a job. Returns False if the same (pdf, processor) job already exists."""
+        now = time.time()
+        with self._transaction() as conn:
+            cur = conn.execute(
+                """
+                INSERT OR IGNORE INTO jobs (pdf_path, processor, output_path, max_attempts, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (os.path.abspath(pdf_path), processor, os.path.abspath(output_path), max_attempts, now, now),
+            )
+            return cur.rowcount == 1
+
+    def claim(self, worker_id: str) -> Optional[Job]:
+        """Lease the next runnable job (pending, or running with an expired lease)."""
+        now = time.time()
+        with self._transaction() as conn:
+            # jobs whose worker died on their last allowed attempt are given up on
+            conn.execute(
+                """
+                UPDATE jobs SET status = 'failed', lease_owner = NULL, updated_at = ?,
+                       last_error = coalesce(last_error, 'lease expired')
+                WHERE status = 'running' AND lease_expires < ? AND attempts >= max_attempts
+                """,
+                (now, now),
+            )
+            row = conn.execute(
+                """
+                SELECT * FROM jobs
+                WHERE (status = 'pending' AND available_at <= ?)
+                   OR (status = 'running' AND lease_expires < ?)
+                ORDER BY available_at, id
+                LIMIT 1
+                """,
+                (now, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                """
+                UPDATE jobs SET status = 'running', attempts = attempts + 1,
+                       lease_owner = ?, lease_expires = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (worker_id, now + self.lease_seconds, now, row["id"]),
+            )
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+            return Job(row)
+
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """Extend the lease. Returns False if the lease was lost to another worker."""
+        now = time.time()
+        with self._transaction() as conn:
+            cur = conn.execute(
+                """
+                UPDATE jobs SET lease_expires = ?, updated_at = ?
+                WHERE id = ? AND lease_owner = ? AND status = 'running'
+                """,
+                (now + self.lease_seconds, now, job_id, worker_id),
+            )
+            return cur.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            cur = conn.execute(
+                """
+                UPDATE jobs SET status = 'done', lease_owner = NULL, lease_expires = NULL,
+                       last_error = NULL, updated_at = ?
+                WHERE id = ? AND lease_owner = ?
+                """,
+                (now, job_id, worker_id),
+            )
+            return cur.rowcount == 1
+
+    def fail(self, job_id: int, worker_id: str, error: str):
+        """Record a failed attempt; the job is retried with backoff until max_attempts."""
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND lease_owner = ?",
+                (job_id, worker_id),
+            ).fetchone()
+            if row is None:
+                return
+            if row["attempts"] >= row["max_attempts"]:
+                status, available_at = "failed", now
+            else:
+                status, available_at = "pending", now + self.backoff_seconds * (2 ** (row["attempts"] - 1))
+            conn.execute(
+                """
+                UPDATE jobs SET status = ?, available_at = ?, lease_owner = NULL, lease_expires = NULL,
+                       last_error = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (status, available_at, error[:2000], now, job_id),
+            )
+
+    def requeue_failed(self) -> int:
+        """Reset failed jobs so they are attempted again."""
+        now = time.time()
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET status = 'pending', attempts = 0, available_at = 0, last_error = NULL, updated_at = ? "
+                "WHERE status = 'failed'",
+                (now,),
+            )
+            return cur.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT status, count(*) AS n FROM jobs GROUP BY status").fetchall()
+            return {r["status"]: r["n"] for r in rows}
+        finally:
+            conn.close()
+
+    def failures(self) -> List[dict]:
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT pdf_path, attempts, last_error FROM jobs WHERE status = 'failed' ORDER BY id"
+            ).fetchall()
+            return [dict(r) for r in rows]
+        finally:
+            conn.close()
+
+
+class _Heartbeat(threading.Thread):
+    """Background thread that keeps a job lease alive while the job runs."""
+
+    def __init__(self, queue: JobQueue, job: Job, worker_id: str, interval: float):
+        super().__init__(daemon=True)
+        self.queue = queue
+        self.job = job
+        self.worker_id = worker_id
+        self.interval = interval
+        self.lost = False
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                if not self.queue.heartbeat(self.job.id, self.worker_id):
+                    self.lost = True
+                    return
+            except sqlite3.OperationalError as e:
+                # a busy shared filesystem is not fatal; try again next interval
+                _log.warning(f"Heartbeat for job {self.job.id} failed: {e}")
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def default_process(job: Job, checkpoint_dir: Optional[str] = None, router=None) -> Optional[str]:
+    """
+    Run the PROCESSOR_TYPES processor named by the job. Returns None when the
+    optional LanguageRouter decides the PDF should be skipped.
+    """
+    from doctracer.cli.extract import PROCESSOR_TYPES
+    if router:
+        decision = router.route(job.pdf_path)
+        if not decision.process:
+            _log.info(f"Skipping {job.pdf_path}: {decision.language} edition")
+            return None
+
+    start = time.perf_counter()
+    processor_class = PROCESSOR_TYPES[job.processor]
+    output = processor_class(job.pdf_path, checkpoint_dir=checkpoint_dir).process_gazettes()
+    if router:
+        router.record_processing(time.perf_counter() - start)
+    return output
+
+
+def run_worker(
+    queue: JobQueue,
+    worker_id: Optional[str] = None,
+    process: Callable[[Job], Optional[str]] = default_process,
+    heartbeat_interval: Optional[float] = None,
+    max_jobs: Optional[int] = None,
+    idle_exit: bool = True,
+    poll_interval: float = 5.0,
+) -> Dict[str, int]:
+    """
+    Pull jobs until the queue is drained (or `max_jobs` is reached), writing each
+    result to the job's output path. A job whose `process` returns None is
+    completed without output (skipped). Returns counts per outcome.
+    """
+    worker_id = worker_id or default_worker_id()
+    interval = heartbeat_interval or max(1.0, queue.lease_seconds / 3)
+    stats = {"done": 0, "skipped": 0, "failed": 0, "lost": 0}
+
+    while max_jobs is None or sum(stats.values()) < max_jobs:
+        job = queue.claim(worker_id)
+        if job is None:
+            if idle_exit:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        _log.info(f"{worker_id} processing {job}")
+        heartbeat = _Heartbeat(queue, job, worker_id, interval)
+        heartbeat.start()
+        try:
+            output = process(job)
+        except Exception as e:
+            heartbeat.stop()
+            queue.fail(job.id, worker_id, f"{type(e).__name__}: {e}")
+            stats["failed"] += 1
+            continue
+        heartbeat.stop()
+
+        if heartbeat.lost:
+            # another worker owns the job now; do not race it for the output file
+            stats["lost"] += 1
+            continue
+
+        if output is None:
+            stats["skipped" if queue.complete(job.id, worker_id) else "lost"] += 1
+            continue
+
+        os.makedirs(os.path.dirname(job.output_path) or ".", exist_ok=True)
+        tmp_path = f"{job.output_path}.{os.getpid()}.part"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(output)
+        os.replace(tmp_path, job.output_path)
+
+        if queue.complete(job.id, worker_id):
+            stats["done"] += 1
+        else:
+            stats["lost"] += 1
+    return stats
@@ -0,0 +1,114 @@
+import csv
+import os
+import re
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+from pydantic import BaseModel
+
+_DATE_FORMATS = ("%Y-%B-%d", "%Y-%b-%d", "%Y-%m-%d")
+
+
+class ManifestEntry(BaseModel):
+    gazette_id: str              # canonical form, e.g. '2289/43'
+    file_stem: str               # PDF stem, e.g. '2289-43_E'
+    published_date: Optional[date] = None
+    url: Optional[str] = None
+    name: str = ""
+    kind: str = "base"           # 'base' or 'amendment'
+    parent_id: Optional[str] = None
+
+
+def normalize_gazette_id(gazette_id: str) -> str:
+    """Normalise '2289-43', '2289/43', '1905/4' and '1905/004' style ids to 'NNNN/NN'."""
+    s = str(gazette_id).strip().replace("-", "/")
+    m = re.match(r"^(\d+)/(\d+)$", s)
+    if m:
+        return f"{int(m.group(1))}/{int(m.group(2)):02d}"
+    return s
+
+
+def parse_manifest_date(value: str) -> Optional[date]:
+    """Parse manifest dates such as '2022-July-22', '2020-SEP-25' or '2022-07-22'."""
+    if not value:
+        return None
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def default_relationships_path(manifest_path: str) -> str:
+    """gazettes_v4.csv → gazette_relationships_with_dates_v4.csv (same directory)."""
+    directory, fname = os.path.split(manifest_path)
+    return os.path.join(directory, fname.replace("gazettes", "gazette_relationships_with_dates", 1))
+
+
+def _file_stem(gazette_id: str, url: Optional[str]) -> str:
+    if url:
+        stem = os.path.splitext(os.path.basename(urlparse(url).path))[0]
+        if stem:
+            return stem
+    return f"{gazette_id.replace('/', '-')}_E"
+
+
+def load_manifest(manifest_path: str, relationships_path: Optional[str] = None) -> List[ManifestEntry]:
+    """
+    Read a gazettes*.csv manifest and classify each gazette as base or amendment
+    using the matching gazette_relationships_with_dates*.csv file.
+
+    A gazette listed as a child in the relationships file is an amendment of its
+    parent; everything else (parents and unrelated gazettes) is a base gazette.
+    """
+    relationships_path = relationships_path or default_relationships_path(manifest_path)
+    parents: Dict[str, str] = {}
+    if relationships_path and os.path.exists(relationships_path):
+        with open(relationships_path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                child = normalize_gazette_id(row["child_id"])
+                parents[child] = normalize_gazette_id(row["parent_id"])
+
+    entries = []
+    with open(manifest_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            gazette_id = normalize_gazette_id(row["gazette_id"])
+            url = (row.get("url") or "").strip()
+            url = None if not url or url.upper() == "NA" else url
+            parent_id = parents.get(gazette_id)
+            entries.append(ManifestEntry(
+                gazette_id=gazette_id,
+                file_stem=_file_stem(gazette_id, url),
+                published_date=parse_manifest_date(row.get("date", "")),
+                url=url,
+                name=row.get("name", ""),
+                kind="amendment" if parent_id else "base",
+                parent_id=parent_id,
+            ))
+    return entries
+
+
+def load_dependencies(entries: List[ManifestEntry]) -> Dict[str, List[str]]:
+    """
+    Return gazette_id → gazette_ids whose load must finish first.
+
+    An amendment waits for its parent base and for the previous amendment of the
+    same parent (by published date), so changes are applied in publication order.
+    """
+    known = {e.gazette_id for e in entries}
+    deps: Dict[str, List[str]] = {e.gazette_id: [] for e in entries}
+
+    chains: Dict[str, List[ManifestEntry]] = {}
+    for e in entries:
+        if e.kind == "amendment" and e.parent_id:
+            chains.setdefault(e.parent_id, []).append(e)
+
+    for parent_id, chain in chains.items():
+        chain.sort(key=lambda e: (e.published_date or date.min, e.gazette_id))
+        previous = parent_id if parent_id in known else None
+        for e in chain:
+            if previous:
+                deps[e.gazette_id].append(previous)
+            previous = e.gazette_id
+    return deps
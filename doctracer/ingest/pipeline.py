@@ -0,0 +1,160 @@
+import json
+import logging
+import os
+import time
+from typing import Callable, Dict, List, Optional
+from doctracer.ingest.fetch import PdfFetcher
+from doctracer.ingest.manifest import ManifestEntry, load_dependencies
+from doctracer.ingest.scheduler import run_dag, DependencyFailed
+
+_log = logging.getLogger(__name__)
+
+# manifest kind → PROCESSOR_TYPES key used by `doctracer extract`
+KIND_PROCESSORS = {
+    "base": "extragazette_table",
+    "amendment": "extragazette_amendment",
+}
+
+
+def default_extract(entry: ManifestEntry, pdf_path: str, checkpoint_dir: Optional[str]) -> str:
+    """Run the processor matching the entry kind and return its JSON output."""
+    from doctracer.cli.extract import PROCESSOR_TYPES
+    processor_class = PROCESSOR_TYPES[KIND_PROCESSORS[entry.kind]]
+    return processor_class(pdf_path, checkpoint_dir=checkpoint_dir).process_gazettes()
+
+
+def default_load(entry: ManifestEntry, json_path: str, parent_json_path: Optional[str]):
+    """Load an extracted gazette JSON into Neo4j with the existing loaders."""
+    if entry.kind == "base":
+        from doctracer.cli.table_to_neo4j import load_table_data
+        load_table_data(json_path)
+    else:
+        from doctracer.cli.amendment_to_neo4j import load_amendment_data
+        load_amendment_data(json_path, parent_json_path)
+
+
+class IngestPipeline:
+    """
+    Fetch, extract and (optionally) load every gazette listed in a manifest.
+
+    PDFs are resolved/fetched concurrently, extraction runs on a worker pool
+    with no ordering constraints, and loading is scheduled so a base gazette is
+    loaded before its amendments and amendments of the same base are applied
+    in published-date order.
+    """
+
+    def __init__(
+        self,
+        entries: List[ManifestEntry],
+        fetcher: PdfFetcher,
+        output_dir: str = "output",
+        workers: int = 4,
+        load: bool = False,
+        force: bool = False,
+        checkpoint_dir: Optional[str] = None,
+        extract_fn: Callable = default_extract,
+        load_fn: Callable = default_load,
+        router=None,
+    ):
+        self.entries = {e.gazette_id: e for e in entries}
+        self.fetcher = fetcher
+        self.output_dir = output_dir
+        self.workers = workers
+        self.load = load
+        self.force = force
+        self.checkpoint_dir = checkpoint_dir
+        self.extract_fn = extract_fn
+        self.load_fn = load_fn
+        # optional LanguageRouter; PDFs in languages it does not process are skipped before conversion
+        self.router = router
+        self.pdf_paths: Dict[str, str] = {}
+
+    def json_path(self, entry: ManifestEntry) -> str:
+        return os.path.join(self.output_dir, entry.kind, f"{entry.file_stem}.json")
+
+    def _extract(self, gazette_id: str) -> str:
+        entry = self.entries[gazette_id]
+        out_path = self.json_path(entry)
+        if os.path.exists(out_path) and not self.force:
+            return "cached"
+        if gazette_id not in self.pdf_paths:
+            raise FileNotFoundError(f"No PDF available for {gazette_id}")
+
+        pdf_path = self.pdf_paths[gazette_id]
+        if self.router:
+            decision = self.router.route(pdf_path)
+            if not decision.process:
+                return f"skipped_{decision.language}"
+
+        start = time.perf_counter()
+        output = self.extract_fn(entry, pdf_path, self.checkpoint_dir)
+        if self.router:
+            self.router.record_processing(time.perf_counter() - start)
+        if entry.kind == "amendment":
+            output = self._with_parent(entry, output)
+
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as f:
+            f.write(output)
+        return "extracted"
+
+    def _with_parent(self, entry: ManifestEntry, output: str) -> str:
+        """Fill metadata.parent_gazette from the relationships file when the LLM left it empty."""
+        data = json.loads(output)
+        meta = data.setdefault("metadata", {})
+        parent = meta.get("parent_gazette") or {}
+        if not parent.get("gazette_id") and entry.parent_id:
+            parent_entry = self.entries.get(entry.parent_id)
+            meta["parent_gazette"] = {
+                "gazette_id": entry.parent_id,
+                "published_date": str(parent_entry.published_date) if parent_entry and parent_entry.published_date else None,
+                "pdf_url": parent_entry.url if parent_entry else None,
+            }
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    def _load(self, gazette_id: str) -> str:
+        entry = self.entries[gazette_id]
+        if not os.path.exists(self.json_path(entry)):
+            # extraction was skipped (e.g. non-English edition); nothing to load
+            return "nothing_to_load"
+        parent = self.entries.get(entry.parent_id) if entry.parent_id else None
+        parent_path = self.json_path(parent) if parent else None
+        self.load_fn(entry, self.json_path(entry), parent_path)
+        return "loaded"
+
+    def _task(self, key):
+        stage, gazette_id = key
+        return self._extract(gazette_id) if stage == "extract" else self._load(gazette_id)
+
+    def run(self) -> Dict:
+        """Run the pipeline and return a summary of per-gazette outcomes."""
+        to_fetch = [
+            (f"{e.file_stem}.pdf", e.url) for e in self.entries.values()
+            if self.force or not os.path.exists(self.json_path(e))
+        ]
+        fetched = self.fetcher.fetch_all(to_fetch, workers=self.workers * 2)
+        by_name = {f"{e.file_stem}.pdf": e.gazette_id for e in self.entries.values()}
+        for name, result in fetched.items():
+            if result.ok:
+                self.pdf_paths[by_name[name]] = str(result.path)
+
+        dependencies = {("extract", gid): [] for gid in self.entries}
+        if self.load:
+            for gid, deps in load_dependencies(list(self.entries.values())).items():
+                dependencies[("load", gid)] = [("extract", gid)] + [("load", d) for d in deps]
+
+        results = run_dag(dependencies, self._task, workers=self.workers)
+
+        summary = {"fetch": {}, "extract": {}, "load": {}, "failed": {}}
+        for result in fetched.values():
+            summary["fetch"][result.status] = summary["fetch"].get(result.status, 0) + 1
+        for (stage, gid), outcome in results.items():
+            if isinstance(outcome, Exception):
+                summary["failed"][f"{stage}:{gid}"] = str(outcome)
+                status = "skipped" if isinstance(outcome, DependencyFailed) else "failed"
+            else:
+                status = outcome
+            summary[stage][status] = summary[stage].get(status, 0) + 1
+        if self.router:
+            summary["languages"] = self.router.report()
+        return summary
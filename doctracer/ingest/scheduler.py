@@ -0,0 +1,66 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, Hashable, Iterable
+
+_log = logging.getLogger(__name__)
+
+
+class DependencyFailed(Exception):
+    """Raised (as a result value) for tasks skipped because a dependency failed."""
+
+
+def run_dag(
+    dependencies: Dict[Hashable, Iterable[Hashable]],
+    task: Callable[[Hashable], Any],
+    workers: int = 4,
+) -> Dict[Hashable, Any]:
+    """
+    Run `task(key)` for every key in `dependencies` on a thread pool, starting a
+    key only after all of its dependencies have completed successfully.
+
+    Dependencies that are not themselves keys are ignored. Returns key → result,
+    or key → exception for failed tasks (and DependencyFailed for tasks skipped
+    because something upstream failed).
+    """
+    deps = {k: {d for d in v if d in dependencies and d != k} for k, v in dependencies.items()}
+    children: Dict[Hashable, set] = {k: set() for k in deps}
+    for k, ds in deps.items():
+        for d in ds:
+            children[d].add(k)
+
+    pending = {k: len(ds) for k, ds in deps.items()}
+    results: Dict[Hashable, Any] = {}
+
+    def _skip(key, reason):
+        # propagate failure to everything downstream
+        stack = [key]
+        while stack:
+            k = stack.pop()
+            for child in children[k]:
+                if child not in results:
+                    results[child] = DependencyFailed(f"{child} skipped: {reason}")
+                    stack.append(child)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        running = {pool.submit(task, k): k for k, n in pending.items() if n == 0}
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = running.pop(future)
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    _log.warning(f"Task {key} failed: {e}")
+                    results[key] = e
+                    _skip(key, f"dependency {key} failed")
+                    continue
+                for child in children[key]:
+                    pending[child] -= 1
+                    if pending[child] == 0 and child not in results:
+                        running[pool.submit(task, child)] = child
+
+    # anything never started is part of a cycle
+    for k in deps:
+        if k not in results:
+            results[k] = DependencyFailed(f"{k} skipped: dependency cycle")
+    return results
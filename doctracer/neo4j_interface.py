@@ -1,5 +1,46 @@
 import os
-from neo4j import GraphDatabase
+import time
+import uuid
+from itertools import islice
+from typing import AsyncIterator, Iterable
+from neo4j import AsyncGraphDatabase, GraphDatabase
+from doctracer.query_stats import QUERY_STATS, server_ms, summary_counters, timed_run
+
+DEFAULT_EVENT_BATCH_SIZE = 5000
+
+# driver defaults, overridable per interface or through the environment
+DEFAULT_POOL_SIZE = 100
+DEFAULT_ACQUISITION_TIMEOUT = 60.0
+DEFAULT_FETCH_SIZE = 1000
+
+# one row per change event; MERGEs see the rows written earlier in the same statement
+_CHANGE_EVENTS_QUERY = """
+UNWIND $rows AS row
+MERGE (g:Gazette {id: row.gazette_id})
+  ON CREATE SET g.published_date = date(row.date)
+MERGE (m:Minister {name: row.minister})
+MERGE (e:Entity  {name: row.value})
+CREATE (c:Change {
+  id: row.id,
+  type: row.type,
+  field: row.field
+})
+CREATE (c)-[:IN_GAZETTE]->(g)
+CREATE (c)-[:AFFECTS_MINISTER]->(m)
+CREATE (c)-[:AFFECTS_ENTITY]->(e)
+"""
+
+
+def _event_row(change: dict) -> dict:
+    return {
+        "id": change.get("id") or str(uuid.uuid4()),
+        "gazette_id": change["gazette_id"],
+        "date": str(change["date"]) if change.get("date") is not None else None,
+        "minister": change["minister"],
+        "value": change["value"],
+        "type": change["type"],
+        "field": change["field"],
+    }
 
 
 class Neo4jInterface:
@@ -12,13 +53,12 @@ class Neo4jInterface:
     def close(self):
         self.driver.close()
 
-    def execute_query(self, query: str, parameters: dict = None):
+    def execute_query(self, query: str, parameters: dict = None, name: str = "execute_query"):
         """
         Run an arbitrary Cypher query and return the raw records.
         """
         with self.driver.session() as session:
-            result = session.run(query, parameters or {})
-            return [record for record in result]
+            return timed_run(session, name, query, parameters).records
 
     def create_change_event(self, change: dict):
         """
@@ -29,27 +69,99 @@ class Neo4jInterface:
           - CREATE a Change node with a UUID, type, and field
           - LINK the Change to Gazette, Minister, and Entity
 
-        Requires the APOC plugin for apoc.create.uuid().
-        """
-        cypher = """
-        MERGE (g:Gazette {id: $gazette_id})
-          ON CREATE SET g.published_date = date($date)
-        MERGE (m:Minister {name: $minister})
-        MERGE (e:Entity  {name: $value})
-        CREATE (c:Change {
-          id: apoc.create.uuid(),
-          type: $type,
-          field: $field
-        })
-        CREATE (c)-[:IN_GAZETTE]->(g)
-        CREATE (c)-[:AFFECTS_MINISTER]->(m)
-        CREATE (c)-[:AFFECTS_ENTITY]->(e)
+        For more than a handful of events use `create_change_events`.
+        """
+        self.create_change_events([change])
+
+    def create_change_events(self, changes: Iterable[dict], batch_size: int = DEFAULT_EVENT_BATCH_SIZE) -> int:
         """
+        Persist change events (e.g. GazetteDiffProcessor.diff output) in bulk.
+
+        Events are consumed lazily from `changes`, so a generator is never
+        materialised: each chunk of `batch_size` is written with one UNWIND
+        statement in its own managed transaction. Change ids are uuid4s made
+        client-side (no APOC) before the transaction starts, so a retried chunk
+        writes the same ids. Returns the number of events written.
+        """
+        changes = iter(changes)
+        written = 0
         with self.driver.session() as session:
-            session.run(cypher, change)
+            while True:
+                rows = [_event_row(c) for c in islice(changes, batch_size)]
+                if not rows:
+                    break
+                session.execute_write(lambda tx: timed_run(tx, "change_events", _CHANGE_EVENTS_QUERY, rows=rows))
+                written += len(rows)
+        return written
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         self.close()
+
+
+class AsyncNeo4jInterface:
+    """
+    asyncio counterpart of Neo4jInterface on the async driver.
+
+    One interface holds one connection pool; create it once and share it
+    between coroutines. Pool size, connection acquisition timeout (seconds)
+    and fetch size (records pulled per round-trip) default to
+    NEO4J_MAX_POOL_SIZE, NEO4J_ACQUISITION_TIMEOUT and NEO4J_FETCH_SIZE.
+    """
+
+    def __init__(self, uri=None, user=None, password=None, max_connection_pool_size: int = None,
+                 connection_acquisition_timeout: float = None, fetch_size: int = None, database: str = None):
+        uri = uri or os.getenv('NEO4J_URI')
+        user = user or os.getenv('NEO4J_USER')
+        password = password or os.getenv('NEO4J_PASSWORD')
+        self.max_connection_pool_size = max_connection_pool_size or int(
+            os.getenv('NEO4J_MAX_POOL_SIZE', DEFAULT_POOL_SIZE))
+        self.connection_acquisition_timeout = connection_acquisition_timeout or float(
+            os.getenv('NEO4J_ACQUISITION_TIMEOUT', DEFAULT_ACQUISITION_TIMEOUT))
+        self.fetch_size = fetch_size or int(os.getenv('NEO4J_FETCH_SIZE', DEFAULT_FETCH_SIZE))
+        self.database = database or os.getenv('NEO4J_DATABASE')
+        self.driver = AsyncGraphDatabase.driver(
+            uri, auth=(user, password),
+            max_connection_pool_size=self.max_connection_pool_size,
+            connection_acquisition_timeout=self.connection_acquisition_timeout,
+        )
+
+    def _session(self):
+        return self.driver.session(database=self.database, fetch_size=self.fetch_size)
+
+    async def close(self):
+        await self.driver.close()
+
+    async def execute_query(self, query: str, parameters: dict = None, name: str = "execute_query"):
+        """
+        Run an arbitrary Cypher query and return the raw records.
+        """
+        return [record async for record in self.iter_query(query, parameters, name=name)]
+
+    async def iter_query(self, query: str, parameters: dict = None, name: str = "iter_query") -> AsyncIterator:
+        """
+        Run a Cypher query and yield its records as they arrive.
+
+        Records are pulled `fetch_size` at a time, so a large result is never
+        held in memory; the session (and its pooled connection) is released
+        when the iteration finishes or the generator is closed. Fully read
+        results are recorded in QUERY_STATS under `name`.
+        """
+        start = time.perf_counter()
+        rows = 0
+        async with self._session() as session:
+            result = await session.run(query, parameters or {})
+            async for record in result:
+                rows += 1
+                yield record
+            summary = await result.consume()
+        QUERY_STATS.record(name, (time.perf_counter() - start) * 1000, server_ms(summary), rows,
+                           summary_counters(summary), query=query)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -0,0 +1,97 @@
+from typing import List, Tuple
+
+
+class SchemaItem:
+    """A constraint or index the loaders and API depend on."""
+
+    def __init__(self, name: str, kind: str, label: str, properties: Tuple[str, ...]):
+        self.name = name
+        self.kind = kind  # 'unique' or 'range'
+        self.label = label
+        self.properties = properties
+
+    @property
+    def create_statement(self) -> str:
+        props = ", ".join(f"n.{p}" for p in self.properties)
+        if len(self.properties) > 1:
+            props = f"({props})"
+        if self.kind == "unique":
+            return f"CREATE CONSTRAINT {self.name} IF NOT EXISTS FOR (n:{self.label}) REQUIRE {props} IS UNIQUE"
+        return f"CREATE INDEX {self.name} IF NOT EXISTS FOR (n:{self.label}) ON {props}"
+
+    @property
+    def drop_statement(self) -> str:
+        kind = "CONSTRAINT" if self.kind == "unique" else "INDEX"
+        return f"DROP {kind} {self.name} IF EXISTS"
+
+    def describe(self) -> str:
+        return f"{self.kind:<6} :{self.label}({', '.join(self.properties)})"
+
+    def __repr__(self):
+        return f"SchemaItem({self.name!r}, {self.describe()!r})"
+
+
+# Gazette and Minister MERGE keys are unique by construction. Item nodes are
+# only indexed: amendments CREATE item nodes, so two additions of the same
+# item number in one amendment are legitimately duplicates.
+SCHEMA: List[SchemaItem] = [
+    SchemaItem("base_gazette_id", "unique", "BaseGazette", ("gazette_id",)),
+    SchemaItem("amendment_gazette_id", "unique", "AmendmentGazette", ("gazette_id",)),
+    SchemaItem("minister_key", "unique", "Minister", ("number", "gazette_id")),
+]
+for _label in ("Function", "Department"):
+    _prefix = _label.lower()
+    SCHEMA += [
+        SchemaItem(f"{_prefix}_item", "range", _label, ("item_number", "minister_number", "gazette_id")),
+        SchemaItem(f"{_prefix}_unnumbered", "range", _label, ("name", "gazette_id", "minister_ref")),
+    ]
+SCHEMA.append(SchemaItem("law_key", "range", "Law", ("name", "minister_number", "gazette_id")))
+# structure snapshots: looked up by gazette, dropped by gazette or base gazette
+SCHEMA += [
+    SchemaItem("structure_snapshot_id", "unique", "StructureSnapshot", ("gazette_id",)),
+    SchemaItem("structure_snapshot_base", "range", "StructureSnapshot", ("base_gazette_id",)),
+]
+# amendment change lookups in the API (n.added_by = $id OR n.removed_by = $id)
+for _label in ("Function", "Department", "Law"):
+    for _prop in ("added_by", "removed_by"):
+        SCHEMA.append(SchemaItem(f"{_label.lower()}_{_prop}", "range", _label, (_prop,)))
+
+
+def _existing(session) -> set:
+    """(kind, label, properties) of every online constraint and range index."""
+    found = set()
+    for rec in session.run("SHOW CONSTRAINTS YIELD type, labelsOrTypes, properties"):
+        if "UNIQUENESS" in rec["type"] or rec["type"] == "NODE_KEY":
+            found.add(("unique", rec["labelsOrTypes"][0], tuple(rec["properties"])))
+    for rec in session.run(
+        "SHOW INDEXES YIELD type, entityType, labelsOrTypes, properties, owningConstraint, state "
+        "WHERE type = 'RANGE' AND entityType = 'NODE'"
+    ):
+        if rec["owningConstraint"] is None and rec["state"] == "ONLINE":
+            found.add(("range", rec["labelsOrTypes"][0], tuple(rec["properties"])))
+    return found
+
+
+def missing_schema(driver) -> List[SchemaItem]:
+    """Return the SCHEMA items not present in the database (matched by definition, not name)."""
+    with driver.session() as session:
+        existing = _existing(session)
+    return [item for item in SCHEMA if (item.kind, item.label, item.properties) not in existing]
+
+
+def ensure_schema(driver) -> List[SchemaItem]:
+    """Create any missing constraints/indexes and wait for them to come online. Returns what was created."""
+    missing = missing_schema(driver)
+    with driver.session() as session:
+        for item in missing:
+            session.run(item.create_statement).consume()
+        if missing:
+            session.run("CALL db.awaitIndexes(300)").consume()
+    return missing
+
+
+def drop_schema(driver):
+    """Drop every SCHEMA item by name (used by the benchmark to measure the unindexed case)."""
+    with driver.session() as session:
+        for item in SCHEMA:
+            session.run(item.drop_statement).consume()
@@ -0,0 +1,185 @@
+import os
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+slow_log = logging.getLogger("doctracer.slow_query")
+
+# statements slower than this (client-side wall time) are logged
+SLOW_QUERY_MS = float(os.getenv("DOCTRACER_SLOW_QUERY_MS", "500"))
+
+# samples kept per statement for the rolling percentiles
+WINDOW = 1000
+
+_COUNTERS = (
+    "nodes_created", "nodes_deleted", "relationships_created", "relationships_deleted",
+    "properties_set", "labels_added", "labels_removed", "indexes_added", "constraints_added",
+)
+
+
+def _percentile(sorted_values: List[float], p: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class _Statement:
+    __slots__ = ("count", "errors", "rows", "client_ms", "server_ms", "counters", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.client_ms = deque(maxlen=WINDOW)
+        self.server_ms = deque(maxlen=WINDOW)
+        self.counters: Dict[str, int] = {}
+
+
+class QueryStats:
+    """
+    Thread-safe per-statement timings and write counters.
+
+    Totals cover every call since the last reset; percentiles cover the last
+    `WINDOW` calls of each statement.
+    """
+
+    def __init__(self, slow_query_ms: float = SLOW_QUERY_MS):
+        self.slow_query_ms = slow_query_ms
+        self._statements: Dict[str, _Statement] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, client_ms: float, server_ms: Optional[float] = None, rows: int = 0,
+               counters: Optional[Dict[str, int]] = None, error: bool = False, query: str = ""):
+        with self._lock:
+            stats = self._statements.setdefault(name, _Statement())
+            stats.count += 1
+            stats.errors += int(error)
+            stats.rows += rows
+            stats.total_ms += client_ms
+            stats.max_ms = max(stats.max_ms, client_ms)
+            stats.client_ms.append(client_ms)
+            if server_ms is not None:
+                stats.server_ms.append(server_ms)
+            for key, value in (counters or {}).items():
+                stats.counters[key] = stats.counters.get(key, 0) + value
+
+        if client_ms >= self.slow_query_ms:
+            slow_log.warning(
+                f"🐢 {name}: {client_ms:.0f} ms client, "
+                f"{'-' if server_ms is None else f'{server_ms:.0f}'} ms server, {rows} rows: "
+                f"{' '.join(query.split())[:300]}"
+            )
+
+    def report(self) -> List[dict]:
+        """One dict per statement, slowest total time first."""
+        rows = []
+        with self._lock:
+            for name, s in self._statements.items():
+                client = sorted(s.client_ms)
+                server = sorted(s.server_ms)
+                rows.append({
+                    "name": name,
+                    "count": s.count,
+                    "errors": s.errors,
+                    "rows": s.rows,
+                    "total_ms": round(s.total_ms, 1),
+                    "max_ms": round(s.max_ms, 1),
+                    "p50_ms": _percentile(client, 50),
+                    "p95_ms": _percentile(client, 95),
+                    "p99_ms": _percentile(client, 99),
+                    "server_p50_ms": _percentile(server, 50),
+                    "server_p95_ms": _percentile(server, 95),
+                    "counters": dict(s.counters),
+                })
+        return sorted(rows, key=lambda r: r["total_ms"], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._statements.clear()
+
+
+QUERY_STATS = QueryStats()
+
+
+class TimedResult:
+    """Fully-read result of `timed_run`: iterate it, or use single()/data()/consume() as on a driver Result."""
+
+    def __init__(self, records: list, summary):
+        self.records = records
+        self.summary = summary
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def single(self):
+        return self.records[0] if self.records else None
+
+    def data(self) -> List[dict]:
+        return [r.data() for r in self.records]
+
+    def consume(self):
+        return self.summary
+
+
+def summary_counters(summary) -> Dict[str, int]:
+    """Non-zero write counters of a ResultSummary."""
+    counters = getattr(summary, "counters", None)
+    if counters is None:
+        return {}
+    return {k: getattr(counters, k) for k in _COUNTERS if getattr(counters, k, 0)}
+
+
+def server_ms(summary) -> Optional[float]:
+    """Server time of a ResultSummary (time to first record plus time to consume), in ms."""
+    available = getattr(summary, "result_available_after", None)
+    consumed = getattr(summary, "result_consumed_after", None)
+    if available is None and consumed is None:
+        return None
+    return float((available or 0) + (consumed or 0))
+
+
+def timed_run(runner, name: str, query: str, parameters: Optional[dict] = None, /,
+              stats: QueryStats = QUERY_STATS, **kwargs) -> TimedResult:
+    """
+    Run `query` on a session or transaction, read the whole result and record
+    its timings, row count and summary counters under `name`.
+
+    Use it in place of `runner.run(query, ...)`; keyword parameters are merged
+    into `parameters` like session.run does (and may be called `name` or `query`).
+    """
+    params = {**(parameters or {}), **kwargs}
+    start = time.perf_counter()
+    try:
+        result = runner.run(query, params)
+        records = list(result)
+        summary = result.consume()
+    except Exception:
+        stats.record(name, (time.perf_counter() - start) * 1000, error=True, query=query)
+        raise
+    stats.record(name, (time.perf_counter() - start) * 1000, server_ms(summary), len(records),
+                 summary_counters(summary), query=query)
+    return TimedResult(records, summary)
+
+
+def format_report(rows: List[dict]) -> str:
+    """Plain-text table of `QueryStats.report()` rows."""
+    def _ms(v):
+        return "-" if v is None else f"{v:.1f}"
+
+    lines = [f"{'statement':<36}{'calls':>7}{'rows':>9}{'total ms':>11}{'p50':>9}{'p95':>9}{'p99':>9}"
+             f"{'srv p95':>9}  writes"]
+    for r in rows:
+        writes = ", ".join(f"{k}={v}" for k, v in sorted(r["counters"].items()))
+        lines.append(
+            f"{r['name'][:35]:<36}{r['count']:>7}{r['rows']:>9}{r['total_ms']:>11.1f}{_ms(r['p50_ms']):>9}"
+            f"{_ms(r['p95_ms']):>9}{_ms(r['p99_ms']):>9}{_ms(r['server_p95_ms']):>9}  {writes}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,100 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+# responses kept across all cached routes
+CACHE_SIZE = int(os.getenv("DOCTRACER_CACHE_SIZE", "256"))
+
+# how long a data-version read is trusted before asking the store again, in seconds
+VERSION_TTL = float(os.getenv("DOCTRACER_CACHE_VERSION_TTL", "1.0"))
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU of computed responses, validated against a data version.
+
+    Every entry remembers the version it was computed at; a lookup only hits
+    when that still equals `version_fn()`. Loaders bump the version after each
+    commit, so a reload invalidates every entry without the cache knowing
+    which routes it touched. `version_fn` is called at most once per
+    `version_ttl` seconds, so a burst of hits costs one version read.
+    """
+
+    def __init__(self, version_fn: Callable[[], int], max_entries: int = CACHE_SIZE,
+                 version_ttl: float = VERSION_TTL):
+        self.version_fn = version_fn
+        self.max_entries = max_entries
+        self.version_ttl = version_ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._version_read_at = 0.0
+        self._counts = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0}
+
+    def version(self) -> int:
+        now = time.monotonic()
+        with self._lock:
+            if self._version is not None and now - self._version_read_at < self.version_ttl:
+                return self._version
+        version = self.version_fn()
+        with self._lock:
+            self._version, self._version_read_at = version, now
+        return version
+
+    def lookup(self, key: Hashable) -> Tuple[bool, object, int]:
+        """
+        (hit, value, version): the entry for `key` if it is current, and the
+        version to `put` a recomputed value at. For callers that can't hand
+        `get` a synchronous `compute` (the ASGI routes).
+        """
+        version = self.version()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self._counts["hits"] += 1
+                return True, entry[1], version
+            self._counts["misses"] += 1
+            if entry is not None:
+                self._counts["stale"] += 1
+        return False, None, version
+
+    def get(self, key: Hashable, compute: Callable[[], object]):
+        """The cached value for `key`, or `compute()` stored at the current version (unless it is None)."""
+        hit, value, version = self.lookup(key)
+        if hit:
+            return value
+
+        # computed outside the lock: concurrent misses on one key each run it once
+        value = compute()
+        if value is not None:
+            self.put(key, value, version)
+        return value
+
+    def put(self, key: Hashable, value, version: int):
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            for key in self._counts:
+                self._counts[key] = 0
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            lookups = self._counts["hits"] + self._counts["misses"]
+            return {
+                **self._counts,
+                "hit_rate": round(self._counts["hits"] / lookups, 3) if lookups else None,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "data_version": self._version,
+            }
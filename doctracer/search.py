@@ -0,0 +1,200 @@
+import re
+import time
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+from doctracer.response_cache import VERSION_TTL
+
+# share of the query's trigrams a name must contain to count as a hit
+MIN_COVERAGE = 0.6
+
+# matched names reported per gazette
+MAX_MATCHES = 5
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalise(text) -> str:
+    """Lower-case words separated by single spaces ('2153/12' → '2153 12')."""
+    return " ".join(_NON_WORD.sub(" ", str(text or "")).lower().split())
+
+
+def trigrams(text: str) -> set:
+    """Trigrams of each word, padded so word starts weigh more (prefixes and typos still overlap)."""
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class SearchIndex:
+    """
+    In-memory trigram index over gazette ids/dates and minister, department,
+    function and law names.
+
+    Each distinct normalised name is indexed once and remembers every place
+    it occurs (gazette, minister), so repeated names across gazettes don't
+    grow the posting lists. Hits are ranked by the share of query trigrams
+    they contain, with a bonus for substring and word-prefix matches.
+    """
+
+    def __init__(self, gazettes: List[dict], documents: List[dict]):
+        self.gazettes = {g["gazette_id"]: g for g in gazettes if g.get("gazette_id")}
+        self._terms: List[str] = []
+        self._term_ids: Dict[str, int] = {}
+        self._occurrences: List[List[dict]] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+
+        for g in self.gazettes.values():
+            self._add(g["gazette_id"], {"type": "gazette", "name": g["gazette_id"], "gazette_id": g["gazette_id"]})
+            if g.get("published_date"):
+                self._add(g["published_date"], {"type": "date", "name": str(g["published_date"]),
+                                                "gazette_id": g["gazette_id"]})
+        for doc in documents:
+            if doc.get("gazette_id") in self.gazettes:
+                self._add(doc["name"], doc)
+
+    def _add(self, text, occurrence: dict):
+        term = normalise(text)
+        if not term:
+            return
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = self._term_ids[term] = len(self._terms)
+            self._terms.append(term)
+            self._occurrences.append([])
+            for gram in trigrams(term):
+                self._postings[gram].append(term_id)
+        self._occurrences[term_id].append(occurrence)
+
+    def __len__(self):
+        return len(self._terms)
+
+    def _score(self, query: str, query_grams: set) -> Dict[int, float]:
+        overlap: Dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for term_id in self._postings.get(gram, ()):
+                overlap[term_id] += 1
+
+        scores = {}
+        for term_id, shared in overlap.items():
+            coverage = shared / len(query_grams)
+            if coverage < MIN_COVERAGE:
+                continue
+            term = self._terms[term_id]
+            score = coverage
+            if query in term:
+                score += 1.0
+                if term.startswith(query) or f" {query}" in term:
+                    score += 0.5
+            scores[term_id] = score
+        return scores
+
+    def search(self, query: str, gazette_type: str = "all", limit: int = 50) -> List[dict]:
+        """
+        Gazettes ranked by their best-matching id, date or entity name, as
+        /search returns them: the gazette fields plus `score` and `matches`
+        ({"type", "name", "minister_name", "minister_number"}).
+        """
+        query = normalise(query)
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        hits: Dict[str, dict] = {}
+        for term_id, score in self._score(query, query_grams).items():
+            for occurrence in self._occurrences[term_id]:
+                gazette = self.gazettes[occurrence["gazette_id"]]
+                if not _has_type(gazette, gazette_type):
+                    continue
+                hit = hits.setdefault(gazette["gazette_id"], {"score": 0.0, "matches": []})
+                hit["score"] = max(hit["score"], score)
+                hit["matches"].append((score, occurrence))
+
+        ranked = sorted(hits.items(), key=lambda item: str(self.gazettes[item[0]].get("published_date") or ""),
+                        reverse=True)
+        ranked.sort(key=lambda item: item[1]["score"], reverse=True)
+
+        results = []
+        for gazette_id, hit in ranked[:limit]:
+            matches = sorted(hit["matches"], key=lambda m: m[0], reverse=True)[:MAX_MATCHES]
+            results.append({
+                **_gazette_fields(self.gazettes[gazette_id]),
+                "score": round(hit["score"], 3),
+                "matches": [
+                    {"type": m["type"], "name": m["name"], "minister_name": m.get("minister_name"),
+                     "minister_number": m.get("minister_number")}
+                    for _, m in matches
+                ],
+            })
+        return results
+
+    def latest(self, gazette_type: str = "all", limit: int = 50) -> List[dict]:
+        """Most recently published gazettes (the empty-query listing)."""
+        gazettes = [g for g in self.gazettes.values() if _has_type(g, gazette_type)]
+        gazettes.sort(key=lambda g: str(g.get("published_date") or ""), reverse=True)
+        return [_gazette_fields(g) for g in gazettes[:limit]]
+
+
+def _has_type(gazette: dict, gazette_type: str) -> bool:
+    if gazette_type == "base":
+        return "BaseGazette" in gazette["labels"]
+    if gazette_type == "amendment":
+        return "AmendmentGazette" in gazette["labels"]
+    return True
+
+
+def _gazette_fields(gazette: dict) -> dict:
+    return {
+        "gazette_id": gazette["gazette_id"],
+        "published_date": gazette.get("published_date"),
+        "parent_gazette_id": gazette.get("parent_gazette_id"),
+        "labels": gazette["labels"],
+    }
+
+
+class LiveSearchIndex:
+    """
+    A SearchIndex of a GraphStore, rebuilt when the store's data version
+    changes (i.e. after a load). The version is re-read at most once per
+    `version_ttl` seconds.
+    """
+
+    def __init__(self, store_fn: Callable[[], object], version_ttl: float = VERSION_TTL):
+        self.store_fn = store_fn
+        self.version_ttl = version_ttl
+        self._index: Optional[SearchIndex] = None
+        self._version = None
+        self._checked_at = 0.0
+        self._build_ms = None
+        self._lock = threading.Lock()
+
+    def index(self) -> SearchIndex:
+        now = time.monotonic()
+        if self._index is not None and now - self._checked_at < self.version_ttl:
+            return self._index
+        with self._lock:
+            store = self.store_fn()
+            version = store.data_version()
+            if self._index is None or version != self._version:
+                start = time.perf_counter()
+                self._index = SearchIndex(store.gazettes(), store.search_documents())
+                self._build_ms = (time.perf_counter() - start) * 1000
+                self._version = version
+            self._checked_at = now
+            return self._index
+
+    def search(self, query: str, gazette_type: str = "all", limit: int = 50) -> List[dict]:
+        if not normalise(query):
+            return self.index().latest(gazette_type, limit)
+        return self.index().search(query, gazette_type, limit)
+
+    def stats(self) -> dict:
+        return {
+            "data_version": self._version,
+            "terms": len(self._index) if self._index is not None else 0,
+            "gazettes": len(self._index.gazettes) if self._index is not None else 0,
+            "build_ms": None if self._build_ms is None else round(self._build_ms, 1),
+        }
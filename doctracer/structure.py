@@ -0,0 +1,281 @@
+import logging
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# amendment column number → structure field
+COLUMN_FIELDS = {'1': 'functions', '2': 'departments', '3': 'laws'}
+
+
+def structure_from_ministers(ministers: List[dict]) -> dict:
+    """Structure dict of a base gazette from `GraphStore.base_structure` rows (ministers merged by name)."""
+    ministers_map = {}
+    all_departments, all_laws, all_functions = set(), set(), set()
+
+    for minister in ministers:
+        ministers_map[minister['name']] = {
+            'name': minister['name'],
+            'number': minister['number'],
+            'departments': minister['departments'],
+            'laws': minister['laws'],
+            'functions': minister['functions']
+        }
+        all_departments.update(minister['departments'])
+        all_laws.update(minister['laws'])
+        all_functions.update(minister['functions'])
+
+    return {
+        'ministers': list(ministers_map.values()),
+        'departments': list(all_departments),
+        'laws': list(all_laws),
+        'functions': list(all_functions),
+        'raw_entities': []
+    }
+
+
+def changes_from_rows(amendment_id: str, change_rows: List[dict]) -> List[dict]:
+    """
+    Amendment changes in the extracted-JSON shape (INSERTION/DELETION/UPDATE
+    per minister and column) from `GraphStore.amendment_change_rows`.
+    """
+    minister_changes = {}
+
+    for record in change_rows:
+        node_labels = record['node_labels']
+        minister_name = record['minister_name'] or "Unknown Minister"
+        minister_number = record['minister_number'] or "Unknown"
+
+        if 'Function' in node_labels:
+            column_no = "1"
+            content = record['description'] or record['node_name']
+        elif 'Department' in node_labels:
+            column_no = "2"
+            content = record['node_name']
+        elif 'Law' in node_labels:
+            column_no = "3"
+            content = record['node_name']
+        else:
+            continue
+
+        minister_key = f"{minister_name}_{column_no}"
+        if minister_key not in minister_changes:
+            minister_changes[minister_key] = {
+                'minister_name': minister_name,
+                'minister_number': minister_number,
+                'column_no': column_no,
+                'added_content': [],
+                'deleted_sections': []
+            }
+
+        if record['added_by'] == amendment_id and record['removed_by'] == amendment_id:
+            # UPDATE: both added and removed in same amendment
+            minister_changes[minister_key]['added_content'].append(content)
+            minister_changes[minister_key]['deleted_sections'].append(content)
+        elif record['added_by'] == amendment_id:
+            minister_changes[minister_key]['added_content'].append(content)
+        elif record['removed_by'] == amendment_id:
+            minister_changes[minister_key]['deleted_sections'].append(content)
+
+    changes = []
+    for change_data in minister_changes.values():
+        details = {
+            'name': change_data['minister_name'],
+            'number': change_data['minister_number'],
+            'column_no': change_data['column_no'],
+        }
+        added_content = change_data['added_content']
+        deleted_sections = change_data['deleted_sections']
+
+        if added_content and deleted_sections:
+            changes.append({'operation_type': 'UPDATE',
+                            'details': {**details, 'added_content': added_content, 'deleted_sections': deleted_sections}})
+        elif added_content:
+            changes.append({'operation_type': 'INSERTION', 'details': {**details, 'added_content': added_content}})
+        elif deleted_sections:
+            changes.append({'operation_type': 'DELETION', 'details': {**details, 'deleted_sections': deleted_sections}})
+    return changes
+
+
+def _present(values) -> list:
+    return [x for x in values or [] if x is not None]
+
+
+def simulate_final_structure(base_structure, amendment_changes):
+    """
+    Simulate the final structure after applying amendment changes (exact-match semantics).
+
+    Each touched minister column is held as an ordered set (a dict), so
+    insertions and deletions cost O(1) per item; untouched ministers are
+    shared with `base_structure` rather than copied.
+    """
+    ministers_map = {m['name']: m for m in base_structure['ministers']}
+    touched: Dict[str, Dict[str, dict]] = {}  # minister name → field → ordered set of items
+    logger.debug(f"Processing {len(amendment_changes)} changes for {len(ministers_map)} ministers")
+
+    for i, change in enumerate(amendment_changes):
+        op = change.get('operation_type')
+        details = change.get('details', {})
+        name = details.get('name')
+        col = details.get('column_no')
+        logger.debug(f"Change {i+1}: {op} for {name} (column {col})")
+
+        if not name or col not in COLUMN_FIELDS:
+            logger.debug(f"Change {i+1}: missing name/column, skipping")
+            continue
+
+        # Do not create new ministers from amendments - only update existing ones.
+        # All ministers should come from the base gazette structure.
+        if name not in ministers_map:
+            logger.warning(f"Minister '{name}' not found in base structure, skipping change")
+            continue
+
+        field = COLUMN_FIELDS[col]
+        columns = touched.setdefault(name, {})
+        if field not in columns:
+            columns[field] = dict.fromkeys(ministers_map[name].get(field, []))
+        current = columns[field]
+
+        if op == 'INSERTION':
+            current.update(dict.fromkeys(_present(details.get('added_content'))))
+
+        elif op == 'DELETION':
+            for x in _present(details.get('deleted_sections')):
+                current.pop(x, None)
+
+        elif op == 'UPDATE':
+            adds = _present(details.get('added_content'))
+            dels = set(_present(details.get('deleted_sections')))
+
+            # If the amendment both deletes and adds and the counts match,
+            # treat it as a direct substitution (replace existing entries).
+            if adds and dels and len(adds) == len(dels):
+                columns[field] = dict.fromkeys(adds)
+            else:
+                for x in dels:
+                    current.pop(x, None)
+                current.update(dict.fromkeys(adds))
+
+    final_ministers = []
+    all_depts, all_laws, all_funcs = {}, {}, {}
+    for m in base_structure['ministers']:
+        if m['name'] in touched:
+            m = {**m, **{field: list(items) for field, items in touched[m['name']].items()}}
+        final_ministers.append(m)
+        all_depts.update(dict.fromkeys(m.get('departments', [])))
+        all_laws.update(dict.fromkeys(m.get('laws', [])))
+        all_funcs.update(dict.fromkeys(m.get('functions', [])))
+
+    return {
+        **base_structure,
+        'ministers': final_ministers,
+        'departments': list(all_depts),
+        'laws': list(all_laws),
+        'functions': list(all_funcs),
+    }
+
+
+def diff_structures(base_structure: dict, final_structure: dict) -> Dict[str, list]:
+    """
+    Added, removed and modified ministers between two structures (by minister
+    name), in one pass over each. Modified entries carry per-column
+    added/removed lists plus the flattened `<column>_added/_removed` fields
+    the frontend reads.
+    """
+    base_ministers = {m['name']: m for m in base_structure['ministers']}
+    final_ministers = {m['name']: m for m in final_structure['ministers']}
+
+    added = [m for name, m in final_ministers.items() if name not in base_ministers]
+    removed, modified = [], []
+    for name, base_m in base_ministers.items():
+        final_m = final_ministers.get(name)
+        if final_m is None:
+            removed.append(base_m)
+            continue
+
+        entry = {
+            'name': name,
+            'number': base_m.get('number') or final_m.get('number'),
+            'base': base_m,
+            'amendment': final_m,
+            'changes': [],
+            # Backwards-compatible flattened fields for frontend
+            'departments_added': [],
+            'departments_removed': [],
+            'laws_added': [],
+            'laws_removed': [],
+            'functions_added': [],
+            'functions_removed': []
+        }
+        for field in ('departments', 'laws', 'functions'):
+            before, after = set(base_m.get(field, [])), set(final_m.get(field, []))
+            if before == after:
+                continue
+            entry[f'{field}_added'] = [x for x in final_m.get(field, []) if x not in before]
+            entry[f'{field}_removed'] = [x for x in base_m.get(field, []) if x not in after]
+            entry['changes'].append({'type': field, 'added': entry[f'{field}_added'],
+                                     'removed': entry[f'{field}_removed']})
+        if entry['changes']:
+            modified.append(entry)
+
+    return {'added_ministers': added, 'removed_ministers': removed, 'modified_ministers': modified}
+
+
+# -- snapshots ----------------------------------------------------------------
+
+def build_snapshots(store, base_ids: Iterable[str]) -> List[dict]:
+    """
+    Effective-structure snapshots of each base gazette and every amendment
+    linked to it: the base's structure, and for an amendment the base with
+    that amendment's changes applied (what the compare view shows for it).
+    """
+    base_ids = set(base_ids)
+    chains: Dict[str, List[str]] = {base_id: [] for base_id in base_ids}
+    for amendment in store.amendments():
+        if amendment['parent_gazette_id'] in chains:
+            chains[amendment['parent_gazette_id']].append(amendment['gazette_id'])
+
+    snapshots = []
+    for base_id, amend_ids in chains.items():
+        ministers = store.base_structure(base_id)
+        if ministers is None:
+            continue
+        base = structure_from_ministers(ministers)
+        snapshots.append({'gazette_id': base_id, 'base_gazette_id': base_id, 'structure': base, 'changes': None})
+        for amend_id in dict.fromkeys(amend_ids):
+            changes = changes_from_rows(amend_id, store.amendment_change_rows(amend_id) or [])
+            snapshots.append({
+                'gazette_id': amend_id,
+                'base_gazette_id': base_id,
+                'structure': simulate_final_structure(base, changes) if changes else base,
+                'changes': changes,
+            })
+    return snapshots
+
+
+def refresh_snapshots(store, base_ids: Iterable[str]) -> List[dict]:
+    """
+    Recompute and persist the snapshots of these base gazettes' chains.
+
+    Nothing is written if the graph changed while they were computed (the
+    next load, or the next read, recomputes them). Returns the snapshots.
+    """
+    version = store.data_version()
+    snapshots = build_snapshots(store, base_ids)
+    if snapshots and not store.write_snapshots(snapshots, version):
+        logger.debug(f"Graph changed while computing {len(snapshots)} snapshots; not stored")
+    return snapshots
+
+
+def snapshot_for(store, gazette_id: str) -> Optional[dict]:
+    """The stored snapshot of a gazette, computing its chain's snapshots on a miss. None if no such gazette."""
+    snapshot = store.snapshot(gazette_id)
+    if snapshot is not None:
+        return snapshot
+
+    gazette = store.gazette(gazette_id)
+    if gazette is None:
+        return None
+    base_id = gazette_id if 'BaseGazette' in gazette['labels'] else store.amendment_parent(gazette_id)
+    if base_id is None:
+        return None
+    return next((s for s in refresh_snapshots(store, [base_id]) if s['gazette_id'] == gazette_id), None)
@@ -0,0 +1,99 @@
+"""
+Compare per-event and batched change-event writes.
+
+    python scripts/benchmark_change_events.py --events 100000
+
+Writes synthetic ADD/REMOVE events (shaped like GazetteDiffProcessor.diff
+output) with `create_change_events` at several batch sizes, and a sample of
+them one call at a time the way `create_change_event` used to, and prints
+events/second for each. The script DELETES all Change, Gazette and Entity
+nodes and the Minister nodes it created between runs. Point it at a scratch
+database, never production.
+"""
+import time
+import argparse
+from dotenv import load_dotenv
+
+from doctracer.neo4j_interface import Neo4jInterface
+
+load_dotenv()
+
+_MINISTER_PREFIX = "Benchmark Minister"
+
+# the statement create_change_event ran per event before batching (uuid made client-side)
+_SINGLE_EVENT_QUERY = """
+MERGE (g:Gazette {id: $gazette_id})
+  ON CREATE SET g.published_date = date($date)
+MERGE (m:Minister {name: $minister})
+MERGE (e:Entity  {name: $value})
+CREATE (c:Change {id: randomUUID(), type: $type, field: $field})
+CREATE (c)-[:IN_GAZETTE]->(g)
+CREATE (c)-[:AFFECTS_MINISTER]->(m)
+CREATE (c)-[:AFFECTS_ENTITY]->(e)
+"""
+
+
+def synthetic_events(n: int, gazettes: int = 50, ministers: int = 40, entities: int = 5000):
+    """Yield `n` change events without building a list."""
+    for i in range(n):
+        yield {
+            "type": "ADD" if i % 3 else "REMOVE",
+            "minister": f"{_MINISTER_PREFIX} {i % ministers}",
+            "field": ("departments", "laws", "functions")[i % 3],
+            "value": f"Benchmark entity {i % entities}",
+            "gazette_id": f"9{i % gazettes:03d}/01",
+            "date": "2024-01-01",
+        }
+
+
+def _wipe(neo4j):
+    # auto-commit query, so the delete can run in chunks
+    neo4j.execute_query("MATCH (c:Change) CALL { WITH c DETACH DELETE c } IN TRANSACTIONS OF 10000 ROWS")
+    neo4j.execute_query("MATCH (n) WHERE n:Gazette OR n:Entity DETACH DELETE n")
+    neo4j.execute_query("MATCH (m:Minister) WHERE m.name STARTS WITH $prefix DETACH DELETE m",
+                        {"prefix": _MINISTER_PREFIX})
+
+
+def _time_single(neo4j, n):
+    start = time.perf_counter()
+    for event in synthetic_events(n):
+        with neo4j.driver.session() as session:
+            session.run(_SINGLE_EVENT_QUERY, event).consume()
+    return n / (time.perf_counter() - start)
+
+
+def _time_batched(neo4j, n, batch_size):
+    start = time.perf_counter()
+    written = neo4j.create_change_events(synthetic_events(n), batch_size=batch_size)
+    return written / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--single-sample", type=int, default=2_000,
+                        help="Events written one call at a time (the per-event path is too slow for 100k)")
+    parser.add_argument("--batch-sizes", default="1000,5000,20000")
+    args = parser.parse_args()
+
+    results = []
+    with Neo4jInterface() as neo4j:
+        # MERGE lookups need these indexes to stay flat as the graph grows
+        neo4j.execute_query("CREATE INDEX change_gazette_id IF NOT EXISTS FOR (g:Gazette) ON (g.id)")
+        neo4j.execute_query("CREATE INDEX change_entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name)")
+        neo4j.execute_query("CREATE INDEX change_minister_name IF NOT EXISTS FOR (m:Minister) ON (m.name)")
+
+        _wipe(neo4j)
+        results.append((f"per event ({args.single_sample})", _time_single(neo4j, args.single_sample)))
+        for batch_size in (int(b) for b in args.batch_sizes.split(",")):
+            _wipe(neo4j)
+            results.append((f"batch {batch_size} ({args.events})", _time_batched(neo4j, args.events, batch_size)))
+        _wipe(neo4j)
+
+    print(f"\n{'':<28}{'events/s':>12}")
+    for name, rate in results:
+        print(f"{name:<28}{rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
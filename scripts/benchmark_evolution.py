@@ -0,0 +1,98 @@
+"""
+Compare the old and the per-minister aggregated /network/government-evolution query.
+
+    python scripts/benchmark_evolution.py --gazettes 20 --ministers 30 --items 5,10,20,40
+
+For each item count N it loads a synthetic corpus of base gazettes whose
+ministers each oversee N departments and N laws, then times the old
+OPTIONAL MATCH chain (kept below verbatim) and `Neo4jGraphStore.evolution`,
+printing rows returned and milliseconds. The old query returns N x N rows per
+minister, the new one a row per gazette, so its time should grow linearly
+with N. The script DELETES the synthetic gazettes it wrote and expects an
+otherwise empty database: point it at a scratch database, never production.
+"""
+import time
+import argparse
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# after load_dotenv: the loader module builds its driver from NEO4J_* at import
+from doctracer.cli.table_to_neo4j import DEFAULT_BATCH_SIZE, build_table_rows, driver  # noqa: E402
+from doctracer.graph import Neo4jGraphStore  # noqa: E402
+
+# the route's query before the rewrite
+_OLD_EVOLUTION_QUERY = """
+MATCH (g)
+WHERE g:BaseGazette OR g:AmendmentGazette
+OPTIONAL MATCH (g)-[r1]-(m)
+WHERE m IS NOT NULL AND (m:BaseMinister OR m:AmendmentMinister OR m:Minister)
+OPTIONAL MATCH (m)-[r2:OVERSEES_DEPARTMENT]->(d)
+WHERE d IS NOT NULL AND (d:BaseDepartment OR d:AmendmentDepartment OR d:Department)
+OPTIONAL MATCH (m)-[r3:RESPONSIBLE_FOR_LAW]->(l)
+WHERE l IS NOT NULL AND (l:BaseLaw OR l:AmendmentLaw OR l:Law)
+RETURN g, m, d, l, r1, r2, r3
+ORDER BY g.published_date
+"""
+
+
+def synthetic_gazette(index: int, ministers: int, items: int) -> dict:
+    return {
+        "gazette_id": f"BENCH-{index:04d}",
+        "published_date": f"2000-01-{index % 28 + 1:02d}",
+        "ministers": [
+            {
+                "name": f"Benchmark Minister {m}",
+                "number": str(m + 1),
+                "functions": [],
+                "departments": [f"{i + 1}. Department {m}-{i}" for i in range(items)],
+                "laws": [f"Law {m}-{i} Act" for i in range(items)],
+            }
+            for m in range(ministers)
+        ],
+    }
+
+
+def _time(fn):
+    start = time.perf_counter()
+    rows = fn()
+    return rows, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--gazettes", type=int, default=20)
+    parser.add_argument("--ministers", type=int, default=30)
+    parser.add_argument("--items", default="5,10,20,40", help="Departments (and laws) per minister, per run")
+    parser.add_argument("--skip-old", action="store_true", help="Only time the new query (the old one is N² rows)")
+    args = parser.parse_args()
+
+    store = Neo4jGraphStore(driver)
+    gazette_ids = [f"BENCH-{g:04d}" for g in range(args.gazettes)]
+
+    results = []
+    try:
+        for items in (int(n) for n in args.items.split(",")):
+            for g in range(args.gazettes):
+                data = synthetic_gazette(g, args.ministers, items)
+                store.write_base(data, build_table_rows(data), DEFAULT_BATCH_SIZE)
+
+            old_rows, old_ms = (None, None) if args.skip_old else _time(
+                lambda: driver.execute_query(_OLD_EVOLUTION_QUERY).records)
+            new_rows, new_ms = _time(store.evolution)
+            results.append((items, old_rows, old_ms, new_rows, new_ms))
+
+            for gazette_id in gazette_ids:
+                store.retract_base(gazette_id)
+    finally:
+        driver.execute_query("MATCH (g:BaseGazette) WHERE g.gazette_id STARTS WITH 'BENCH-' DETACH DELETE g")
+        store.close()
+
+    print(f"\n{'items':>6}{'old rows':>11}{'old ms':>10}{'new rows':>11}{'new ms':>10}{'new ms/item':>13}")
+    for items, old_rows, old_ms, new_rows, new_ms in results:
+        old = f"{len(old_rows):>11}{old_ms:>10.0f}" if old_rows is not None else f"{'-':>11}{'-':>10}"
+        print(f"{items:>6}{old}{len(new_rows):>11}{new_ms:>10.0f}{new_ms / items:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
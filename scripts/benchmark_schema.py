@@ -0,0 +1,104 @@
+"""
+Compare load and query time without and with the `doctracer db init` schema.
+
+    python scripts/benchmark_schema.py --base-dir output/base --amendment-dir output/amendment
+
+The script DELETES ALL NODES and drops the schema items listed in
+doctracer/neo4j_schema.py, loads the JSON files and times a set of API
+queries, then wipes the graph again, recreates the schema and repeats.
+Point it at a scratch database, never production.
+"""
+import os
+import time
+import argparse
+from statistics import median
+from dotenv import load_dotenv
+
+from doctracer.neo4j_interface import Neo4jInterface
+from doctracer.neo4j_schema import drop_schema, ensure_schema
+
+load_dotenv()
+
+QUERIES = {
+    "minister lookup": (
+        "MATCH (m:Minister {number: $number, gazette_id: $gazette_id}) RETURN m.name",
+        {"number": "01", "gazette_id": "2289/43"},
+    ),
+    "item merge key": (
+        "MATCH (f:Function {item_number: '1', minister_number: $number, gazette_id: $gazette_id}) RETURN f.name",
+        {"number": "01", "gazette_id": "2289/43"},
+    ),
+    "amendment changes": (
+        """
+        MATCH (n) WHERE (n:Function OR n:Department OR n:Law)
+          AND (n.added_by = $amend_id OR n.removed_by = $amend_id)
+        RETURN count(n)
+        """,
+        {"amend_id": "2297/78"},
+    ),
+}
+
+
+def _json_files(directory):
+    files = []
+    for root, _, names in os.walk(directory or ""):
+        files += [os.path.join(root, n) for n in sorted(names) if n.lower().endswith(".json")]
+    return files
+
+
+def _time_load(base_files, amendment_files, base_dir):
+    from doctracer.cli.table_to_neo4j import load_table_data
+    from doctracer.cli.amendment_to_neo4j import load_amendment_data
+
+    start = time.perf_counter()
+    for path in base_files:
+        load_table_data(path)
+    for path in amendment_files:
+        try:
+            load_amendment_data(path, base_dir)
+        except ValueError as e:
+            print(f"⚠️ {path}: {e}")
+    return time.perf_counter() - start
+
+
+def _time_queries(neo4j, repeat):
+    results = {}
+    for name, (query, params) in QUERIES.items():
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            neo4j.execute_query(query, params)
+            samples.append((time.perf_counter() - start) * 1000)
+        results[name] = median(samples)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-dir", default="output/base")
+    parser.add_argument("--amendment-dir", default="output/amendment")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query (median is reported)")
+    args = parser.parse_args()
+
+    base_files = _json_files(args.base_dir)
+    amendment_files = _json_files(args.amendment_dir)
+
+    with Neo4jInterface() as neo4j:
+        neo4j.execute_query("MATCH (n) DETACH DELETE n")
+        drop_schema(neo4j.driver)
+        load_without = _time_load(base_files, amendment_files, args.base_dir)
+        queries_without = _time_queries(neo4j, args.repeat)
+
+        neo4j.execute_query("MATCH (n) DETACH DELETE n")
+        ensure_schema(neo4j.driver)
+        load_with = _time_load(base_files, amendment_files, args.base_dir)
+        queries_with = _time_queries(neo4j, args.repeat)
+
+    print(f"\n{'':<22}{'no schema':>12}{'schema':>12}")
+    print(f"{'load (s)':<22}{load_without:>12.2f}{load_with:>12.2f}")
+    for name in QUERIES:
+        print(f"{name + ' (ms)':<22}{queries_without[name]:>12.2f}{queries_with[name]:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Measure /search latency on the trigram index.
+
+    python scripts/benchmark_search.py                      # extracted JSON under output/
+    python scripts/benchmark_search.py --store neo4j        # the graph in NEO4J_URI
+
+Builds the index the API uses from the chosen store, then runs queries made
+from the indexed names: whole names, 4-letter prefixes and names with one
+letter dropped (a typo). Prints build time, index size and p50/p95/p99
+milliseconds per query kind. Read-only.
+"""
+import time
+import random
+import argparse
+import statistics
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from doctracer.search import SearchIndex  # noqa: E402
+
+
+def _store(args):
+    if args.store == "neo4j":
+        from doctracer.cli.table_to_neo4j import driver
+        from doctracer.graph import Neo4jGraphStore
+        return Neo4jGraphStore(driver)
+    from doctracer.graph import MemoryGraphStore
+    return MemoryGraphStore.from_json(args.base_dir, args.amendment_dir)
+
+
+def _queries(names, n, rng):
+    names = [name for name in names if len(name) >= 6]
+    sample = [rng.choice(names) for _ in range(n)]
+    typo = []
+    for name in sample:
+        i = rng.randrange(1, len(name) - 1)
+        typo.append(name[:i] + name[i + 1:])
+    return {"exact": sample, "prefix": [name[:4] for name in sample], "typo": typo}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--store", choices=("memory", "neo4j"), default="memory")
+    parser.add_argument("--base-dir", default="output/base")
+    parser.add_argument("--amendment-dir", default="output/amendment")
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    store = _store(args)
+    start = time.perf_counter()
+    gazettes, documents = store.gazettes(), store.search_documents()
+    index = SearchIndex(gazettes, documents)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Indexed {len(gazettes)} gazettes, {len(documents)} names ({len(index)} distinct) in {build_ms:.0f} ms")
+
+    queries = _queries([d["name"] for d in documents], args.queries, random.Random(args.seed))
+    print(f"\n{'query':<8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'hits/query':>12}")
+    for kind, batch in queries.items():
+        times, hits = [], 0
+        for query in batch:
+            t = time.perf_counter()
+            hits += len(index.search(query))
+            times.append((time.perf_counter() - t) * 1000)
+        cuts = statistics.quantiles(times, n=100)
+        print(f"{kind:<8}{statistics.median(times):>9.2f}{cuts[94]:>9.2f}{cuts[98]:>9.2f}{hits / len(batch):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Time the structure fetch behind /gazettes/<id>/structure before and after
+it became a single query.
+
+    python scripts/benchmark_structure.py --repeat 20
+    python scripts/benchmark_structure.py --gazette 2153/12
+
+For every base gazette in the database (or the ones given), runs the old
+existence check + minister + three item queries (kept below verbatim) and
+`Neo4jGraphStore.base_structure`, checks they return the same tree, and
+prints median milliseconds and round-trips per fetch. Read-only.
+"""
+import time
+import argparse
+import statistics
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# after load_dotenv: the loader module builds its driver from NEO4J_* at import
+from doctracer.cli.table_to_neo4j import driver  # noqa: E402
+from doctracer.graph import Neo4jGraphStore  # noqa: E402
+
+_EXISTS_QUERY = "MATCH (g:BaseGazette {gazette_id: $gazette_id}) RETURN g"
+
+_MINISTERS_QUERY = """
+MATCH (g:BaseGazette {gazette_id: $gazette_id})
+MATCH (g)-[:HAS_MINISTER]->(m)
+WHERE m:BaseMinister OR m:Minister
+RETURN DISTINCT m.name as minister_name, m.number as minister_number
+"""
+
+_ITEMS_QUERY = """
+MATCH (g:BaseGazette {gazette_id: $gazette_id})
+MATCH (g)-[:HAS_MINISTER]->(m)
+WHERE m:BaseMinister OR m:Minister
+OPTIONAL MATCH (m)-[:%(rel)s]->(n)
+WHERE n:Base%(label)s OR n:%(label)s
+RETURN m.name as minister_name, collect(DISTINCT n.name) as names
+"""
+
+_COLUMNS = (("departments", "OVERSEES_DEPARTMENT", "Department"),
+            ("laws", "RESPONSIBLE_FOR_LAW", "Law"),
+            ("functions", "HAS_FUNCTION", "Function"))
+
+
+def old_base_structure(gazette_id: str):
+    with driver.session() as session:
+        if not session.run(_EXISTS_QUERY, gazette_id=gazette_id).single():
+            return None
+        ministers = session.run(_MINISTERS_QUERY, gazette_id=gazette_id).data()
+        items = {}
+        for column, rel, label in _COLUMNS:
+            result = session.run(_ITEMS_QUERY % {"rel": rel, "label": label}, gazette_id=gazette_id)
+            items[column] = {r["minister_name"]: [n for n in (r["names"] or []) if n is not None] for r in result}
+    return [
+        {"name": m["minister_name"], "number": m["minister_number"],
+         **{column: items[column].get(m["minister_name"], []) for column, _, _ in _COLUMNS}}
+        for m in ministers
+    ]
+
+
+def _normalised(structure):
+    return sorted((m["name"] or "", m["number"] or "", *(tuple(sorted(m[c])) for c, _, _ in _COLUMNS))
+                  for m in structure or [])
+
+
+def _median_ms(fn, gazette_id, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(gazette_id)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--gazette", action="append", help="Base gazette id (repeatable; default: all)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    store = Neo4jGraphStore(driver)
+    gazette_ids = args.gazette or [r["gazette_id"] for r in store.gazettes() if "BaseGazette" in r["labels"]]
+
+    print(f"{'gazette':<14}{'ministers':>10}{'old ms (5 rt)':>15}{'new ms (1 rt)':>15}")
+    try:
+        for gazette_id in gazette_ids:
+            new = store.base_structure(gazette_id)
+            if _normalised(old_base_structure(gazette_id)) != _normalised(new):
+                print(f"⚠️ {gazette_id}: old and new structure differ")
+            old_ms = _median_ms(old_base_structure, gazette_id, args.repeat)
+            new_ms = _median_ms(store.base_structure, gazette_id, args.repeat)
+            print(f"{gazette_id:<14}{len(new or []):>10}{old_ms:>15.1f}{new_ms:>15.1f}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Load-test running API servers with concurrent mixed traffic.
+
+    # the two serving modes, side by side
+    gunicorn -w 2 -b :5000 backend.api:app
+    uvicorn backend.asgi:app --port 5001 --workers 2
+    python scripts/load_test_api.py --url flask=http://localhost:5000 --url asgi=http://localhost:5001 \\
+        --concurrency 8,32,64 --duration 20
+
+Each client thread keeps one HTTP/1.1 connection open and sends requests
+back to back for `--duration` seconds, picking paths by weight from a
+dashboard-like mix (listings, /graph/complete, search, structures,
+evolution). Prints requests/sec, p50/p95/p99 latency and errors per server
+and concurrency, then p99 per route. `--bust` adds a unique query argument
+to every request so the response cache never hits and each one reaches the
+graph. Read-only; run it from another machine than the servers for numbers
+that aren't CPU-bound on the client.
+"""
+import time
+import json
+import random
+import argparse
+import http.client
+from urllib.parse import quote, urlsplit
+from concurrent.futures import ThreadPoolExecutor
+
+# route → weight; {base} is a random base gazette, {query} a random search term
+MIX = {
+    "/gazettes": 3,
+    "/amendments": 2,
+    "/graph/complete": 2,
+    "/search?q={query}": 3,
+    "/gazettes/{base}/structure": 2,
+    "/network/government-evolution": 1,
+}
+
+SEARCH_TERMS = ["defence", "finance", "education", "health", "minister", "ports", "army act", "2153"]
+
+
+def _percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, round(p / 100 * (len(sorted_values) - 1)))]
+
+
+def _connection(url):
+    parts = urlsplit(url)
+    cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    return cls(parts.hostname, parts.port, timeout=120)
+
+
+def _base_ids(url):
+    conn = _connection(url)
+    conn.request("GET", "/gazettes")
+    gazettes = json.loads(conn.getresponse().read())
+    conn.close()
+    return [g["gazette_id"] for g in gazettes if "BaseGazette" in g.get("labels", [])] or ["unknown"]
+
+
+def _client(url, deadline, base_ids, bust, seed):
+    rng = random.Random(seed)
+    routes, weights = list(MIX), list(MIX.values())
+    samples = []  # (route, ms, ok)
+    conn = _connection(url)
+    n = 0
+    while time.monotonic() < deadline:
+        route = rng.choices(routes, weights)[0]
+        path = route.format(base=quote(rng.choice(base_ids), safe=""), query=quote(rng.choice(SEARCH_TERMS)))
+        if bust:
+            n += 1
+            path += f"{'&' if '?' in path else '?'}_={seed}-{n}"
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path)
+            response = conn.getresponse()
+            response.read()
+            ok = response.status == 200
+        except (OSError, http.client.HTTPException):
+            ok = False
+            conn.close()
+            conn = _connection(url)
+        samples.append((route, (time.perf_counter() - start) * 1000, ok))
+    conn.close()
+    return samples
+
+
+def run(url, concurrency, duration, bust):
+    base_ids = _base_ids(url)
+    deadline = time.monotonic() + duration
+    start = time.monotonic()
+    with ThreadPoolExecutor(concurrency) as pool:
+        futures = [pool.submit(_client, url, deadline, base_ids, bust, seed) for seed in range(concurrency)]
+        samples = [s for f in futures for s in f.result()]
+    return samples, time.monotonic() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", action="append", required=True, help="name=URL of a running server (repeatable)")
+    parser.add_argument("--concurrency", default="8,32", help="Client threads per run, comma separated")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per run")
+    parser.add_argument("--bust", action="store_true", help="Defeat the response cache")
+    args = parser.parse_args()
+
+    servers = [u.split("=", 1) if "=" in u else (u, u) for u in args.url]
+    results = []
+    for concurrency in (int(c) for c in args.concurrency.split(",")):
+        for name, url in servers:
+            samples, elapsed = run(url, concurrency, args.duration, args.bust)
+            results.append((name, concurrency, samples, elapsed))
+            print(f"… {name} at {concurrency} clients: {len(samples)} requests")
+
+    print(f"\n{'server':<10}{'clients':>8}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>8}")
+    for name, concurrency, samples, elapsed in results:
+        times = sorted(ms for _, ms, _ in samples)
+        errors = sum(1 for _, _, ok in samples if not ok)
+        print(f"{name:<10}{concurrency:>8}{len(samples) / elapsed:>9.1f}{_percentile(times, 50):>9.1f}"
+              f"{_percentile(times, 95):>9.1f}{_percentile(times, 99):>9.1f}{errors:>8}")
+
+    print(f"\np99 ms per route\n{'route':<32}" + "".join(f"{f'{n}@{c}':>14}" for n, c, _, _ in results))
+    for route in MIX:
+        cells = []
+        for _, _, samples, _ in results:
+            p99 = _percentile(sorted(ms for r, ms, _ in samples if r == route), 99)
+            cells.append(f"{'-' if p99 is None else f'{p99:.1f}':>14}")
+        print(f"{route:<32}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import pytest
+
+
+class FakeTx:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def run(self, query, parameters=None, **params):
+        params = {**(parameters or {}), **params}
+        self.driver.calls.append((query, params))
+        if self.driver.on_run:
+            self.driver.on_run(query, params)
+        return self
+
+    def __iter__(self):
+        return iter([])
+
+    def consume(self):
+        pass
+
+
+class FakeDriver:
+    """Stand-in for a neo4j driver (and its sessions) that records every query run in a write transaction."""
+
+    def __init__(self, on_run=None):
+        self.calls = []
+        self.sessions = 0
+        self.on_run = on_run
+
+    def session(self):
+        self.sessions += 1
+        return self
+
+    def execute_write(self, work, *args):
+        return work(FakeTx(self), *args)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def fake_driver():
+    return FakeDriver()
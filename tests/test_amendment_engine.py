@@ -0,0 +1,76 @@
+import json
+import os
+
+os.environ.setdefault("NEO4J_URI", "bolt://localhost:7687")
+
+from doctracer.cli.amendment_to_neo4j import normalize_changes, plan_amendment  # noqa: E402
+
+AMENDMENT = {
+    "changes": [
+        {"operation_type": "DELETION",
+         "details": {"number": "12", "name": "Minister of ICT", "column_no": "I", "deleted_sections": ["item 8"]}},
+        {"operation_type": "UPDATE",
+         "details": {"number": "12", "name": "Minister of ICT", "column_no": "I",
+                     "deleted_sections": ["item 3"],
+                     "added_content": ["8. Digital infrastructure", "9. Data protection"],
+                     "updated_content": ["2. Telecommunications"]}},
+        {"operation_type": "INSERTION",
+         "details": {"number": "1", "name": "Minister of Defence", "column_no": "IV", "added_content": ["1. X"]}},
+    ]
+}
+
+
+def test_normalize_changes_keeps_application_order():
+    rows = normalize_changes(AMENDMENT)
+
+    assert [(r["action"], r["item_number"]) for r in rows] == [
+        ("removed", "8"), ("removed", "3"), ("added", "8"), ("added", "9"), ("updated", "2"),
+    ]
+    assert {r["minister_number"] for r in rows} == {"12"}
+    assert rows[2]["label"] == "Function" and rows[2]["rel"] == "HAS_FUNCTION"
+    assert rows[2]["item_name"] == "Digital infrastructure"
+
+
+def test_plan_replays_changes_sequentially():
+    rows = normalize_changes(AMENDMENT)
+    matches = [
+        {"key": "12|HAS_FUNCTION|#8", "node_id": 1, "name": "Old item eight", "is_active": None},
+        {"key": "12|HAS_FUNCTION|#3", "node_id": 2, "name": "Item three", "is_active": True},
+        {"key": "12|HAS_FUNCTION|#9", "node_id": 3, "name": "Data protection", "is_active": True},
+        {"key": "12|HAS_FUNCTION|#2", "node_id": 4, "name": "Posts", "is_active": False},
+        {"key": "12|HAS_FUNCTION|#2", "node_id": 5, "name": "Post and telecom", "is_active": True},
+    ]
+
+    plan = plan_amendment(rows, matches)
+
+    # item 8 is removed first, so its re-addition creates a new node
+    assert [c["item_number"] for c in plan["creations"]] == ["8"]
+    assert plan["counts"] == {"removed": 2, "updated": 1, "restored": 0, "created": 1, "unchanged": 1}
+    tracked = {r["node_id"]: r for r in plan["tracked"]}
+    assert tracked[1]["removed"] and tracked[1]["is_active"] is False
+    assert tracked[2]["removed"] and tracked[2]["is_active"] is False
+    assert 3 not in tracked
+    # an update touches every node with the key, reactivating older copies as before
+    assert tracked[4]["updated"] and tracked[4]["is_active"] is True
+    assert tracked[5]["updated"] and not tracked[5]["removed"]
+
+
+def test_item_names_come_from_cached_base_gazette(tmp_path):
+    from doctracer.cli.amendment_to_neo4j import base_cache_info, get_item_name_from_base_file
+
+    base = tmp_path / "2289-43_E.json"
+    base.write_text(json.dumps({"ministers": [
+        {"number": "01", "functions": ["1. Defence policy"], "departments": ["2. Sri Lanka Army"],
+         "laws": ["Army Act"]},
+        {"number": "01", "departments": ["2. Shadowed", "3. Sri Lanka Navy"]},
+    ]}), encoding="utf-8")
+
+    before = base_cache_info()
+    assert get_item_name_from_base_file(str(base), "01", "2", "2") == "Sri Lanka Army"
+    assert get_item_name_from_base_file(str(base), "01", "2", "3") == "Sri Lanka Navy"
+    assert get_item_name_from_base_file(str(base), "01", "1", "1") == "Defence policy"
+    assert get_item_name_from_base_file(str(base), "1", "1", "1") is None
+    assert get_item_name_from_base_file(str(tmp_path / "missing.json"), "01", "1", "1") is None
+    after = base_cache_info()
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 3
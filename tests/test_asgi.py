@@ -0,0 +1,68 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+os.environ.setdefault("NEO4J_URI", "bolt://localhost:7687")
+
+import pytest
+
+pytest.importorskip("fastapi")
+httpx = pytest.importorskip("httpx")
+
+from doctracer.response_cache import ResponseCache
+from test_graph_store import _loaded_store
+
+
+class _FakeReads:
+    def __init__(self):
+        self.calls = 0
+        self.neo4j = SimpleNamespace(max_connection_pool_size=8)
+
+    async def gazettes(self):
+        self.calls += 1
+        return [{"gazette_id": "from-async-driver", "published_date": "2019-12-10", "parent_gazette_id": None,
+                 "president": "Unknown", "labels": ["BaseGazette"]}]
+
+    async def amendments(self):
+        self.calls += 1
+        return [{"gazette_id": "2159/15", "published_date": "2020-01-22", "parent_gazette_id": "2153/12",
+                 "president": "Unknown", "change_count": 2, "change_counts": None}]
+
+
+def test_asgi_serves_listings_natively_and_other_routes_through_flask(tmp_path, monkeypatch):
+    from backend import api, asgi
+
+    if not asgi.NATIVE:
+        pytest.skip("native routes need the neo4j store")
+    reads = _FakeReads()
+    monkeypatch.setattr(asgi, "reads", reads)
+    monkeypatch.setattr(api, "store", _loaded_store(tmp_path))
+    monkeypatch.setattr(api, "response_cache", ResponseCache(lambda: 1, version_ttl=0))
+
+    async def _requests():
+        # ASGITransport skips the lifespan, which would open a real driver
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=asgi.app), base_url="http://test") as client:
+            listing = await client.get("/gazettes", headers={"Origin": "http://localhost:3000"})
+            again = await client.get("/gazettes")
+            amendments = await client.get("/amendments")
+            search = await client.get("/search", params={"q": "defence"})
+            structure = await client.get("/gazettes/2153%2F12/structure")
+            debug = await client.get("/debug/asgi")
+        return listing, again, amendments, search, structure, debug
+
+    listing, again, amendments, search, structure, debug = asyncio.run(_requests())
+
+    assert [g["gazette_id"] for g in listing.json()] == ["from-async-driver"]
+    assert listing.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert again.json() == listing.json()
+    assert amendments.json()[0]["has_detailed_changes"] is True
+    assert reads.calls == 2
+
+    # one cache for both servers: Flask answers /gazettes from the entry the ASGI route stored
+    assert [g["gazette_id"] for g in api.app.test_client().get("/gazettes").get_json()] == ["from-async-driver"]
+
+    # routes without a native port run the Flask handler against the store
+    assert "2153/12" in {hit["gazette_id"] for hit in search.json()}
+    assert {m["name"] for m in structure.json()["ministers"]} == {"Minister of Defence", "Minister of ICT"}
+    assert debug.json()["native_routes"] == ["/gazettes", "/amendments", "/graph/complete"]
+    assert debug.json()["neo4j_pool_size"] == 8
@@ -0,0 +1,77 @@
+import asyncio
+
+from doctracer import neo4j_interface
+from doctracer.neo4j_interface import AsyncNeo4jInterface
+
+
+class _FakeResult:
+    def __init__(self, driver, n):
+        self.driver, self.n = driver, n
+
+    def __aiter__(self):
+        return self._records()
+
+    async def _records(self):
+        for i in range(self.n):
+            self.driver.pulled += 1
+            yield {"i": i}
+
+    async def consume(self):
+        return None
+
+
+class _FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def run(self, query, parameters):
+        return _FakeResult(self.driver, parameters["n"])
+
+    async def __aenter__(self):
+        self.driver.open_sessions += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        self.driver.open_sessions -= 1
+        return False
+
+
+class _FakeAsyncDriver:
+    def __init__(self, uri, auth=None, **config):
+        self.config = config
+        self.session_args = []
+        self.pulled = 0
+        self.open_sessions = 0
+        self.closed = False
+
+    def session(self, **kwargs):
+        self.session_args.append(kwargs)
+        return _FakeSession(self)
+
+    async def close(self):
+        self.closed = True
+
+
+def test_pool_settings_and_lazy_iteration(monkeypatch):
+    monkeypatch.setattr(neo4j_interface.AsyncGraphDatabase, "driver", _FakeAsyncDriver)
+
+    async def _run():
+        async with AsyncNeo4jInterface("bolt://localhost:7687", "neo4j", "secret", max_connection_pool_size=8,
+                                       connection_acquisition_timeout=5, fetch_size=250) as neo4j:
+            driver = neo4j.driver
+            first = []
+            async for record in neo4j.iter_query("UNWIND range(1, $n) AS i RETURN i", {"n": 1000}):
+                first.append(record)
+                if len(first) == 3:
+                    break
+            pulled_after_break = driver.pulled
+            records = await neo4j.execute_query("UNWIND range(1, $n) AS i RETURN i", {"n": 10})
+        return driver, pulled_after_break, records
+
+    driver, pulled_after_break, records = asyncio.run(_run())
+
+    assert driver.config == {"max_connection_pool_size": 8, "connection_acquisition_timeout": 5}
+    assert driver.session_args[0]["fetch_size"] == 250
+    assert pulled_after_break == 3
+    assert len(records) == 10
+    assert driver.open_sessions == 0 and driver.closed
@@ -0,0 +1,45 @@
+import json
+import os
+
+from doctracer.cli.base_index import INDEX_FILENAME, GazetteFileIndex
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_lookup_matches_id_variants_and_filename(tmp_path):
+    _write(tmp_path / "ranil" / "base.json", {"gazette_id": "2289/43"})
+    _write(tmp_path / "gotabaya" / "2153-12_E.json", {"ministers": []})
+    _write(tmp_path / "broken.json", {})
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+    index = GazetteFileIndex(str(tmp_path))
+
+    expected = str(tmp_path / "ranil" / "base.json")
+    assert index.lookup("2289/43") == expected
+    assert index.lookup("2289-43") == expected
+    assert index.lookup("2289/043") == expected
+    assert index.lookup("2153/12") == str(tmp_path / "gotabaya" / "2153-12_E.json")
+    assert index.lookup("1897/15") is None
+    assert (tmp_path / INDEX_FILENAME).exists()
+
+
+def test_reuses_persisted_entries_and_refreshes_changed_files(tmp_path):
+    _write(tmp_path / "a.json", {"gazette_id": "2289/43"})
+    _write(tmp_path / "b.json", {"gazette_id": "2153/12"})
+    assert GazetteFileIndex(str(tmp_path)).parsed == 2
+
+    # a second run parses nothing until a file changes
+    assert GazetteFileIndex(str(tmp_path)).parsed == 0
+
+    _write(tmp_path / "b.json", {"gazette_id": "2412/08"})
+    os.utime(tmp_path / "b.json", (1, 1))
+    index = GazetteFileIndex(str(tmp_path))
+    assert index.parsed == 1
+    assert index.lookup("2153/12") is None
+    assert index.lookup("2412-08") == str(tmp_path / "b.json")
+
+    _write(tmp_path / "c.json", {"gazette_id": "1897/15"})
+    assert index.lookup("1897/15") == str(tmp_path / "c.json")
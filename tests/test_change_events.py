@@ -0,0 +1,25 @@
+from doctracer import neo4j_interface
+from doctracer.neo4j_interface import Neo4jInterface
+
+
+def test_events_stream_in_chunks_through_one_session(monkeypatch, fake_driver):
+    pulled, batches = [], []
+    fake_driver.on_run = lambda query, params: batches.append((len(pulled), params["rows"]))
+    monkeypatch.setattr(neo4j_interface.GraphDatabase, "driver", lambda *a, **k: fake_driver)
+
+    def _events(n):
+        for i in range(n):
+            pulled.append(i)
+            yield {"type": "ADD", "minister": "Minister of Defence", "field": "departments",
+                   "value": f"Department {i}", "gazette_id": "2289/43", "date": "2022-07-22"}
+
+    with Neo4jInterface("bolt://localhost:7687", "neo4j", "secret") as neo4j:
+        written = neo4j.create_change_events(_events(25), batch_size=10)
+
+    assert written == 25
+    assert fake_driver.sessions == 1
+    assert [len(rows) for _, rows in batches] == [10, 10, 5]
+    # each chunk is written before the next one is pulled from the generator
+    assert [consumed for consumed, _ in batches] == [10, 20, 25]
+    ids = [row["id"] for _, rows in batches for row in rows]
+    assert len(set(ids)) == 25
@@ -0,0 +1,98 @@
+import json
+
+from doctracer.extract.gazette import extragazettetable
+from doctracer.extract.gazette.checkpoint import BlockJournal, list_journals
+from doctracer.extract.gazette.extragazetteamendment import ExtraGazetteAmendmentProcessor
+from doctracer.extract.gazette.extragazettetable import ExtraGazetteTableProcessor
+
+
+def test_journal_resumes_completed_blocks(tmp_path):
+    journal = BlockJournal.for_pdf("data/2289-43_E.pdf", str(tmp_path), processor="P")
+    journal.start(3)
+    journal.record(0, "block zero", [{"op": 0}])
+    journal.record(1, "block one", [{"op": 1}])
+
+    # simulate a crash on block 2 and a rerun
+    resumed = BlockJournal.for_pdf("data/2289-43_E.pdf", str(tmp_path), processor="P")
+    assert resumed.get(0, "block zero") == [{"op": 0}]
+    assert resumed.get(1, "block one") == [{"op": 1}]
+    assert resumed.get(2, "block two") is None
+    assert resumed.progress() == {"gazette": "2289-43_E", "processor": "P", "done": 2, "total": 3, "complete": False}
+
+
+def test_journal_ignores_changed_blocks_and_torn_lines(tmp_path):
+    journal = BlockJournal.for_pdf("x.pdf", str(tmp_path))
+    journal.start(1)
+    journal.record(0, "original", ["a"])
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"type": "block", "key": "1", "ha')
+
+    resumed = BlockJournal.for_pdf("x.pdf", str(tmp_path))
+    assert resumed.get(0, "edited") is None
+    assert resumed.get(0, "original") == ["a"]
+
+
+def test_list_journals_reports_completion(tmp_path):
+    done = BlockJournal.for_pdf("done.pdf", str(tmp_path))
+    done.start(1)
+    done.record(0, "b", [])
+    done.complete()
+    BlockJournal.for_pdf("running.pdf", str(tmp_path)).start(5)
+
+    journals = {j["gazette"]: j for j in list_journals(str(tmp_path))}
+    assert journals["done"]["complete"] is True
+    assert journals["running"]["complete"] is False
+    assert journals["running"]["total"] == 5
+
+
+class _Executor:
+    """Answers each prompt with the next of `replies`."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+
+    def execute_prompt(self, config):
+        return self.replies.pop(0)
+
+
+def test_amendment_journal_stays_open_when_a_block_fails(tmp_path):
+    text = "\n- (1) first change\n- (2) second change"
+
+    class Processor(ExtraGazetteAmendmentProcessor):
+        def _initialize_executor(self):
+            return _Executor(['{"op": 1}', "not json", '{"op": 1}', '{"op": 2}'])
+
+    processor = Processor("2159-15_E.pdf", checkpoint_dir=str(tmp_path), minimise=False)
+    assert json.loads(processor._extract_changes(text)) == [{"op": 1}]
+    assert list_journals(str(tmp_path))[0] == {"gazette": "2159-15_E", "processor": "Processor",
+                                                "done": 1, "total": 2, "complete": False}
+
+    # the rerun redoes only the failed block (block 1 is journaled) and completes the gazette
+    processor = Processor("2159-15_E.pdf", checkpoint_dir=str(tmp_path), minimise=False)
+    processor.executor.replies = ['{"op": 2}']
+    assert json.loads(processor._extract_changes(text)) == [{"op": 1}, {"op": 2}]
+    assert list_journals(str(tmp_path))[0]["complete"] is True
+
+
+def test_table_journal_stays_open_when_a_block_raises(tmp_path, monkeypatch):
+    text = "## (1) Minister of Defence\nArmy\n## (2) Minister of ICT\nDigital"
+    monkeypatch.setattr(extragazettetable, "extract_text_from_pdfplumber", lambda path: "")
+    monkeypatch.setattr(extragazettetable, "extract_text_from_docling", lambda path: text)
+
+    class Processor(ExtraGazetteTableProcessor):
+        def _initialize_executor(self):
+            return _Executor([])
+
+        def _extract_metadata(self, text):
+            return {}
+
+        def _extract_changes_from_text(self, block):
+            if "ICT" in block:
+                raise ValueError("rate limited")
+            return {"ministers": [{"name": "Minister of Defence", "number": "1",
+                                   "functions": [], "departments": ["Army"], "laws": []}]}
+
+    Processor("2153-12_E.pdf", checkpoint_dir=str(tmp_path), minimise=False).process_gazettes()
+
+    (journal,) = list_journals(str(tmp_path))
+    assert (journal["done"], journal["total"], journal["complete"]) == (1, 2, False)
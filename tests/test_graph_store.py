@@ -0,0 +1,229 @@
+import json
+import os
+
+os.environ.setdefault("NEO4J_URI", "bolt://localhost:7687")
+
+import pytest
+
+from doctracer.cli.load_graph import load_graph
+from doctracer.graph import MemoryGraphStore, Neo4jGraphStore
+
+BASE = {
+    "gazette_id": "2153/12", "published_date": "2019-12-10", "president": "GOTABAYA RAJAPAKSA",
+    "ministers": [
+        {"name": "Minister of Defence", "number": "01", "functions": ["1. Defence policy", "2. Civil security"],
+         "departments": ["1. Sri Lanka Army"], "laws": ["Army Act"]},
+        {"name": "Minister of ICT", "number": "12", "functions": ["8. Digital services"], "departments": [], "laws": []},
+    ],
+}
+
+AMENDMENT = {
+    "metadata": {"gazette_id": "2159/15", "published_date": "2020-01-22",
+                 "parent_gazette": {"gazette_id": "2153/12"}},
+    "changes": [
+        {"operation_type": "DELETION",
+         "details": {"number": "12", "name": "Minister of ICT", "column_no": "I", "deleted_sections": ["item 8"]}},
+        {"operation_type": "INSERTION",
+         "details": {"number": "1", "name": "Minister of Defence", "column_no": "I",
+                     "added_content": ["19. Promoting information technology"]}},
+    ],
+}
+
+
+def _loaded_store(tmp_path):
+    (tmp_path / "base").mkdir()
+    (tmp_path / "amendment").mkdir()
+    (tmp_path / "base" / "2153-12_E.json").write_text(json.dumps(BASE), encoding="utf-8")
+    (tmp_path / "amendment" / "2159-15_E.json").write_text(json.dumps(AMENDMENT), encoding="utf-8")
+    store = MemoryGraphStore()
+    results = load_graph(str(tmp_path / "base"), str(tmp_path / "amendment"), workers=2, store=store)
+    assert all(isinstance(r, dict) for r in results.values())
+    return store
+
+
+def test_loaders_run_against_the_memory_store(tmp_path):
+    store = _loaded_store(tmp_path)
+
+    structure = {m["number"]: m for m in store.base_structure("2153/12")}
+    assert structure["01"]["functions"] == ["Defence policy", "Civil security"]
+    assert structure["01"]["laws"] == ["Army Act"]
+    assert store.base_structure("9999/99") is None
+
+    rows = store.amendment_change_rows("2159/15")
+    assert {(r["node_name"], r["added_by"], r["removed_by"]) for r in rows} == {
+        ("Digital services", None, "2159/15"),
+        ("Promoting information technology", "2159/15", None),
+    }
+    (amendment,) = store.amendments()
+    assert amendment["change_count"] == 2
+    assert amendment["change_counts"]["functions"] == {"added": 1, "removed": 1, "updated": 0}
+    assert amendment["change_counts"]["laws"] == {"added": 0, "removed": 0, "updated": 0}
+    assert store.amendment_parent("2159/15") == "2153/12"
+
+
+def test_retracting_the_chain_restores_the_base(tmp_path):
+    store = _loaded_store(tmp_path)
+
+    stats = store.retract_amendments(["2153/12"], ["2159/15"])
+
+    assert stats["deleted"] == 3  # the amendment, its Minister and the created function
+    assert store.amendment_change_rows("2159/15") is None
+    assert not any("removed_by" in n.props or "is_active" in n.props for n in store.nodes)
+    assert store.retract_base("2153/12") == 7  # 2 ministers, 3 functions, 1 department, 1 law
+    assert store.counts() == {"BaseGazette": 1}
+
+
+def test_api_routes_serve_the_memory_store(tmp_path, monkeypatch):
+    from backend import api
+
+    monkeypatch.setattr(api, "store", _loaded_store(tmp_path))
+    monkeypatch.setattr(api, "response_cache", api.ResponseCache(lambda: api.store.data_version()))
+    client = api.app.test_client()
+
+    gazettes = client.get("/gazettes").get_json()
+    assert [g["gazette_id"] for g in gazettes] == ["2153/12", "2159/15"]
+    structure = client.get("/gazettes/2153%2F12/structure").get_json()
+    assert {m["name"] for m in structure["ministers"]} == {"Minister of Defence", "Minister of ICT"}
+    amendments = client.get("/amendments").get_json()
+    assert amendments[0]["has_detailed_changes"] is True
+
+
+def test_evolution_filters_and_pages_by_date(tmp_path, monkeypatch):
+    from backend import api
+
+    store = _loaded_store(tmp_path)
+    monkeypatch.setattr(api, "store", store)
+    client = api.app.test_client()
+
+    everything = client.get("/network/government-evolution").get_json()
+    assert [e["gazette"]["id"] for e in everything["evolution"]] == ["2153/12", "2159/15"]
+    defence = next(m for m in everything["evolution"][0]["structure"]["ministers"] if m["name"] == "Minister of Defence")
+    assert defence == {"name": "Minister of Defence", "departments": ["Sri Lanka Army"], "laws": ["Army Act"]}
+
+    page = client.get("/network/government-evolution?from=2020-01-01&limit=1").get_json()
+    assert [e["gazette"]["id"] for e in page["evolution"]] == ["2159/15"]
+    assert page["total_gazettes"] == 1
+    assert client.get("/network/government-evolution?offset=1&limit=1").get_json()["total_gazettes"] == 2
+    assert client.get("/network/government-evolution?to=2019-13-01").status_code == 400
+
+
+def test_loads_store_snapshots_and_writes_drop_them(tmp_path):
+    from doctracer.structure import snapshot_for
+
+    store = _loaded_store(tmp_path)
+
+    amendment = store.snapshot("2159/15")
+    assert amendment["base_gazette_id"] == "2153/12"
+    ict = next(m for m in amendment["structure"]["ministers"] if m["name"] == "Minister of ICT")
+    assert ict["functions"] == []
+    assert store.snapshot("2153/12")["changes"] is None
+
+    store.retract_amendments(["2153/12"], ["2159/15"])
+    assert store.snapshot("2153/12") is None and store.snapshot("2159/15") is None
+    # recomputed (and stored) on the next read
+    ict = next(m for m in snapshot_for(store, "2153/12")["structure"]["ministers"] if m["name"] == "Minister of ICT")
+    assert ict["functions"] == ["Digital services"]
+    assert store.snapshot("2153/12") is not None
+    assert store.write_snapshots([store.snapshot("2153/12")], version=store.data_version() - 1) == 0
+
+
+
+
+def test_failed_amendment_write_keeps_the_version_and_snapshots(tmp_path, monkeypatch):
+    store = _loaded_store(tmp_path)
+    version = store.data_version()
+
+    def fail(*args):
+        raise RuntimeError("write failed")
+
+    monkeypatch.setattr(store, "_write_amendment", fail)
+    with pytest.raises(RuntimeError):
+        store.write_amendment({}, "2159/15", "2153/12", "2020-01-22", [])
+
+    assert store.data_version() == version
+    assert store.snapshot("2159/15") is not None
+
+def test_compare_reads_snapshots_and_gazettes_from_the_store(tmp_path, monkeypatch):
+    from backend import api
+
+    store = _loaded_store(tmp_path)
+    monkeypatch.setattr(api, "store", store)
+    monkeypatch.setattr(api, "driver", None)  # no Cypher outside the store
+    monkeypatch.setattr(api, "response_cache", api.ResponseCache(store.data_version))
+
+    compare = api.app.test_client().get("/gazettes/2153%2F12/compare/2159%2F15").get_json()
+
+    assert compare["base_gazette"]["president"] == "GOTABAYA RAJAPAKSA"
+    assert compare["amendment_gazette"]["published_date"] == "2020-01-22"
+    assert [m["name"] for m in compare["changes"]["modified_ministers"]] == ["Minister of Defence", "Minister of ICT"]
+    assert compare["changes"]["removed_functions"] == ["Digital services"]
+
+class _Record(dict):
+    def data(self):
+        return dict(self)
+
+
+class _OneQueryDriver:
+    """Answers every statement with `rows`, counting round-trips."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.round_trips = 0
+
+    def session(self):
+        return self
+
+    def run(self, query, parameters=None, **params):
+        self.round_trips += 1
+        return self
+
+    def __iter__(self):
+        return iter([_Record(r) for r in self.rows])
+
+    def consume(self):
+        return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+def test_neo4j_base_structure_is_one_round_trip_grouped_by_minister_name():
+    ministers = [
+        {"name": "Minister of Defence", "number": "01", "departments": ["Army"], "laws": [], "functions": ["Policy"]},
+        {"name": "Minister of Defence", "number": "01", "departments": ["Army", "Navy"], "laws": ["Army Act"],
+         "functions": []},
+    ]
+    driver = _OneQueryDriver([{"ministers": ministers}])
+
+    assert Neo4jGraphStore(driver).base_structure("2153/12") == [{
+        "name": "Minister of Defence", "number": "01",
+        "departments": ["Army", "Navy"], "laws": ["Army Act"], "functions": ["Policy"],
+    }]
+    assert driver.round_trips == 1
+    assert Neo4jGraphStore(_OneQueryDriver([])).base_structure("9999/99") is None
+
+
+def test_search_finds_entities_by_prefix_and_typo(tmp_path, monkeypatch):
+    from backend import api
+    from doctracer.search import LiveSearchIndex
+
+    store = _loaded_store(tmp_path)
+    monkeypatch.setattr(api, "store", store)
+    monkeypatch.setattr(api, "search_index", LiveSearchIndex(lambda: api.store, version_ttl=0))
+    client = api.app.test_client()
+
+    (hit,) = client.get("/search?q=sri lanka arm").get_json()
+    assert hit["gazette_id"] == "2153/12" and hit["labels"] == ["BaseGazette"]
+    assert hit["matches"][0] == {"type": "department", "name": "Sri Lanka Army",
+                                 "minister_name": "Minister of Defence", "minister_number": "01"}
+
+    typo = client.get("/search?q=promotng informaton").get_json()
+    assert [h["gazette_id"] for h in typo] == ["2159/15"]
+    assert client.get("/search?q=2159/15&type=base").get_json() == []
+    assert [g["gazette_id"] for g in client.get("/search").get_json()] == ["2159/15", "2153/12"]
+
+    store.load_base({**BASE, "gazette_id": "2200/01", "published_date": "2020-11-01"})
+    assert {h["gazette_id"] for h in client.get("/search?q=army act").get_json()} == {"2153/12", "2200/01"}
@@ -0,0 +1,128 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from doctracer.ingest import IngestPipeline, PdfFetcher, load_dependencies, load_manifest, normalize_gazette_id
+
+PDF_BYTES = b"%PDF-1.4 stand-in"
+
+
+class _GazetteServer(BaseHTTPRequestHandler):
+    """Local stand-in for documents.gov.lk with ETag support."""
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        if self.path.startswith("/truncated/"):
+            # promise more than is sent, so the body fails part-way through
+            self.send_header("Content-Length", str(len(PDF_BYTES) * 2))
+            self.end_headers()
+            self.wfile.write(PDF_BYTES)
+            self.close_connection = True
+            return
+        self.send_header("Content-Length", str(len(PDF_BYTES)))
+        self.end_headers()
+        self.wfile.write(PDF_BYTES)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _GazetteServer.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _GazetteServer)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+def _write_manifest(tmp_path, base_url):
+    (tmp_path / "gazettes_v9.csv").write_text(
+        "gazette_id,date,url,name,description\n"
+        f"2289-43,2022-July-22,{base_url}/2022/7/2289-43_E.pdf,a,b\n"
+        f"2300-24,2022-October-5,{base_url}/2022/10/2300-24_E.pdf,a,b\n"
+        f"2297-78,2022-September-16,{base_url}/2022/9/2297-78_E.pdf,a,b\n"
+        "2412-08,2024-November-25,NA,a,b\n"
+    )
+    (tmp_path / "gazette_relationships_with_dates_v9.csv").write_text(
+        "parent_id,child_id,parent_date,child_date\n"
+        "2289-43,2300-24,2022-July-22,2022-October-5\n"
+        "2289-43,2297-78,2022-July-22,2022-September-16\n"
+    )
+    return str(tmp_path / "gazettes_v9.csv")
+
+
+def test_normalize_gazette_id():
+    assert normalize_gazette_id("2289-43") == "2289/43"
+    assert normalize_gazette_id("1905/4") == "1905/04"
+
+
+def test_manifest_classification_and_chain_order(tmp_path):
+    entries = {e.gazette_id: e for e in load_manifest(_write_manifest(tmp_path, "http://x"))}
+    assert entries["2289/43"].kind == "base"
+    assert entries["2412/08"].kind == "base"
+    assert entries["2412/08"].url is None
+    assert entries["2300/24"].kind == "amendment"
+    assert entries["2300/24"].parent_id == "2289/43"
+
+    deps = load_dependencies(list(entries.values()))
+    assert deps["2297/78"] == ["2289/43"]
+    assert deps["2300/24"] == ["2297/78"]
+
+
+def test_fetch_uses_conditional_get(tmp_path, server):
+    fetcher = PdfFetcher(str(tmp_path / "cache"))
+    first = fetcher.fetch("2289-43_E.pdf", f"{server}/2289-43_E.pdf")
+    second = fetcher.fetch("2289-43_E.pdf", f"{server}/2289-43_E.pdf")
+
+    assert first.status == "downloaded"
+    assert second.status == "not_modified"
+    assert second.path.read_bytes() == PDF_BYTES
+    assert _GazetteServer.requests_seen[-1][1] == '"v1"'
+
+
+def test_fetch_leaves_no_partial_file_when_the_download_breaks(tmp_path, server):
+    fetcher = PdfFetcher(str(tmp_path / "cache"))
+    result = fetcher.fetch("2289-43_E.pdf", f"{server}/truncated/2289-43_E.pdf")
+
+    assert result.status == "error"
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_pipeline_loads_parents_before_children(tmp_path, server):
+    entries = load_manifest(_write_manifest(tmp_path, server))
+    loaded = []
+    lock = threading.Lock()
+
+    def fake_extract(entry, pdf_path, checkpoint_dir):
+        return json.dumps({"metadata": {"gazette_id": entry.gazette_id}, "changes": []})
+
+    def fake_load(entry, json_path, parent_path):
+        with lock:
+            loaded.append(entry.gazette_id)
+
+    pipeline = IngestPipeline(
+        entries,
+        PdfFetcher(str(tmp_path / "cache")),
+        output_dir=str(tmp_path / "out"),
+        workers=4,
+        load=True,
+        extract_fn=fake_extract,
+        load_fn=fake_load,
+    )
+    summary = pipeline.run()
+
+    assert summary["extract"] == {"extracted": 3, "failed": 1}  # 2412/08 has no URL
+    assert loaded.index("2289/43") < loaded.index("2297/78") < loaded.index("2300/24")
+    amendment = json.loads((tmp_path / "out" / "amendment" / "2300-24_E.json").read_text())
+    assert amendment["metadata"]["parent_gazette"]["gazette_id"] == "2289/43"
@@ -0,0 +1,82 @@
+import sqlite3
+import time
+
+import pytest
+
+from doctracer.ingest.jobqueue import JobQueue, run_worker
+
+
+def test_claim_is_exclusive_and_completes(tmp_path):
+    q = JobQueue(str(tmp_path / "jobs.sqlite"))
+    assert q.submit("a.pdf", "extragazette_table", str(tmp_path / "out" / "a.json"))
+    assert not q.submit("a.pdf", "extragazette_table", str(tmp_path / "out" / "a.json"))
+
+    job = q.claim("w1")
+    assert job is not None
+    assert q.claim("w2") is None
+    assert q.complete(job.id, "w1")
+    assert q.counts() == {"done": 1}
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    q = JobQueue(str(tmp_path / "jobs.sqlite"), lease_seconds=0.05)
+    q.submit("a.pdf", "extragazette_table", str(tmp_path / "a.json"))
+
+    dead = q.claim("dead-worker")
+    time.sleep(0.1)
+    job = q.claim("w2")
+    assert job.id == dead.id
+    assert job.attempts == 2
+    assert not q.heartbeat(job.id, "dead-worker")
+    assert q.heartbeat(job.id, "w2")
+
+
+def test_worker_retries_then_fails(tmp_path):
+    q = JobQueue(str(tmp_path / "jobs.sqlite"), backoff_seconds=0)
+    q.submit("bad.pdf", "extragazette_table", str(tmp_path / "bad.json"), max_attempts=2)
+    q.submit("good.pdf", "extragazette_table", str(tmp_path / "good.json"))
+
+    def process(job):
+        if job.pdf_path.endswith("bad.pdf"):
+            raise RuntimeError("rate limited")
+        return '{"ok": true}'
+
+    stats = run_worker(q, worker_id="w", process=process)
+    assert stats == {"done": 1, "skipped": 0, "failed": 2, "lost": 0}
+    assert q.counts() == {"done": 1, "failed": 1}
+    assert (tmp_path / "good.json").read_text() == '{"ok": true}'
+    assert q.failures()[0]["last_error"] == "RuntimeError: rate limited"
+
+
+def test_requeued_job_that_loses_its_lease_reports_lease_expired(tmp_path):
+    q = JobQueue(str(tmp_path / "jobs.sqlite"), lease_seconds=0.05, backoff_seconds=0)
+    q.submit("a.pdf", "extragazette_table", str(tmp_path / "a.json"), max_attempts=1)
+    job = q.claim("w1")
+    q.fail(job.id, "w1", "RuntimeError: rate limited")
+    assert q.requeue_failed() == 1
+
+    q.claim("dead-worker")
+    time.sleep(0.1)
+    assert q.claim("w2") is None
+    assert q.failures()[0]["last_error"] == "lease expired"
+
+
+def test_locked_database_raises_the_lock_error(tmp_path, monkeypatch):
+    q = JobQueue(str(tmp_path / "jobs.sqlite"))
+    connect = q._connect
+
+    def impatient_connect():
+        conn = connect()
+        conn.execute("PRAGMA busy_timeout=0")
+        return conn
+
+    monkeypatch.setattr(q, "_connect", impatient_connect)
+    holder = sqlite3.connect(q.path, isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+    try:
+        # BEGIN IMMEDIATE fails, so there is no transaction to roll back
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            q.submit("a.pdf", "extragazette_table", str(tmp_path / "a.json"))
+    finally:
+        holder.execute("ROLLBACK")
+        holder.close()
@@ -0,0 +1,36 @@
+from doctracer.extract.language import LanguageRouter, detect_language, filename_language
+
+ENGLISH = """The Gazette of the Democratic Socialist Republic of Sri Lanka EXTRAORDINARY
+No. 2289/43 - FRIDAY, JULY 22, 2022 (Published by Authority) PART I : SECTION (I) - GENERAL
+It is now hereby notified that the subjects and functions and Departments in the charge of
+various Ministers shall be as set out in the schedule given below, from the date of this Notification."""
+
+# Sinhala edition rendered from a legacy (non-Unicode) font
+LEGACY = """Y%S ,xld m%cd;dka;%sl iudcjd§ ckrcfha .eiÜ m;%h w;s úfYI wxl 2289$43 - 2022 cQ,s ui 22
+jeks isl=rdod ks,Odßka fj; mejrS we;s n,;, wkqj wdKavql%u jHjia:dfõ 44 jk jHjia:dfõ
+wud;H uKav,fha wud;Hjrekaf.a ixLHdj iy wud;HdxY úIh lafIa;% yd ld¾hhka fomd¾;fïka;="""
+
+
+def test_detects_english_unicode_and_legacy_editions():
+    assert detect_language(ENGLISH, "2289-43_E.pdf") == "en"
+    assert detect_language("ශ්‍රී ලංකා ප්‍රජාතාන්ත්‍රික සමාජවාදී ජනරජයේ ගැසට් පත්‍රය") == "si"
+    assert detect_language("இலங்கை சனநாயக சோசலிசக் குடியரசு வர்த்தமானிப் பத்திரிகை") == "ta"
+    assert detect_language(LEGACY, "2289-43_S.pdf") == "si"
+    assert detect_language(LEGACY, "2303-17_T.pdf") == "ta"
+    assert detect_language(LEGACY) == "unknown"
+    assert detect_language("", "2303-17_T.pdf") == "ta"
+
+
+def test_filename_language():
+    assert filename_language("data/2303-17_T.pdf") == "ta"
+    assert filename_language("simple.pdf") is None
+
+
+def test_router_reports_counts_and_savings():
+    router = LanguageRouter(["en"])
+    assert router.route("data/testdata/base/ranil/2289-43_E.pdf").process
+    router.record_processing(30.0)
+
+    report = router.report()
+    assert report["languages"] == {"en": {"processed": 1, "skipped": 0}}
+    assert report["skipped"] == 0
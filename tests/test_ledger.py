@@ -0,0 +1,98 @@
+import json
+
+from doctracer.cli.ledger import LoadLedger
+from doctracer.cli.load_graph import load_graph
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _amendment(gazette_id, parent_id, published_date, changes=()):
+    return {"metadata": {"gazette_id": gazette_id, "published_date": published_date,
+                         "parent_gazette": {"gazette_id": parent_id}}, "changes": list(changes)}
+
+
+def _tree(tmp_path):
+    _write(tmp_path / "base" / "2153-12_E.json", {"gazette_id": "2153/12", "published_date": "2019-12-10"})
+    _write(tmp_path / "base" / "2289-43_E.json", {"gazette_id": "2289-43", "published_date": "2022-07-22"})
+    _write(tmp_path / "amendment" / "1.json", _amendment("2159/15", "2153/12", "2020-01-22"))
+    _write(tmp_path / "amendment" / "2.json", _amendment("2167/06", "2153/12", "2020-03-10"))
+    _write(tmp_path / "amendment" / "3.json", _amendment("2297/78", "2289-43", "2022-09-01"))
+    return tmp_path / "base", tmp_path / "amendment"
+
+
+class _Recorder:
+    def __init__(self, base_dir, amendment_dir, ledger):
+        self.dirs = (str(base_dir), str(amendment_dir))
+        self.ledger = ledger
+
+    def run(self):
+        self.loaded, self.retracted = [], []
+        results = load_graph(
+            *self.dirs, workers=2, ledger=self.ledger,
+            base_loader=lambda path: self.loaded.append(path.split("/")[-1]),
+            amendment_loader=lambda path, base: self.loaded.append(path.split("/")[-1]),
+            retract_base=lambda gazette_id: self.retracted.append(("base", gazette_id)),
+            retract_chain=lambda parents, ids: self.retracted.append(("chain", tuple(parents), tuple(sorted(ids)))),
+            refresh_snapshots=lambda base_ids: [],
+        )
+        assert not [r for r in results.values() if isinstance(r, Exception)]
+        return sorted(self.loaded)
+
+
+def test_unchanged_files_are_skipped(tmp_path):
+    base_dir, amendment_dir = _tree(tmp_path)
+    loader = _Recorder(base_dir, amendment_dir, LoadLedger(str(tmp_path / "ledger.sqlite")))
+
+    assert len(loader.run()) == 5
+    assert loader.run() == []
+    assert loader.retracted == []
+
+
+def test_appended_amendment_is_applied_without_retraction(tmp_path):
+    base_dir, amendment_dir = _tree(tmp_path)
+    loader = _Recorder(base_dir, amendment_dir, LoadLedger(str(tmp_path / "ledger.sqlite")))
+    loader.run()
+
+    _write(amendment_dir / "4.json", _amendment("2170/10", "2153/12", "2020-04-01"))
+
+    assert loader.run() == ["4.json"]
+    assert loader.retracted == []
+
+
+def test_edited_amendment_replays_its_chain_only(tmp_path):
+    base_dir, amendment_dir = _tree(tmp_path)
+    loader = _Recorder(base_dir, amendment_dir, LoadLedger(str(tmp_path / "ledger.sqlite")))
+    loader.run()
+
+    _write(amendment_dir / "1.json", _amendment("2159/15", "2153/12", "2020-01-22", [{"x": 1}]))
+
+    assert loader.run() == ["1.json", "2.json"]
+    assert loader.retracted == [("chain", ("2153/12",), ("2159/15", "2167/06"))]
+
+
+def test_changed_base_retracts_base_and_chain_with_graph_ids(tmp_path):
+    base_dir, amendment_dir = _tree(tmp_path)
+    loader = _Recorder(base_dir, amendment_dir, LoadLedger(str(tmp_path / "ledger.sqlite")))
+    loader.run()
+
+    _write(base_dir / "2289-43_E.json", {"gazette_id": "2289-43", "published_date": "2022-07-23"})
+
+    assert loader.run() == ["2289-43_E.json", "3.json"]
+    # ids as the loaders wrote them, not the normalised ledger keys
+    assert loader.retracted == [("chain", ("2289-43",), ("2297/78",)), ("base", "2289-43")]
+
+
+def test_removed_amendment_is_retracted(tmp_path):
+    base_dir, amendment_dir = _tree(tmp_path)
+    ledger = LoadLedger(str(tmp_path / "ledger.sqlite"))
+    loader = _Recorder(base_dir, amendment_dir, ledger)
+    loader.run()
+
+    (amendment_dir / "2.json").unlink()
+
+    assert loader.run() == ["1.json"]
+    assert loader.retracted == [("chain", ("2153/12",), ("2159/15", "2167/06"))]
+    assert "2167/06" not in ledger.entries()
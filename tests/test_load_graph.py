@@ -0,0 +1,81 @@
+import json
+import threading
+import time
+
+from doctracer.cli.load_graph import load_graph, scan_gazette_json
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _amendment(gazette_id, parent_id, published_date):
+    return {"metadata": {"gazette_id": gazette_id, "published_date": published_date,
+                         "parent_gazette": {"gazette_id": parent_id}}, "changes": []}
+
+
+def _tree(tmp_path):
+    _write(tmp_path / "base" / "a" / "2153-12_E.json", {"gazette_id": "2153/12", "published_date": "2019-12-10"})
+    _write(tmp_path / "base" / "b" / "2289-43_E.json", {"gazette_id": "2289/43", "published_date": "2022-07-22"})
+    # file names deliberately out of date order
+    _write(tmp_path / "amendment" / "a" / "1.json", _amendment("2167/06", "2153/12", "2020-03-10"))
+    _write(tmp_path / "amendment" / "a" / "2.json", _amendment("2159-15", "2153-12", "2020-01-22"))
+    _write(tmp_path / "amendment" / "b" / "3.json", _amendment("2297/78", "2289/43", "2022-09-01"))
+    return tmp_path / "base", tmp_path / "amendment"
+
+
+def test_scan_normalises_ids_and_links_parents(tmp_path, capsys):
+    base_dir, amendment_dir = _tree(tmp_path)
+    _write(base_dir / ".gazette_index.json", {"version": 1, "entries": {}})
+
+    entries, paths = scan_gazette_json(str(base_dir), str(amendment_dir))
+
+    assert ".gazette_index.json" not in capsys.readouterr().out
+    assert len(entries) == 5
+
+    kinds = {e.gazette_id: (e.kind, e.parent_id) for e in entries}
+    assert kinds["2159/15"] == ("amendment", "2153/12")
+    assert kinds["2289/43"] == ("base", None)
+    assert paths["2167/06"].endswith("1.json")
+
+
+def test_chains_load_in_date_order_after_their_base(tmp_path):
+    base_dir, amendment_dir = _tree(tmp_path)
+    order, lock = [], threading.Lock()
+
+    def _record(name):
+        time.sleep(0.01)
+        with lock:
+            order.append(name)
+        return name
+
+    results = load_graph(
+        str(base_dir), str(amendment_dir), workers=4,
+        base_loader=lambda path: _record(path.split("/")[-1]),
+        amendment_loader=lambda path, base: _record(f"{path.split('/')[-1]}<{base.split('/')[-1]}"),
+        refresh_snapshots=lambda base_ids: [],
+    )
+
+    assert len(results) == 5
+    assert order.index("2153-12_E.json") < order.index("2.json<2153-12_E.json") < order.index("1.json<2153-12_E.json")
+    assert order.index("2289-43_E.json") < order.index("3.json<2289-43_E.json")
+
+
+def test_failed_amendment_skips_the_rest_of_its_chain(tmp_path):
+    base_dir, amendment_dir = _tree(tmp_path)
+
+    def _amend(path, base):
+        if path.endswith("2.json"):
+            raise RuntimeError("boom")
+        return path
+
+    refreshed = []
+    results = load_graph(str(base_dir), str(amendment_dir), base_loader=lambda p: p, amendment_loader=_amend,
+                         refresh_snapshots=lambda base_ids: refreshed.extend(base_ids) or [])
+
+    assert isinstance(results["2159/15"], RuntimeError)
+    assert type(results["2167/06"]).__name__ == "DependencyFailed"
+    assert results["2297/78"].endswith("3.json")
+    # bases of every chain with a successful load, by the ids written to the graph
+    assert refreshed == ["2153/12", "2289/43"]
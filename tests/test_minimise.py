@@ -0,0 +1,96 @@
+import html
+import re
+from pathlib import Path
+
+from doctracer.extract.minimise import minimise_text
+from doctracer.extract.gazette.extragazetteamendment import split_amendment_blocks
+
+DOCLING_DIR = Path(__file__).resolve().parent.parent / "docling_txt"
+
+PAGE = """PART I : SEC. (I) - GAZETTE EXTRAORDINARY OF THE DEMOCRATIC SOCIALIST REPUBLIC OF SRI LANKA - 22.07.2022
+
+{page}A
+
+## SCHEDULE (Contd.)
+
+Column II
+
+- All other legislations relevant to the subjects of the Ministry
+- Pre&amp;school Education Act
+"""
+
+
+def test_drops_repeated_page_furniture_but_keeps_content():
+    text = "\n".join(PAGE.format(page=n) for n in range(3, 8))
+    text += "\nThe imple-\nmentation of   policies  \n\n\n\n| Col   | Name    |\n|--------|---------|\n"
+
+    minimised, stats = minimise_text(text)
+
+    assert minimised.count("## SCHEDULE (Contd.)") == 1
+    assert minimised.count("GAZETTE EXTRAORDINARY OF THE DEMOCRATIC") == 1
+    assert not re.search(r"^\dA$", minimised, re.MULTILINE)
+    # list items and column headings are structure, never de-duplicated
+    assert minimised.count("- All other legislations relevant") == 5
+    assert minimised.count("Column II") == 5
+    assert "Pre&school" in minimised
+    assert "The imple-mentation of policies\n" in minimised
+    assert "| Col | Name |\n|---|---|" in minimised
+    assert "\n\n\n" not in minimised
+    assert stats["tokens_after"] < stats["tokens_before"]
+    assert stats["lines_dropped"]["repeated"] == 8
+
+
+def test_content_repeats_away_from_page_breaks_are_kept():
+    text = "\n\n".join(["Sri Lanka Army Act No. 17 of 1949", "Sri Lanka Army Act No. 18 of 1949",
+                          "Sri Lanka Army Act No. 19 of 1949", "Urban Development Authority"] * 3)
+
+    minimised, stats = minimise_text(text)
+
+    assert minimised == text
+    assert stats["lines_dropped"]["repeated"] == 0
+
+
+def test_line_broken_hyphens_are_kept():
+    minimised, _ = minimise_text("a well-\nknown self-\n  governing body")
+
+    assert minimised == "a well-known self-governing body"
+
+
+def test_bare_numbers_are_page_numbers_only_at_page_breaks():
+    minimised, stats = minimise_text("1\n\nSri Lanka Army\n\n2\n\nNavy\n\nPage 4")
+
+    assert minimised == "1\n\nSri Lanka Army\n\n2\n\nNavy"
+    assert stats["lines_dropped"]["page_number"] == 1
+
+
+_MINISTER = re.compile(r"^##\s*\(\d+\)\s*Minister[^\n]*", re.MULTILINE)
+_COLUMN_HEADING = re.compile(
+    r"duties\s*(?:&|and)\s*functions|departments\s*,\s*statutory\s*institutions"
+    r"|laws?\s*(?:(?:&|and)\s*ordinances?\s*)?to\s*be\s*implemented",
+    re.IGNORECASE,
+)
+
+
+def _words(line):
+    return " ".join(line.split())
+
+
+def _headings_per_minister(text):
+    """Column-heading lines under each minister heading, in order."""
+    starts = [m.start() for m in _MINISTER.finditer(text)] + [len(text)]
+    return [
+        (_MINISTER.match(text, start).group().strip(),
+         [line.strip() for line in text[start:end].splitlines() if _COLUMN_HEADING.search(line)])
+        for start, end in zip(starts, starts[1:])
+    ]
+
+
+def test_every_ministers_column_headings_survive_on_sample_gazettes():
+    for path in sorted(DOCLING_DIR.glob("*.txt")):
+        text = path.read_text(encoding="utf-8")
+        minimised, _ = minimise_text(text)
+        before = _headings_per_minister(html.unescape(text))
+        after = _headings_per_minister(minimised)
+        assert [(_words(m), [_words(h) for h in hs]) for m, hs in after] == \
+            [(_words(m), [_words(h) for h in hs]) for m, hs in before], path.name
+        assert len(split_amendment_blocks(minimised)) == len(split_amendment_blocks(text)), path.name
@@ -0,0 +1,20 @@
+from doctracer.neo4j_schema import SCHEMA
+
+
+def test_schema_covers_loader_merge_keys():
+    keys = {(item.kind, item.label, item.properties) for item in SCHEMA}
+
+    assert ("unique", "BaseGazette", ("gazette_id",)) in keys
+    assert ("unique", "Minister", ("number", "gazette_id")) in keys
+    assert ("range", "Department", ("item_number", "minister_number", "gazette_id")) in keys
+    assert ("range", "Law", ("removed_by",)) in keys
+    assert len({item.name for item in SCHEMA}) == len(SCHEMA)
+
+
+def test_create_statements_are_idempotent():
+    minister = next(item for item in SCHEMA if item.name == "minister_key")
+
+    assert minister.create_statement == (
+        "CREATE CONSTRAINT minister_key IF NOT EXISTS FOR (n:Minister) REQUIRE (n.number, n.gazette_id) IS UNIQUE"
+    )
+    assert all("IF NOT EXISTS" in item.create_statement for item in SCHEMA)
@@ -0,0 +1,57 @@
+import logging
+
+from doctracer.query_stats import QueryStats, format_report, timed_run
+
+
+class _Counters:
+    nodes_created = 3
+    properties_set = 6
+    relationships_created = 0
+
+
+class _Summary:
+    counters = _Counters()
+    result_available_after = 4
+    result_consumed_after = 1
+
+
+class _FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    def run(self, query, parameters=None):
+        self.calls.append((query, parameters))
+        return self
+
+    def __iter__(self):
+        return iter([{"n": 1}, {"n": 2}])
+
+    def consume(self):
+        return _Summary()
+
+
+def test_timed_run_records_rows_counters_and_server_time():
+    stats = QueryStats(slow_query_ms=10_000)
+    session = _FakeSession()
+
+    result = timed_run(session, "items", "UNWIND $rows AS r CREATE (:X)", {"rows": [1]}, stats=stats, query="q")
+
+    assert session.calls == [("UNWIND $rows AS r CREATE (:X)", {"rows": [1], "query": "q"})]
+    assert result.single() == {"n": 1} and len(result) == 2
+    (row,) = stats.report()
+    assert row["name"] == "items" and row["count"] == 1 and row["rows"] == 2
+    assert row["counters"] == {"nodes_created": 3, "properties_set": 6}
+    assert row["server_p50_ms"] == 5.0
+    assert "items" in format_report(stats.report())
+
+
+def test_percentiles_and_slow_query_log(caplog):
+    stats = QueryStats(slow_query_ms=90)
+    with caplog.at_level(logging.WARNING, logger="doctracer.slow_query"):
+        for ms in range(1, 101):
+            stats.record("lookup", float(ms), query="MATCH (n)\n  RETURN n")
+
+    (row,) = stats.report()
+    assert (row["p50_ms"], row["p95_ms"], row["p99_ms"]) == (51.0, 95.0, 99.0)
+    assert len(caplog.records) == 11
+    assert "MATCH (n) RETURN n" in caplog.records[0].getMessage()
@@ -0,0 +1,49 @@
+import os
+
+os.environ.setdefault("NEO4J_URI", "bolt://localhost:7687")
+
+from doctracer.response_cache import ResponseCache
+from test_graph_store import BASE, _loaded_store
+
+
+def test_lru_evicts_least_recently_used_and_counts_hits():
+    cache = ResponseCache(lambda: 1, max_entries=2, version_ttl=0)
+
+    assert cache.get("a", lambda: "A") == "A"
+    assert cache.get("b", lambda: "B") == "B"
+    assert cache.get("a", lambda: "stale") == "A"  # hit, and now most recently used
+    cache.get("c", lambda: "C")  # evicts b
+
+    assert cache.get("b", lambda: "B2") == "B2"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 4, 2)
+    assert stats["entries"] == 2
+
+
+def test_version_bump_invalidates_entries():
+    version = [1]
+    cache = ResponseCache(lambda: version[0], version_ttl=0)
+    cache.get("k", lambda: "old")
+
+    version[0] = 2
+    assert cache.get("k", lambda: "new") == "new"
+    assert cache.stats()["stale"] == 1
+    assert cache.get("k", lambda: "unused") == "new"
+
+
+def test_api_serves_cached_listing_until_a_load_commits(tmp_path, monkeypatch):
+    from backend import api
+
+    store = _loaded_store(tmp_path)
+    monkeypatch.setattr(api, "store", store)
+    monkeypatch.setattr(api, "response_cache", ResponseCache(store.data_version, version_ttl=0))
+    client = api.app.test_client()
+
+    first = client.get("/gazettes").get_json()
+    assert client.get("/gazettes").get_json() == first
+    assert client.get("/debug/cache").get_json()["hits"] == 1
+
+    store.load_base({**BASE, "gazette_id": "2200/01", "published_date": "2020-11-01"})
+    ids = [g["gazette_id"] for g in client.get("/gazettes").get_json()]
+    assert ids == ["2153/12", "2159/15", "2200/01"]
+    assert client.get("/debug/cache").get_json()["stale"] == 1
@@ -0,0 +1,56 @@
+from doctracer.structure import diff_structures, simulate_final_structure
+
+BASE = {
+    'ministers': [
+        {'name': 'Minister of Defence', 'number': '1', 'functions': ['Defence policy', 'Civil security'],
+         'departments': ['Sri Lanka Army'], 'laws': ['Army Act']},
+        {'name': 'Minister of ICT', 'number': '12', 'functions': ['Digital services'], 'departments': [], 'laws': []},
+    ],
+    'departments': ['Sri Lanka Army'], 'laws': ['Army Act'], 'functions': ['Defence policy', 'Civil security', 'Digital services'],
+}
+
+
+def _change(op, name, column, added=(), deleted=()):
+    return {'operation_type': op, 'details': {'name': name, 'column_no': column, 'added_content': list(added),
+                                               'deleted_sections': list(deleted)}}
+
+
+def test_changes_apply_in_order_without_touching_the_base():
+    final = simulate_final_structure(BASE, [
+        _change('INSERTION', 'Minister of Defence', '1', added=['Civil security', 'Cyber defence']),
+        _change('DELETION', 'Minister of ICT', '1', deleted=['Digital services']),
+        _change('UPDATE', 'Minister of Defence', '2', added=['Sri Lanka Navy'], deleted=['Sri Lanka Army']),
+        _change('UPDATE', 'Minister of Defence', '3', added=['Navy Act', 'Air Force Act'], deleted=['Army Act']),
+        _change('INSERTION', 'Minister of Health', '1', added=['Hospitals']),  # not in the base: skipped
+    ])
+
+    defence, ict = final['ministers']
+    assert defence['functions'] == ['Defence policy', 'Civil security', 'Cyber defence']
+    assert defence['departments'] == ['Sri Lanka Navy']  # same count: substitution
+    assert defence['laws'] == ['Navy Act', 'Air Force Act']
+    assert ict['functions'] == []
+    assert sorted(final['departments']) == ['Sri Lanka Navy']
+    assert BASE['ministers'][0]['departments'] == ['Sri Lanka Army']
+
+
+def test_diff_reports_modified_ministers_with_flattened_fields():
+    final = simulate_final_structure(BASE, [_change('DELETION', 'Minister of ICT', '1', deleted=['Digital services'])])
+
+    diff = diff_structures(BASE, final)
+
+    assert diff['added_ministers'] == [] and diff['removed_ministers'] == []
+    (ict,) = diff['modified_ministers']
+    assert ict['functions_removed'] == ['Digital services'] and ict['functions_added'] == []
+    assert ict['changes'] == [{'type': 'functions', 'added': [], 'removed': ['Digital services']}]
+
+
+def test_large_reshuffle_keeps_order_and_removes_every_deleted_item():
+    items = [f'Function {i}' for i in range(20000)]
+    base = {'ministers': [{'name': 'M', 'number': '1', 'functions': items, 'departments': [], 'laws': []}]}
+
+    final = simulate_final_structure(base, [
+        _change('DELETION', 'M', '1', deleted=items[::2]),
+        _change('INSERTION', 'M', '1', added=items + ['New function']),
+    ])
+
+    assert final['ministers'][0]['functions'] == items[1::2] + items[::2] + ['New function']
@@ -0,0 +1,48 @@
+import json
+import os
+
+os.environ.setdefault("NEO4J_URI", "bolt://localhost:7687")
+
+from doctracer.cli import table_to_neo4j  # noqa: E402
+
+GAZETTE = {
+    "gazette_id": "2289/43",
+    "published_date": "2022-07-22",
+    "ministers": [
+        {
+            "name": "Minister of Defence",
+            "number": "01",
+            "functions": ["1. Formulation of policies", "Supervision of the Ministry"],
+            "departments": ["1. Sri Lanka Army", "2. Sri Lanka Navy"],
+            "laws": ["Army Act No. 17 of 1949", "  "],
+        },
+        {"name": "Unnumbered Minister", "functions": ["1. Ignored"]},
+    ],
+}
+
+
+def test_build_table_rows_splits_columns():
+    rows = table_to_neo4j.build_table_rows(GAZETTE)
+
+    assert rows["ministers"] == [{"minister_number": "01", "minister_name": "Minister of Defence"}]
+    assert rows["functions_numbered"] == [
+        {"minister_number": "01", "item_number": "1", "item_name": "Formulation of policies"}
+    ]
+    assert rows["functions_named"] == [{"minister_number": "01", "item_name": "Supervision of the Ministry"}]
+    assert [r["item_number"] for r in rows["departments_numbered"]] == ["1", "2"]
+    assert rows["departments_named"] == []
+    assert rows["laws"] == [{"minister_number": "01", "law_name": "Army Act No. 17 of 1949"}]
+
+
+def test_load_batches_rows_in_one_managed_transaction(tmp_path, monkeypatch, fake_driver):
+    path = tmp_path / "base.json"
+    path.write_text(json.dumps(GAZETTE), encoding="utf-8")
+    monkeypatch.setattr(table_to_neo4j, "driver", fake_driver)
+
+    stats = table_to_neo4j.load_table_data(str(path), batch_size=1)
+
+    # gazette + 1 minister + 1+1 functions + 2 departments (batch_size=1) + 1 law, then commit,
+    # then the data-version bump in its own transaction
+    assert len(fake_driver.calls) == 8
+    assert stats["round_trips"] == 8
+    assert stats["rows"] == 7